@@ -0,0 +1,33 @@
+"""slot capacity ledger
+
+10분 슬롯 단위의 잔여 예약 가능 인원 ledger
+기존 DB 의 ledger row 는 예약 확정/취소 시 확정된 예약 인원을 집계해 생성되므로, 빈 테이블로 시작합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-05-20 00:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "slot_capacity",
+        sa.Column("slot_start", sa.DateTime(), nullable=False),
+        sa.Column("remaining", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("slot_start"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("slot_capacity")
@@ -0,0 +1,40 @@
+"""reservation period
+
+예약 구간 [start_time, end_time) 을 저장하는 tsrange 생성 컬럼과 구간 겹침(&&) 조회용 GiST 인덱스
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-05-20 00:00:02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "reservations",
+        sa.Column(
+            "period",
+            postgresql.TSRANGE(),
+            sa.Computed("tsrange(start_time, end_time, '[)')", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_reservations_period", "reservations", ["period"], postgresql_using="gist"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reservations_period", table_name="reservations")
+    op.drop_column("reservations", "period")
@@ -0,0 +1,30 @@
+"""reservation version
+
+낙관적 lock 을 위한 예약 version 컬럼, 기존 예약은 1 로 시작합니다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-05-20 00:00:03
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "reservations",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("reservations", "version")
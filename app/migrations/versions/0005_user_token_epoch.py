@@ -0,0 +1,30 @@
+"""user token epoch
+
+발급된 토큰을 폐기하기 위한 사용자별 token epoch 컬럼, 기존 사용자는 0 으로 시작합니다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-05-20 00:00:04
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("token_epoch", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "token_epoch")
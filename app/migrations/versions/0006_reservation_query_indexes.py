@@ -0,0 +1,49 @@
+"""reservation query indexes
+
+예약 목록(cursor) 조회에 사용하는 복합 인덱스
+(상태별 기간 조회는 0003 의 period GiST 인덱스를 사용합니다)
+운영 중인 테이블의 쓰기를 막지 않도록 CREATE INDEX CONCURRENTLY 로 생성합니다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-05-20 00:00:05
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_reservations_start_time_id": ["start_time", "id"],
+    "ix_reservations_user_id_start_time_id": ["user_id", "start_time", "id"],
+}
+
+
+def upgrade() -> None:
+    # CONCURRENTLY 는 트랜잭션 안에서 실행할 수 없다
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(
+                name,
+                "reservations",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(
+                name,
+                table_name="reservations",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
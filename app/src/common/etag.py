@@ -0,0 +1,32 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+ETAG_HEADER = "ETag"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    응답 내용을 결정하는 값들로 strong ETag 를 생성하는 함수
+    """
+    digest = hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def matches(request: Request, etag: str) -> bool:
+    """
+    If-None-Match header 에 etag 가 포함되어 있는지 확인하는 함수
+    If-None-Match 는 weak 비교를 사용하므로 W/ 접두사는 무시한다.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag}
+    )
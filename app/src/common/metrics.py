@@ -0,0 +1,76 @@
+import threading
+from collections import defaultdict
+from typing import Dict, List
+
+
+class CounterRegistry:
+    """
+    프로세스 내 카운터를 이름과 label(라우트 등) 별로 누적하는 클래스
+    여러 worker thread 에서 동시에 증가시킬 수 있도록 lock 으로 보호합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+
+    def increment(self, name: str, label: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name][label] += amount
+
+    def get(self, name: str, label: str) -> int:
+        with self._lock:
+            return self._counters.get(name, {}).get(label, 0)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {name: dict(labels) for name, labels in self._counters.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+class TimingRegistry:
+    """
+    프로세스 내 소요 시간을 이름과 label(결과 등) 별로 누적하는 클래스
+    호출 횟수, 평균, 최대 소요 시간(ms)을 제공합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings: Dict[str, Dict[str, List[float]]] = defaultdict(dict)
+
+    def record(self, name: str, label: str, seconds: float) -> None:
+        with self._lock:
+            # [횟수, 합계, 최대]
+            timing = self._timings[name].setdefault(label, [0, 0.0, 0.0])
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+
+    def get(self, name: str, label: str) -> Dict[str, float | int]:
+        with self._lock:
+            count, total, maximum = self._timings.get(name, {}).get(label, [0, 0.0, 0.0])
+        return {
+            "count": count,
+            "ms_avg": total / count * 1000 if count else 0.0,
+            "ms_max": maximum * 1000,
+        }
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float | int]]]:
+        with self._lock:
+            names = {name: list(labels) for name, labels in self._timings.items()}
+        return {
+            name: {label: self.get(name, label) for label in labels}
+            for name, labels in names.items()
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._timings.clear()
+
+
+counters = CounterRegistry()
+timings = TimingRegistry()
@@ -0,0 +1,10 @@
+import random
+
+
+def backoff_delay(attempt: int, base_ms: int, max_ms: int) -> float:
+    """
+    재시도 횟수(attempt, 0부터 시작)에 따른 대기 시간(초)을 반환하는 함수
+    지수적으로 증가하는 상한(base * 2^attempt, 최대 max) 안에서 무작위로 대기해, 재시도가 다시 충돌하지 않도록 분산한다.
+    """
+    ceiling = min(max_ms, base_ms * (2**attempt))
+    return random.uniform(0, ceiling) / 1000
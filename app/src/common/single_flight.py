@@ -0,0 +1,44 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+from app.src.common import metrics
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    같은 key 로 동시에 들어온 요청이 하나의 실행 결과를 공유하도록 하는 클래스
+
+    - key 별로 처음 들어온 요청만 실행하고, 실행이 끝나기 전에 들어온 요청은 같은 결과(또는 예외)를 기다림
+    - 실행이 끝나면 key 를 제거하므로 결과를 캐시하지 않음
+    - 요청이 취소되어도 실행은 취소하지 않아, 기다리던 다른 요청은 결과를 받을 수 있음
+    - 이벤트 루프 안에서만 사용하므로 lock 이 필요하지 않음
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        call = self._calls.get(key)
+        if call is not None:
+            metrics.counters.increment("single_flight.coalesced", self.name)
+            return await asyncio.shield(call)
+
+        metrics.counters.increment("single_flight.executed", self.name)
+        call = asyncio.ensure_future(func())
+        self._calls[key] = call
+        call.add_done_callback(lambda done: self._done(key, done))
+        return await asyncio.shield(call)
+
+    def _done(self, key: Hashable, call: asyncio.Future) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # 기다리는 요청이 모두 취소된 경우에도 예외가 처리되지 않았다는 경고를 남기지 않는다
+        if not call.cancelled():
+            call.exception()
@@ -1,5 +1,7 @@
 from pydantic import BaseModel
 
+from app.src.user.model import Role
+
 
 class Token(BaseModel):
     access_token: str
@@ -7,4 +9,18 @@ class Token(BaseModel):
 
 
 class TokenData(BaseModel):
+    user_id: int
+    email: str
+    role: Role
+    epoch: int
+
+
+class Principal(BaseModel):
+    """
+    토큰의 claim 으로 만든 인증된 사용자 정보
+    요청마다 users 테이블을 조회하지 않도록 엔드포인트에는 User 모델 대신 전달됩니다.
+    """
+
+    id: int
     email: str
+    role: Role
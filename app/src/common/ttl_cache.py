@@ -0,0 +1,48 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    항목마다 만료 시각(epoch 초)을 가지는 크기 제한 LRU 캐시
+    가득 차면 가장 오래 사용하지 않은 항목부터 제거하고, 만료된 항목은 조회 시 제거합니다.
+    여러 worker thread 에서 동시에 사용할 수 있도록 lock 으로 보호합니다.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[Hashable, Tuple[V, float]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> V | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= time.time():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: V, expires_at: float) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._items[key] = (value, expires_at)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
@@ -1,19 +1,415 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Type, TypeVar
 from fastapi import Request
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, String, cast, create_engine, event, func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+from sqlalchemy.util import await_only
+from starlette.concurrency import run_in_threadpool
+
+from app.src.config import settings
+from app.src.config.pool import PoolStats, instrumented_pool_class
+from app.src.config.replica import (
+    ReplicaLagMonitor,
+    is_replica_route,
+    requires_primary,
+)
 
 # PostgreSQL 데이터베이스 URL 설정
-SQLALCHEMY_DATABASE_URI = "postgresql://postgres:postgres@db:5432/reservation"
+SQLALCHEMY_DATABASE_URI = settings.DATABASE_URL
+ASYNC_SQLALCHEMY_DATABASE_URI = settings.ASYNC_DATABASE_URL
+
+# engine 별 connection pool checkout 통계
+pool_stats = {
+    "sync": PoolStats(),
+    "async": PoolStats(),
+    "replica": PoolStats(),
+    "async_replica": PoolStats(),
+}
+
+
+def _session_timeouts() -> Dict[str, str]:
+    timeouts = {}
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        timeouts["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+    if settings.DB_LOCK_TIMEOUT_MS > 0:
+        timeouts["lock_timeout"] = str(settings.DB_LOCK_TIMEOUT_MS)
+    return timeouts
+
+
+def _engine_options(pool_class: Type[Pool], stats: PoolStats) -> Dict[str, Any]:
+    """
+    환경 변수로 설정한 pool, timeout, echo 옵션으로 engine 생성 인자를 만드는 함수
+    """
+    return {
+        "echo": settings.DB_ECHO,
+        "poolclass": instrumented_pool_class(pool_class, stats),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
+def _create_engine(url: str, stats: PoolStats) -> Engine:
+    # statement_timeout, lock_timeout 은 connection 생성 시 세션 설정으로 전달한다
+    timeouts = _session_timeouts()
+    return create_engine(
+        url,
+        connect_args=(
+            {"options": " ".join(f"-c {name}={value}" for name, value in timeouts.items())}
+            if timeouts
+            else {}
+        ),
+        **_engine_options(QueuePool, stats),
+    )
+
 
-engine = create_engine(SQLALCHEMY_DATABASE_URI, echo=True)
+def _create_async_engine(url: str, stats: PoolStats) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        connect_args={"server_settings": _session_timeouts()},
+        **_engine_options(AsyncAdaptedQueuePool, stats),
+    )
+
+
+engine = _create_engine(SQLALCHEMY_DATABASE_URI, pool_stats["sync"])
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# async 모드에서 요청 세션으로 사용하는 engine (lifespan, 백그라운드 작업 등은 동기 engine 을 사용)
+async_engine = (
+    _create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URI, pool_stats["async"])
+    if settings.DATABASE_ASYNC
+    else None
+)
+AsyncSessionLocal = (
+    async_sessionmaker(async_engine, autoflush=False, expire_on_commit=True)
+    if async_engine is not None
+    else None
+)
+
+# 조회 전용 replica engine, 복제 지연은 동기 engine 으로 확인한다
+replica_engine = (
+    _create_engine(settings.REPLICA_DATABASE_URL, pool_stats["replica"])
+    if settings.REPLICA_DATABASE_URL
+    else None
+)
+async_replica_engine = (
+    _create_async_engine(settings.ASYNC_REPLICA_DATABASE_URL, pool_stats["async_replica"])
+    if replica_engine is not None and settings.DATABASE_ASYNC
+    else None
+)
+replica_monitor = (
+    ReplicaLagMonitor(replica_engine, settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS)
+    if replica_engine is not None
+    else None
+)
+
+
+def get_pool_stats() -> Dict[str, Dict[str, float | int]]:
+    """
+    engine 별 connection pool 상태(checkout 수, overflow, 대기 시간 등)를 반환하는 함수
+    """
+    engines = {
+        "sync": engine,
+        "async": async_engine,
+        "replica": replica_engine,
+        "async_replica": async_replica_engine,
+    }
+    return {
+        name: pool_stats[name].snapshot(target.pool)
+        for name, target in engines.items()
+        if target is not None
+    }
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+# 재시도하면 성공할 수 있는 트랜잭션 충돌 SQLSTATE (serialization_failure, deadlock_detected)
+RETRYABLE_SQLSTATES = ("40001", "40P01")
+
+
+class RequestSession:
+    """
+    요청 하나가 사용하는 세션을 보관하는 클래스
+    세션은 처음 요청될 때 생성되고, connection 은 세션이 처음 쿼리를 실행할 때 pool 에서 가져옵니다.
+    DB 를 사용하지 않는 요청(/, API 문서, 인증 전 거절되는 요청 등)은 세션과 connection 을 만들지 않습니다.
+    """
+
+    def __init__(self, isolation_level: str | None = None, read_only: bool = False):
+        self.isolation_level = isolation_level
+        self.read_only = read_only
+        self._session: Session | AsyncSession | None = None
+
+    @property
+    def opened(self) -> bool:
+        return self._session is not None
+
+    def get(self, replica: bool = False) -> Session | AsyncSession:
+        """
+        요청 세션을 반환하는 함수
+        처음 생성할 때 replica 로 요청했다면 replica 에 연결된 읽기 전용 세션을 생성합니다.
+        """
+        if self._session is None:
+            self._session = create_request_session(
+                self.isolation_level, self.read_only, replica and self.read_only
+            )
+        return self._session
+
+    async def finish(self, commit: bool) -> None:
+        """
+        세션을 commit 또는 rollback 한 뒤 닫는 함수, 세션이 생성되지 않았다면 아무것도 하지 않음
+        동기 Session 의 commit/rollback 은 이벤트 루프를 막지 않도록 worker thread 에서 실행합니다.
+        읽기 전용 세션은 commit 하지 않습니다.
+        """
+        db, self._session = self._session, None
+        if db is None:
+            return
+        if self.read_only:
+            commit = False
+
+        try:
+            if isinstance(db, AsyncSession):
+                await (db.commit() if commit else db.rollback())
+            else:
+                await run_in_threadpool(db.commit if commit else db.rollback)
+        finally:
+            if isinstance(db, AsyncSession):
+                await db.close()
+            else:
+                db.close()
+
 
 # 데이터베이스 의존성
-def get_db_from_request(request: Request) -> Session:
-    db = getattr(request.state, "db", None)
-    if db is None:
+async def get_db_from_request(request: Request) -> AsyncIterator[Session | AsyncSession]:
+    """
+    요청 세션을 주입하는 의존성
+    엔드포인트가 예외 없이 끝나면 commit 하고, 예외(HTTPException 포함)가 발생하면 rollback 합니다.
+    replica 조회 대상 엔드포인트(read_from_replica)는 조건을 만족하면 replica 세션을 주입합니다.
+    """
+    holder = getattr(request.state, "db", None)
+    if holder is None:
         raise RuntimeError("DB 세션이 존재하지 않습니다.")
+
+    try:
+        yield holder.get(replica=await _should_use_replica(request))
+    except Exception:
+        await holder.finish(commit=False)
+        raise
+    await holder.finish(commit=True)
+
+
+async def _should_use_replica(request: Request) -> bool:
+    """
+    replica 로 조회할 수 있는 요청인지 확인하는 함수
+
+    - replica 가 설정되어 있고, replica 조회 대상 엔드포인트의 읽기 요청이어야 함
+    - 사용자가 직전에 쓰기 요청을 했거나 primary 조회를 요청했다면 primary 로 조회함(read-your-writes)
+    - 복제 지연이 허용 범위(REPLICA_MAX_LAG_SECONDS)를 넘거나 확인할 수 없다면 primary 로 조회함
+    """
+    if replica_monitor is None or request.method not in ("GET", "HEAD"):
+        return False
+    if not is_replica_route(request.scope) or requires_primary(request):
+        return False
+
+    if replica_monitor.expired:
+        await run_in_threadpool(replica_monitor.refresh)
+    return replica_monitor.available(settings.REPLICA_MAX_LAG_SECONDS)
+
+
+def create_request_session(
+    isolation_level: str | None = None,
+    read_only: bool = False,
+    replica: bool = False,
+) -> Session | AsyncSession:
+    """
+    요청 하나를 처리할 세션을 생성하는 함수
+    async 모드라면 AsyncSession 을, 아니라면 동기 Session 을 생성합니다.
+
+    - 격리 수준을 지정하면 connection 을 가져올 때 해당 격리 수준이 적용됩니다.
+    - 읽기 전용 세션은 autocommit connection 을 사용해 BEGIN/COMMIT 없이 조회합니다.
+      DB_READ_SNAPSHOT 설정 시에는 REPEATABLE READ READ ONLY 트랜잭션으로 같은 시점의 데이터를 조회합니다.
+    - replica 세션은 replica engine 에 연결됩니다. (읽기 전용 세션에서만 사용)
+    """
+    if AsyncSessionLocal is not None:
+        bind = async_replica_engine if replica else async_engine
+    else:
+        bind = replica_engine if replica else engine
+    execution_options = _session_execution_options(isolation_level, read_only)
+    if execution_options:
+        bind = bind.execution_options(**execution_options)
+
+    if AsyncSessionLocal is not None:
+        db = AsyncSessionLocal(bind=bind)
+        info = db.sync_session.info
+    else:
+        db = SessionLocal(bind=bind)
+        info = db.info
+    info["read_only"] = read_only
+    info["replica"] = replica
+    info["async"] = AsyncSessionLocal is not None
     return db
+
+
+def is_replica_session(db: Session) -> bool:
+    """
+    replica 에 연결된 세션인지 확인하는 함수, replica 에서 조회한 값은 복제 지연만큼 오래되었을 수 있다.
+    """
+    return db.info.get("replica", False) is True
+
+
+def _session_execution_options(
+    isolation_level: str | None, read_only: bool
+) -> Dict[str, Any]:
+    if not read_only:
+        return {"isolation_level": isolation_level} if isolation_level else {}
+    if settings.DB_READ_SNAPSHOT:
+        return {"isolation_level": "REPEATABLE READ", "postgresql_readonly": True}
+    return {"isolation_level": "AUTOCOMMIT"}
+
+
+async def run_with_session(
+    db: Session | AsyncSession, operation: Callable[[Session], T]
+) -> T:
+    """
+    동기 Session 을 받는 작업(repository, service 함수)을 요청 세션 종류에 맞게 실행하는 함수
+
+    - AsyncSession: run_sync 로 이벤트 루프에서 실행함. DB I/O 는 asyncpg 로 처리되어 thread 를 점유하지 않음
+    - Session: worker thread 에서 실행함(기존 동기 라우터와 동일)
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(operation)
+    return await run_in_threadpool(operation, db)
+
+
+async def run_with_session_and_compute(
+    db: Session | AsyncSession,
+    fetch: Callable[[Session], R],
+    compute: Callable[[R], T],
+) -> T:
+    """
+    DB 조회(fetch)와 조회 결과로 응답을 계산하는 CPU 작업(compute)을 나누어 실행하는 함수
+
+    - AsyncSession: fetch 만 run_sync 로 이벤트 루프에서 실행하고, compute 는 worker thread 에서 실행해
+      큰 조회 구간의 계산이 다른 요청의 처리를 막지 않도록 함
+    - Session: 두 작업을 하나의 worker thread 에서 이어서 실행함
+    """
+    if isinstance(db, AsyncSession):
+        return await run_in_threadpool(compute, await db.run_sync(fetch))
+    return await run_in_threadpool(lambda session: compute(fetch(session)), db)
+
+
+def sleep_in_session(db: Session, seconds: float) -> None:
+    """
+    세션 작업(run_with_session) 도중 대기하는 함수
+    AsyncSession 의 run_sync 는 이벤트 루프에서 실행되므로, time.sleep 대신 asyncio.sleep 을 기다려 다른 요청을 막지 않는다.
+    """
+    if db.info.get("async", False) is True:
+        await_only(asyncio.sleep(seconds))
+    else:
+        time.sleep(seconds)
+
+
+def is_serialization_failure(exc: BaseException) -> bool:
+    """
+    트랜잭션을 처음부터 다시 실행하면 성공할 수 있는 DB 충돌 예외인지 확인하는 함수
+    """
+    if not isinstance(exc, DBAPIError):
+        return False
+    return getattr(exc.orig, "pgcode", None) in RETRYABLE_SQLSTATES
+
+
+def run_after_commit(db: Session, callback: Callable[[], None]) -> None:
+    """
+    트랜잭션이 commit 된 이후에 실행할 작업을 등록하는 함수
+    rollback 되는 경우 등록된 작업은 실행되지 않고 버려집니다.
+    """
+    db.info.setdefault("after_commit", []).append(callback)
+
+
+def discard_after_commit(db: Session, since: int) -> None:
+    """
+    since 번째 이후에 등록된 commit 이후 작업을 버리는 함수
+    savepoint 를 rollback 하는 경우, savepoint 안에서 등록된 작업만 버릴 때 사용합니다.
+    """
+    del db.info.setdefault("after_commit", [])[since:]
+
+
+def count_after_commit(db: Session) -> int:
+    return len(db.info.get("after_commit", []))
+
+
+def current_xact_id(db: Session) -> int:
+    """
+    현재 트랜잭션의 ID(pg_current_xact_id)를 반환하는 함수
+    트랜잭션이 끝날 때까지는 처음 조회한 값을 재사용합니다.
+    """
+    xact_id = db.info.get("xact_id")
+    if xact_id is None:
+        xact_id = int(
+            db.execute(select(cast(func.pg_current_xact_id(), String))).scalar_one()
+        )
+        db.info["xact_id"] = xact_id
+    return xact_id
+
+
+class XactSnapshot:
+    """
+    pg_current_snapshot() 으로 조회한 snapshot 에 어떤 트랜잭션의 변경이 포함되는지 판단하는 클래스
+    (xmin 이전에 끝났거나, xmax 이전에 시작해 snapshot 시점에 진행 중이 아니었던 트랜잭션의 변경만 포함됨)
+    """
+
+    def __init__(self, value: str):
+        xmin, xmax, xip = value.split(":")
+        self.xmin, self.xmax = int(xmin), int(xmax)
+        self.xip = {int(xact_id) for xact_id in xip.split(",") if xact_id}
+
+    def visible(self, xact_id: int) -> bool:
+        return xact_id < self.xmin or (
+            xact_id < self.xmax and xact_id not in self.xip
+        )
+
+
+def current_snapshot(db: Session) -> XactSnapshot:
+    return XactSnapshot(
+        db.execute(select(cast(func.pg_current_snapshot(), String))).scalar_one()
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    session.info.pop("xact_id", None)
+    for callback in session.info.pop("after_commit", []):
+        try:
+            callback()
+        except Exception:
+            # 이미 commit 된 트랜잭션이므로 후속 작업의 실패가 요청 결과에 영향을 주지 않도록 한다
+            logger.exception("commit 이후 작업 실행에 실패했습니다.")
+
+
+@event.listens_for(Session, "before_flush")
+def _forbid_flush_in_read_only_session(session: Session, flush_context, instances) -> None:
+    # autocommit 으로 조회하는 읽기 전용 세션에서 실수로 데이터를 변경하지 않도록 막는다
+    if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+        raise RuntimeError("읽기 전용 세션에서는 데이터를 변경할 수 없습니다.")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session) -> None:
+    session.info.pop("xact_id", None)
+    session.info.pop("after_commit", None)
@@ -0,0 +1,161 @@
+import json
+import logging
+import os
+import select
+import threading
+import uuid
+from typing import Any, Callable, Dict, List
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import select as sql_select, func
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 현재 프로세스를 구분하는 값, 자신이 발행한 알림은 commit 이후 작업으로 이미 반영했으므로 무시한다
+ORIGIN = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+# NOTIFY payload 의 최대 크기(8000 byte)보다 작게 나누어 발행한다
+MAX_PAYLOAD_BYTES = 7000
+
+Handler = Callable[[Dict[str, Any]], None]
+
+
+def notify(db: Session, channel: str, payload: Dict[str, Any]) -> None:
+    """
+    현재 트랜잭션에서 NOTIFY 를 발행하는 함수
+    알림은 트랜잭션이 commit 될 때 전달되고, rollback 되면 전달되지 않습니다.
+    """
+    message = json.dumps({**payload, "origin": ORIGIN}, separators=(",", ":"))
+    db.execute(sql_select(func.pg_notify(channel, message)))
+
+
+def notify_chunks(
+    db: Session,
+    channel: str,
+    key: str,
+    items: List[Any],
+    extra: Dict[str, Any] | None = None,
+) -> None:
+    """
+    items 를 payload 크기 제한에 맞춰 나누어 {key: [...]} 형태로 발행하는 함수
+    extra 는 나누어진 모든 payload 에 함께 담는다.
+    """
+    chunk: List[Any] = []
+    size = 0
+    for item in items:
+        item_size = len(json.dumps(item, separators=(",", ":"))) + 1
+        if chunk and size + item_size > MAX_PAYLOAD_BYTES:
+            notify(db, channel, {**(extra or {}), key: chunk})
+            chunk, size = [], 0
+        chunk.append(item)
+        size += item_size
+    if chunk:
+        notify(db, channel, {**(extra or {}), key: chunk})
+
+
+class InvalidationListener:
+    """
+    다른 프로세스(worker, pod)가 발행한 캐시 무효화 알림을 LISTEN 으로 수신하는 백그라운드 thread
+
+    - 채널별 handler 로 알림 payload 를 전달하며, 자신이 발행한 알림은 무시함
+    - 연결이 끊기면 그동안의 알림을 놓쳤을 수 있으므로, 다시 연결해 LISTEN 한 뒤 on_reset 으로 캐시 전체를 비움
+    - 처음 LISTEN 할 때는 아직 캐시가 비어 있으므로 비우지 않음
+      (wait_until_listening 이 시간 내에 LISTEN 하지 못해 요청 처리가 먼저 시작된 경우는 제외)
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        handlers: Dict[str, Handler],
+        on_reset: Callable[[], None],
+        reconnect_seconds: float = 1.0,
+    ):
+        url = make_url(database_url).set(drivername="postgresql")
+        self.dsn = url.render_as_string(hide_password=False)
+        self.handlers = handlers
+        self.on_reset = on_reset
+        self.reconnect_seconds = reconnect_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._listening = threading.Event()
+        self._state_lock = threading.Lock()
+        self._reset_on_listen = False
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="invalidation-listener", daemon=True
+        )
+        self._thread.start()
+
+    def wait_until_listening(self, timeout: float) -> bool:
+        """
+        처음 LISTEN 할 때까지 기다리는 함수
+        시간 내에 LISTEN 하지 못하면, 이후 LISTEN 할 때 그동안 채워진 캐시를 비우도록 한다.
+        """
+        if self._listening.wait(timeout):
+            return True
+        with self._state_lock:
+            if self._listening.is_set():
+                return True
+            self._reset_on_listen = True
+        logger.warning("캐시 무효화 알림 수신을 시작하지 못한 채 요청 처리를 시작합니다.")
+        return False
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.reconnect_seconds + 1)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logger.warning("캐시 무효화 알림 수신이 중단되었습니다.", exc_info=True)
+            self._stop.wait(self.reconnect_seconds)
+
+    def _listen(self) -> None:
+        connection = psycopg2.connect(self.dsn)
+        try:
+            connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with connection.cursor() as cursor:
+                for channel in self.handlers:
+                    cursor.execute(f'LISTEN "{channel}"')
+
+            # 다시 연결한 경우, LISTEN 이전의 변경은 수신하지 못했으므로 캐시를 비우고 시작한다
+            with self._state_lock:
+                reset = self._reset_on_listen
+                self._reset_on_listen = True
+                self._listening.set()
+            if reset:
+                self.on_reset()
+
+            while not self._stop.is_set():
+                if select.select([connection], [], [], self.reconnect_seconds) == (
+                    [],
+                    [],
+                    [],
+                ):
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    self.dispatch(connection.notifies.pop(0))
+        finally:
+            connection.close()
+
+    def dispatch(self, notification) -> None:
+        handler = self.handlers.get(notification.channel)
+        if handler is None:
+            return
+        try:
+            payload = json.loads(notification.payload)
+            if payload.get("origin") == ORIGIN:
+                return
+            handler(payload)
+        except Exception:
+            # 처리하지 못한 알림은 캐시 전체를 비워 오래된 값이 남지 않도록 한다
+            logger.warning("캐시 무효화 알림을 처리하지 못했습니다.", exc_info=True)
+            self.on_reset()
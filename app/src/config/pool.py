@@ -0,0 +1,88 @@
+import threading
+import time
+from typing import Dict, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool
+
+
+class PoolStats:
+    """
+    connection pool 의 checkout 대기 시간, overflow 발생, timeout 횟수를 누적하는 클래스
+    pool 을 사용하는 여러 thread 에서 동시에 기록할 수 있도록 lock 으로 보호합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.overflow_events = 0
+            self.timeouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+
+    def record_checkout(self, wait_seconds: float, overflowed: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.overflow_events += overflowed
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+    def record_timeout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+    def snapshot(self, pool: Pool | None = None) -> Dict[str, float | int]:
+        with self._lock:
+            result = {
+                "checkouts": self.checkouts,
+                "overflow_events": self.overflow_events,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": (
+                    self.wait_seconds_total / self.checkouts * 1000
+                    if self.checkouts
+                    else 0.0
+                ),
+                "wait_ms_max": self.wait_seconds_max * 1000,
+            }
+
+        # 현재 pool 상태(checkout 된 connection 수 등)는 pool 에서 직접 조회한다
+        if pool is not None and hasattr(pool, "checkedout"):
+            result.update(
+                {
+                    "size": pool.size(),
+                    "checked_out": pool.checkedout(),
+                    "checked_in": pool.checkedin(),
+                    "overflow": pool.overflow(),
+                }
+            )
+        return result
+
+
+def instrumented_pool_class(pool_class: Type[Pool], stats: PoolStats) -> Type[Pool]:
+    """
+    connection 을 꺼낼 때(checkout)마다 대기 시간과 overflow 여부를 stats 에 기록하는 pool 클래스를 반환하는 함수
+    engine 의 poolclass 로 사용하며, pool 재생성(dispose) 시에도 같은 stats 에 기록됩니다.
+    """
+
+    def connect(self):
+        overflow = getattr(self, "_overflow", 0)
+        started = time.perf_counter()
+        try:
+            connection = pool_class.connect(self)
+        except exc.TimeoutError:
+            stats.record_timeout(time.perf_counter() - started)
+            raise
+
+        # pool_size 를 넘어 새 connection 을 생성한 경우에만 overflow 로 기록한다
+        current = getattr(self, "_overflow", 0)
+        stats.record_checkout(
+            time.perf_counter() - started, current > overflow and current > 0
+        )
+        return connection
+
+    return type(f"Instrumented{pool_class.__name__}", (pool_class,), {"connect": connect})
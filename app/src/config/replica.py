@@ -0,0 +1,112 @@
+import logging
+import threading
+import time
+from typing import Callable, TypeVar
+
+from fastapi import Request
+from sqlalchemy import Engine, text
+from starlette.types import Scope
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+# replica 로 조회해도 되는 엔드포인트 표시
+REPLICA_ROUTE_ATTR = "__read_from_replica__"
+
+# 쓰기 이후 primary 로 조회하도록 하는 cookie(만료 시각, epoch 초)와 요청 header
+READ_PRIMARY_COOKIE = "read_primary_until"
+READ_PRIMARY_HEADER = "x-read-primary"
+
+# 복제가 따라잡은 상태라면 0, 아니라면 마지막으로 반영된 트랜잭션 이후 경과 시간을 지연으로 본다
+# replica 가 아닌 인스턴스(로컬 개발용 단독 DB 등)는 지연이 없는 것으로 본다
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+def read_from_replica(endpoint: F) -> F:
+    """
+    엔드포인트를 replica 조회 대상으로 표시하는 decorator
+    복제 지연이 허용 범위 안이고 read-your-writes 대상이 아닐 때만 replica 로 조회합니다.
+    """
+    setattr(endpoint, REPLICA_ROUTE_ATTR, True)
+    return endpoint
+
+
+def is_replica_route(scope: Scope) -> bool:
+    route = scope.get("route")
+    endpoint = getattr(route, "endpoint", None)
+    return bool(getattr(endpoint, REPLICA_ROUTE_ATTR, False))
+
+
+def requires_primary(request: Request) -> bool:
+    """
+    사용자가 직전에 쓰기 요청을 했거나(cookie), 명시적으로 요청한 경우(header) primary 로 조회해야 하는지 확인하는 함수
+    """
+    if request.headers.get(READ_PRIMARY_HEADER, "").lower() in ("1", "true"):
+        return True
+
+    try:
+        read_primary_until = float(request.cookies.get(READ_PRIMARY_COOKIE, "0"))
+    except ValueError:
+        return False
+    return read_primary_until > time.time()
+
+
+def read_your_writes_cookie(seconds: int) -> bytes:
+    """
+    쓰기 요청의 응답에 추가할 Set-Cookie header 값을 반환하는 함수
+    """
+    until = int(time.time()) + seconds
+    return (
+        f"{READ_PRIMARY_COOKIE}={until}; Max-Age={seconds}; Path=/; HttpOnly; SameSite=Lax"
+    ).encode("latin-1")
+
+
+class ReplicaLagMonitor:
+    """
+    replica 의 복제 지연을 주기적으로 조회해 보관하는 클래스
+    요청마다 지연을 조회하지 않도록 interval 동안 마지막 측정값을 사용하고, 조회에 실패하면 replica 를 사용할 수 없는 것으로 봅니다.
+    """
+
+    def __init__(self, engine: Engine, interval_seconds: float):
+        self.engine = engine
+        self.interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+        self._lag_seconds: float | None = None
+        self._checked_at = 0.0
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() - self._checked_at >= self.interval_seconds
+
+    @property
+    def lag_seconds(self) -> float | None:
+        return self._lag_seconds
+
+    def refresh(self) -> None:
+        # 여러 요청이 동시에 만료를 확인해도 한 번만 조회한다
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if not self.expired:
+                return
+            try:
+                with self.engine.connect() as connection:
+                    self._lag_seconds = float(connection.execute(REPLICA_LAG_QUERY).scalar())
+            except Exception:
+                logger.warning("replica 복제 지연 조회에 실패했습니다.", exc_info=True)
+                self._lag_seconds = None
+            self._checked_at = time.monotonic()
+        finally:
+            self._lock.release()
+
+    def available(self, max_lag_seconds: float) -> bool:
+        return self._lag_seconds is not None and self._lag_seconds <= max_lag_seconds
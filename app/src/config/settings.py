@@ -0,0 +1,143 @@
+import os
+from enum import Enum
+
+
+def get_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return int(value)
+
+
+def get_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return float(value)
+
+
+def get_str(name: str, default: str) -> str:
+    return os.getenv(name, default)
+
+
+# 데이터베이스 연결 설정
+DATABASE_URL = get_str(
+    "DATABASE_URL", "postgresql://postgres:postgres@db:5432/reservation"
+)
+# async 모드에서 사용하는 연결 URL, 지정하지 않으면 DATABASE_URL 의 driver 를 asyncpg 로 바꿔 사용
+ASYNC_DATABASE_URL = get_str(
+    "ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1),
+)
+
+# 조회 전용 replica 연결 URL, 지정하지 않으면 모든 요청을 primary 로 처리
+REPLICA_DATABASE_URL = get_str("REPLICA_DATABASE_URL", "")
+ASYNC_REPLICA_DATABASE_URL = get_str(
+    "ASYNC_REPLICA_DATABASE_URL",
+    REPLICA_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1),
+)
+# replica 로 조회를 허용하는 최대 복제 지연(초), 지연이 더 크거나 확인할 수 없으면 primary 로 조회
+REPLICA_MAX_LAG_SECONDS = get_float("REPLICA_MAX_LAG_SECONDS", 5.0)
+# 복제 지연을 다시 확인하는 주기(초)
+REPLICA_LAG_CHECK_INTERVAL_SECONDS = get_float("REPLICA_LAG_CHECK_INTERVAL_SECONDS", 1.0)
+# 쓰기 요청 이후 같은 사용자의 조회를 primary 로 보내는 시간(초), 자신이 변경한 데이터를 바로 볼 수 있도록 함
+READ_YOUR_WRITES_SECONDS = get_int("READ_YOUR_WRITES_SECONDS", 5)
+
+# connection pool 설정
+# - pool_size: 유지하는 connection 수, max_overflow: pool_size 를 넘어 추가로 생성할 수 있는 connection 수
+# - pool_timeout: connection 을 얻기 위해 기다리는 최대 시간(초)
+# - pool_pre_ping: checkout 시 connection 이 살아있는지 확인할지 여부
+# - pool_recycle: connection 을 재생성하는 주기(초), -1 이면 재생성하지 않음
+DB_POOL_SIZE = get_int("DB_POOL_SIZE", 10)
+DB_MAX_OVERFLOW = get_int("DB_MAX_OVERFLOW", 20)
+DB_POOL_TIMEOUT = get_float("DB_POOL_TIMEOUT", 10.0)
+DB_POOL_PRE_PING = get_bool("DB_POOL_PRE_PING", True)
+DB_POOL_RECYCLE = get_int("DB_POOL_RECYCLE", 1800)
+
+# 세션 단위 timeout(ms), 0 이면 설정하지 않음
+DB_STATEMENT_TIMEOUT_MS = get_int("DB_STATEMENT_TIMEOUT_MS", 0)
+DB_LOCK_TIMEOUT_MS = get_int("DB_LOCK_TIMEOUT_MS", 0)
+
+# 실행되는 SQL 을 로그로 남길지 여부(운영 환경에서는 비활성화)
+DB_ECHO = get_bool("DB_ECHO", False)
+
+# GET 요청을 읽기 전용 세션으로 처리할지 여부
+# 사용하면 autocommit connection 으로 조회해 BEGIN/COMMIT 을 보내지 않음
+DB_READ_ONLY_GET = get_bool("DB_READ_ONLY_GET", True)
+# 읽기 전용 세션에서 여러 쿼리가 같은 시점의 데이터를 보도록 REPEATABLE READ READ ONLY 트랜잭션을 사용할지 여부
+# 트랜잭션은 commit 없이 rollback 으로 종료함
+DB_READ_SNAPSHOT = get_bool("DB_READ_SNAPSHOT", False)
+
+# 요청 세션으로 asyncpg 기반 AsyncSession 을 사용할지 여부
+# 사용하면 DB 응답을 기다리는 동안 worker thread 를 점유하지 않으므로, 하나의 worker 가 많은 동시 요청을 처리할 수 있음
+DATABASE_ASYNC = get_bool("DATABASE_ASYNC", False)
+
+# 프로세스 내 슬롯 용량 인덱스(segment tree)를 예약 가능 여부 검사에 사용할지 여부
+CAPACITY_INDEX_ENABLED = get_bool("CAPACITY_INDEX_ENABLED", True)
+# 인덱스가 예약 가능하다고 판단한 경우에도 DB 로 다시 검증할지 여부(검증 모드)
+CAPACITY_INDEX_VERIFY = get_bool("CAPACITY_INDEX_VERIFY", False)
+
+# 예약 가능 시간 조회에 사용하는 일자별 슬롯 예약 인원 캐시
+AVAILABILITY_CACHE_ENABLED = get_bool("AVAILABILITY_CACHE_ENABLED", True)
+# 캐시가 사용하는 최대 메모리(byte), 초과하면 오래 사용하지 않은 일자부터 제거
+AVAILABILITY_CACHE_MAX_BYTES = get_int("AVAILABILITY_CACHE_MAX_BYTES", 1024 * 1024)
+# 변경이 없어도 캐시를 다시 조회하는 주기(초), 다른 프로세스의 변경이 반영되는 최대 시간
+AVAILABILITY_CACHE_TTL_SECONDS = get_float("AVAILABILITY_CACHE_TTL_SECONDS", 60.0)
+# 동시에 들어온 같은 구간의 예약 가능 시간 조회를 하나의 실행으로 묶을지 여부
+SCHEDULES_SINGLE_FLIGHT_ENABLED = get_bool("SCHEDULES_SINGLE_FLIGHT_ENABLED", True)
+
+# 예약/토큰 변경을 LISTEN/NOTIFY 로 다른 프로세스에 전파해 프로세스 내 캐시를 바로 갱신할지 여부
+INVALIDATION_BUS_ENABLED = get_bool("INVALIDATION_BUS_ENABLED", True)
+# 알림 수신 connection 이 끊겼을 때 다시 연결하기까지 대기하는 시간(초), 다시 연결하면 캐시 전체를 비움
+INVALIDATION_RECONNECT_SECONDS = get_float("INVALIDATION_RECONNECT_SECONDS", 1.0)
+# 서버 시작 시 알림 수신(LISTEN)을 시작할 때까지 기다리는 최대 시간(초), 이후 슬롯 용량 인덱스를 생성함
+INVALIDATION_STARTUP_TIMEOUT_SECONDS = get_float(
+    "INVALIDATION_STARTUP_TIMEOUT_SECONDS", 5.0
+)
+
+# 토큰 폐기 여부를 확인하는 사용자별 token epoch 캐시의 갱신 주기(초)
+# 변경 알림을 놓친 경우, 다른 프로세스에서 폐기한 토큰은 최대 이 시간 동안 유효할 수 있음
+TOKEN_EPOCH_REFRESH_SECONDS = get_float("TOKEN_EPOCH_REFRESH_SECONDS", 30.0)
+# 서명을 검증한 토큰을 만료 시각까지 보관하는 LRU 캐시의 최대 항목 수(0 이면 사용하지 않음)
+TOKEN_CACHE_SIZE = get_int("TOKEN_CACHE_SIZE", 10000)
+
+# 비밀번호 해싱(bcrypt) cost, 변경하면 기존 사용자의 해시는 로그인 시 새 cost 로 다시 해싱됨
+BCRYPT_ROUNDS = get_int("BCRYPT_ROUNDS", 12)
+# 비밀번호 해싱/검증을 실행하는 process pool 의 worker 수(0 이면 worker thread 에서 실행)
+PASSWORD_HASH_WORKERS = get_int("PASSWORD_HASH_WORKERS", 2)
+# process pool 에 동시에 대기할 수 있는 최대 작업 수, 초과하면 503 응답
+PASSWORD_HASH_MAX_PENDING = get_int("PASSWORD_HASH_MAX_PENDING", 64)
+
+
+class LockMode(str, Enum):
+    ROW = "row"
+    ADVISORY = "advisory"
+    OPTIMISTIC = "optimistic"
+    SERIALIZABLE = "serializable"
+
+
+# 예약 확정 시 잔여 인원 ledger 를 보호하는 lock 방식
+# - row: 예약이 차지하는 ledger 슬롯 row 를 select for update
+# - advisory: 예약이 걸치는 stripe 단위로 pg_advisory_xact_lock 을 획득
+# - optimistic: lock 없이 조건부 차감과 예약 version 비교로 처리하고, 충돌 시 재시도
+# - serializable: lock 없이 쓰기 요청 전체를 SERIALIZABLE 격리 수준으로 실행하고, 직렬화 실패 시 요청을 재실행
+RESERVATION_LOCK_MODE = LockMode(get_str("RESERVATION_LOCK_MODE", LockMode.ROW.value))
+# advisory lock 의 stripe 크기(분), 기본값은 1일
+ADVISORY_LOCK_STRIPE_MINUTES = get_int("ADVISORY_LOCK_STRIPE_MINUTES", 24 * 60)
+
+# optimistic 방식에서 version 충돌 시 최대 재시도 횟수와 지수 backoff 설정(ms)
+OPTIMISTIC_MAX_RETRIES = get_int("OPTIMISTIC_MAX_RETRIES", 3)
+OPTIMISTIC_BACKOFF_BASE_MS = get_int("OPTIMISTIC_BACKOFF_BASE_MS", 10)
+OPTIMISTIC_BACKOFF_MAX_MS = get_int("OPTIMISTIC_BACKOFF_MAX_MS", 200)
+
+# serializable 방식에서 직렬화 실패(40001/40P01) 시 요청 재실행 최대 횟수와 지수 backoff 설정(ms)
+SERIALIZABLE_MAX_RETRIES = get_int("SERIALIZABLE_MAX_RETRIES", 5)
+SERIALIZABLE_BACKOFF_BASE_MS = get_int("SERIALIZABLE_BACKOFF_BASE_MS", 5)
+SERIALIZABLE_BACKOFF_MAX_MS = get_int("SERIALIZABLE_BACKOFF_MAX_MS", 100)
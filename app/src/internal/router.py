@@ -0,0 +1,31 @@
+from typing import Annotated, Any, Dict
+from fastapi import APIRouter, Depends
+
+from app.src.common import metrics
+from app.src.common.token import Principal
+from app.src.config.database import get_pool_stats
+from app.src.middleware.authenticate import authenticate_admin
+from app.src.reservation.availability_cache import availability_cache
+
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get("/stats")
+def get_stats(
+    admin: Annotated[Principal, Depends(authenticate_admin)],
+) -> Dict[str, Any]:
+    """
+    운영 지표 조회 API
+
+    - counters: 직렬화 실패 재시도 횟수 등 프로세스 내 카운터(이름, 라우트 별)
+    - timings: 로그인 등 소요 시간(이름, 결과 별 횟수/평균/최대)
+    - pool: engine 별 connection pool 상태와 checkout 대기 시간, overflow/timeout 발생 횟수
+    - availability_cache: 예약 가능 시간 캐시의 hit/miss, hit ratio, 보관 일자 수, 사용 메모리
+    """
+    return {
+        "counters": metrics.counters.snapshot(),
+        "timings": metrics.timings.snapshot(),
+        "pool": get_pool_stats(),
+        "availability_cache": availability_cache.stats(),
+    }
@@ -1,20 +1,74 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 
-from app.src.config.database import Base, engine
+from app.src.config import settings
+from app.src.config.database import SessionLocal
+from app.src.config.invalidation import InvalidationListener
+from app.src.internal.router import router as internal_router
 from app.src.middleware.db_transaction import DBSessionMiddleware
+from app.src.user import password, token_epoch
 from app.src.user.router import router as user_router
+from app.src.user.token_epoch import refresh_periodically, token_epochs
+from app.src.reservation import capacity_index
+from app.src.reservation import changes as reservation_changes
 from app.src.reservation.router import router as reservation_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 다른 프로세스의 예약/토큰 변경 알림을 받아 프로세스 내 캐시를 갱신
+    # 인덱스를 생성하기 전에 LISTEN 해야, 인덱스 조회 이후에 commit 된 변경을 놓치지 않는다
+    invalidation_listener = None
+    if settings.INVALIDATION_BUS_ENABLED:
+        invalidation_listener = InvalidationListener(
+            settings.DATABASE_URL,
+            {
+                reservation_changes.CHANNEL: reservation_changes.apply,
+                token_epoch.CHANNEL: token_epoch.apply,
+            },
+            _reset_caches,
+            settings.INVALIDATION_RECONNECT_SECONDS,
+        )
+        invalidation_listener.start()
+        await run_in_threadpool(
+            invalidation_listener.wait_until_listening,
+            settings.INVALIDATION_STARTUP_TIMEOUT_SECONDS,
+        )
+
+    # initialize capacity index
+    if settings.CAPACITY_INDEX_ENABLED:
+        db = SessionLocal()
+        try:
+            await run_in_threadpool(capacity_index.rebuild, db)
+        finally:
+            db.close()
+
+    # 토큰 폐기 여부 확인에 사용하는 token epoch 캐시를 주기적으로 갱신
+    token_epoch_refresher = asyncio.create_task(
+        refresh_periodically(token_epochs, settings.TOKEN_EPOCH_REFRESH_SECONDS)
+    )
+    yield
+    if invalidation_listener is not None:
+        invalidation_listener.stop()
+    token_epoch_refresher.cancel()
+    password.shutdown()
+
+
+def _reset_caches() -> None:
+    reservation_changes.reset()
+    token_epochs.clear()
+
+
 # initialize fastapi
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.include_router(user_router)
 app.include_router(reservation_router)
+app.include_router(internal_router)
 
 app.add_middleware(DBSessionMiddleware)
 
-# initialize database
-Base.metadata.create_all(engine)
-
 
 @app.get("/")
 async def warmup():
@@ -1,13 +1,17 @@
+import hashlib
 from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
-from sqlalchemy.orm import Session
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 
-from app.src.common.token import TokenData
-from app.src.config.database import get_db_from_request
-from app.src.user import repository as user_repository
+from app.src.common import metrics
+from app.src.common.token import Principal, TokenData
+from app.src.common.ttl_cache import TTLCache
+from app.src.config import settings
 from app.src.user.model import Role
+from app.src.user.token_epoch import token_epochs
 
 
 SECRET_KEY = "secret_key"
@@ -15,31 +19,52 @@ ALGORITHM = "HS256"
 
 security = HTTPBearer(auto_error=False)
 
+# 서명을 검증한 토큰의 claim (key: token 의 sha256 digest)
+token_cache: TTLCache[TokenData] = TTLCache(settings.TOKEN_CACHE_SIZE)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+    )
+
+
+def _decode_token(token: str) -> TokenData:
+    """
+    토큰의 서명을 검증하고 claim 을 반환하는 함수
+    같은 토큰은 만료 시각까지 재사용되므로, 검증한 결과를 token digest 로 캐시해 서명 검증과 파싱을 반복하지 않는다.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    token_data = token_cache.get(key)
+    if token_data is not None:
+        metrics.counters.increment("auth.token_cache", "hit")
+        return token_data
+    metrics.counters.increment("auth.token_cache", "miss")
 
-def _decode_token(token: str):
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email = payload.get("sub")
-        if email is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-            )
-        return TokenData(email=email)
-    except jwt.InvalidTokenError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-        ) from e
+        token_data = TokenData(
+            user_id=payload.get("sub"),
+            email=payload.get("email"),
+            role=payload.get("role"),
+            epoch=payload.get("epoch"),
+        )
+    except (jwt.InvalidTokenError, ValidationError) as e:
+        raise _credentials_exception() from e
+
+    if "exp" in payload:
+        token_cache.put(key, token_data, payload["exp"])
+    return token_data
 
 
-def authenticate_user(
-    db: Session = Depends(get_db_from_request),
+async def authenticate_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)] = None,
-):
+) -> Principal:
     """
     사용자 인증을 수행하는 미들웨어
-    Authorization header 에 Bearer 토큰이 있는지 확인하고, 토큰을 디코딩하여 사용자 정보를 반환합니다.
+    Authorization header 에 Bearer 토큰이 있는지 확인하고, 토큰의 claim 으로 사용자 정보를 반환합니다.
+    users 테이블은 조회하지 않고, 토큰의 epoch 가 사용자의 현재 token epoch(캐시)보다 작으면 폐기된 토큰으로 처리합니다.
     """
     if credentials is None or credentials.scheme.lower() != "bearer":
         raise HTTPException(
@@ -47,26 +72,25 @@ def authenticate_user(
             detail="Authorization header is missing or invalid",
         )
     token_data = _decode_token(credentials.credentials)
-    user = user_repository.find_by_email(db, token_data.email)
 
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-        )
-    return user
+    epoch = token_epochs.get(token_data.user_id)
+    if epoch is None:
+        epoch = await run_in_threadpool(token_epochs.load, token_data.user_id)
+    if epoch is None or token_data.epoch < epoch:
+        raise _credentials_exception()
+
+    return Principal(id=token_data.user_id, email=token_data.email, role=token_data.role)
 
 
-def authenticate_admin(
-    db: Session = Depends(get_db_from_request),
+async def authenticate_admin(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)] = None,
-):
+) -> Principal:
     """
     관리자 인증을 수행하는 미들웨어
     Authorization header 에 Bearer 토큰이 있는지 확인하고, 토큰을 디코딩하여 사용자 정보를 반환합니다.
     반환된 사용자 정보가 관리자 역할인지 확인하고, 관리자 역할이 아니면 예외를 발생시킵니다.
     """
-    user = authenticate_user(db, credentials)
+    user = await authenticate_user(credentials)
     if user.role != Role.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 필요합니다."
@@ -1,29 +1,161 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from app.src.config.database import SessionLocal
+import asyncio
+import logging
+from typing import List
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.src.common import metrics
+from app.src.common.retry import backoff_delay
+from app.src.config import settings
+from app.src.config.database import RequestSession, is_serialization_failure
+from app.src.config.replica import read_your_writes_cookie
 
+logger = logging.getLogger(__name__)
 
-class DBSessionMiddleware(BaseHTTPMiddleware):
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+READ_METHODS = ("GET", "HEAD")
+
+# 응답을 스트리밍하며 자체 세션으로 batch 마다 commit 하는 경로
+# 응답을 버퍼링하거나 요청을 재실행하면 이미 commit 된 batch 가 다시 등록되므로 SERIALIZABLE 재실행 대상에서 제외한다
+NON_REPLAYABLE_PATHS = ("/reservations/import",)
+
+
+class DBSessionMiddleware:
     """
-    DB 세션을 관리하는 미들웨어
+    DB 세션을 관리하는 미들웨어(pure ASGI)
     요청 전체를 래핑하여 DB 세션을 관리합니다.
 
-    요청이 들어오면 세션을 생성하고, 종료 시점에 commit or rollback을 통해 하나의 요청이 하나의 트랜잭션으로 관리되도록합니다.
+    요청이 들어오면 세션 보관소(RequestSession)를 request.state.db 에 저장하고, 세션은 의존성(get_db_from_request)에서 처음 사용할 때 생성됩니다.
+    엔드포인트가 예외 없이 끝나면 commit, 예외가 발생하면 rollback 되어 하나의 요청이 하나의 트랜잭션으로 관리됩니다.
+    GET 요청은 읽기 전용 세션(autocommit 또는 REPEATABLE READ READ ONLY)으로 처리해 commit 을 보내지 않습니다.
+    serializable lock 방식의 쓰기 요청은 SERIALIZABLE 격리 수준으로 실행하고, 직렬화 실패 시 요청을 처음부터 다시 실행합니다.
+    replica 가 설정되어 있다면 성공한 쓰기 요청의 응답에 cookie 를 추가해, 잠시 동안 해당 사용자의 조회를 primary 로 보냅니다.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        db = SessionLocal()
-        request.state.db = db  # 세션을 request.state에 저장
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        if scope["method"] in WRITE_METHODS and settings.REPLICA_DATABASE_URL:
+            send = _read_your_writes_send(send)
+
+        if (
+            scope["method"] in WRITE_METHODS
+            and settings.RESERVATION_LOCK_MODE == settings.LockMode.SERIALIZABLE
+            and scope["path"] not in NON_REPLAYABLE_PATHS
+        ):
+            await self._dispatch_serializable(scope, receive, send)
+            return
+
+        # 조회 요청은 읽기 전용 세션으로 처리해 commit 을 보내지 않는다
+        holder = RequestSession(
+            read_only=settings.DB_READ_ONLY_GET and scope["method"] in READ_METHODS
+        )
+        scope.setdefault("state", {})["db"] = holder
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send)
+        finally:
+            # 의존성에서 정리되지 않은 세션이 남아있다면 rollback 후 닫는다
+            await holder.finish(commit=False)
 
-            # TODO: 상태 코드를 사용해서 rollback 처리하는건 좋지 않아보임.
-            # 예외처리 핸들러에서 가로채지는 예외를 어떻게 미들웨어에서 사용할 수 있는지 고민해봐야함.
-            if response.status_code >= 400:
-                db.rollback()
+    async def _dispatch_serializable(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """
+        SERIALIZABLE 트랜잭션으로 요청을 실행하는 함수
+
+        요청을 재실행할 수 있도록 body 를 미리 읽어두고, 응답은 commit 이 끝날 때까지 버퍼링합니다.
+        엔드포인트 실행 또는 commit 중 직렬화 실패(40001/40P01)가 발생하면 backoff 후 재실행하고,
+        최대 재시도 횟수를 넘으면 409 를 응답합니다. 재시도 횟수는 라우트 별로 집계합니다.
+        """
+        body = await _read_body(receive)
+
+        for attempt in range(settings.SERIALIZABLE_MAX_RETRIES + 1):
+            holder = RequestSession(isolation_level="SERIALIZABLE")
+            scope.setdefault("state", {})["db"] = holder
+            messages: List[Message] = []
+
+            async def buffer_send(message: Message) -> None:
+                messages.append(message)
+
+            try:
+                await self.app(scope, _replay_receive(body), buffer_send)
+            except Exception as e:
+                if not is_serialization_failure(e):
+                    raise
+                metrics.counters.increment("serializable.retries", _route_path(scope))
+                logger.info("직렬화 실패로 요청을 재실행합니다. (attempt=%s)", attempt + 1)
             else:
-                db.commit()
-            return response
-        finally:
-            db.close()  # 무조건 세션 닫아줌
+                for message in messages:
+                    await send(message)
+                return
+            finally:
+                await holder.finish(commit=False)
+
+            if attempt < settings.SERIALIZABLE_MAX_RETRIES:
+                await asyncio.sleep(
+                    backoff_delay(
+                        attempt,
+                        settings.SERIALIZABLE_BACKOFF_BASE_MS,
+                        settings.SERIALIZABLE_BACKOFF_MAX_MS,
+                    )
+                )
+
+        metrics.counters.increment("serializable.exhausted", _route_path(scope))
+        response = JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={"detail": "다른 요청과 충돌했습니다. 잠시 후 다시 시도해주세요."},
+        )
+        await response(scope, receive, send)
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay_receive(body: bytes) -> Receive:
+    sent = False
+
+    async def receive() -> Message:
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return receive
+
+
+def _read_your_writes_send(send: Send) -> Send:
+    """
+    성공한(2xx, 3xx) 응답에 read-your-writes cookie 를 추가하는 send 를 반환하는 함수
+    """
+
+    async def wrapped(message: Message) -> None:
+        if message["type"] == "http.response.start" and message["status"] < 400:
+            cookie = read_your_writes_cookie(settings.READ_YOUR_WRITES_SECONDS)
+            message = {
+                **message,
+                "headers": [*message.get("headers", []), (b"set-cookie", cookie)],
+            }
+        await send(message)
+
+    return wrapped
+
+
+def _route_path(scope: Scope) -> str:
+    # 라우터가 매칭한 경로 템플릿(/reservations/{reservation_id}/confirm)을 사용해 id 별로 흩어지지 않도록 한다
+    route = scope.get("route")
+    return getattr(route, "path", scope["path"])
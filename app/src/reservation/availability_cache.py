@@ -0,0 +1,135 @@
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Tuple
+
+from app.src.config import settings
+from app.src.reservation.utils.slot import count_slots
+
+ONE_DAY = timedelta(days=1)
+SLOTS_PER_DAY = count_slots(datetime.min, datetime.min + ONE_DAY)
+
+
+class AvailabilityCache:
+    """
+    일자별 슬롯 예약 인원(확정 기준)을 프로세스 메모리에 보관하는 LRU 캐시
+
+    - 예약 가능 시간 조회는 캐시된 일자를 재사용하고, 없는 일자만 DB 에서 집계함
+    - 확정 인원이 바뀌는 쓰기(확정/취소/수정)가 commit 되면 해당 예약이 걸친 일자만 무효화함
+    - 무효화 이전에 시작한 조회 결과는 저장하지 않도록 일자별 generation 을 비교함
+    - 사용 메모리가 max_bytes 를 넘으면 오래 사용하지 않은 일자부터 제거함
+    - 다른 프로세스의 변경은 무효화 알림으로 반영되며, 알림을 놓친 경우에 대비해 ttl 이 지나면 다시 조회함
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._days: "OrderedDict[date, Tuple[array, float]]" = OrderedDict()
+        self._generations: Dict[date, int] = defaultdict(int)
+        self._flushes = 0
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def generation(self, day: date) -> int:
+        # 일자별 무효화 횟수와 전체 flush 횟수는 모두 증가만 하므로, 합이 같다면 그 사이 무효화되지 않은 것
+        with self._lock:
+            return self._generations[day] + self._flushes
+
+    def generations(self, start: datetime, end: datetime) -> Tuple[int, ...]:
+        """
+        [start, end) 구간이 걸친 일자들의 generation 을 반환한다.
+        """
+        day = start.date()
+        generations = []
+        with self._lock:
+            while datetime.combine(day, datetime.min.time()) < end:
+                generations.append(self._generations[day] + self._flushes)
+                day += ONE_DAY
+        return tuple(generations)
+
+    def get(self, day: date) -> array | None:
+        with self._lock:
+            item = self._days.get(day)
+            if item is not None and item[1] <= time.monotonic():
+                self._remove(day)
+                item = None
+
+            if item is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._days.move_to_end(day)
+            return item[0]
+
+    def put(
+        self,
+        day: date,
+        usages: array,
+        generation: int,
+    ) -> None:
+        """
+        일자의 슬롯 예약 인원을 저장한다.
+        조회를 시작한 이후 해당 일자가 무효화되었다면(generation 변경) 저장하지 않는다.
+        """
+        with self._lock:
+            if self._generations[day] + self._flushes != generation:
+                return
+            self._remove(day)
+            self._days[day] = (usages, time.monotonic() + self.ttl_seconds)
+            self._bytes += sys.getsizeof(usages)
+            while self._bytes > self.max_bytes and self._days:
+                self._remove(next(iter(self._days)))
+
+    def invalidate(self, start: datetime, end: datetime) -> None:
+        """
+        [start, end) 구간이 걸친 일자를 무효화한다.
+        """
+        day = start.date()
+        with self._lock:
+            while datetime.combine(day, datetime.min.time()) < end:
+                self._generations[day] += 1
+                self._remove(day)
+                day += ONE_DAY
+
+    def flush(self) -> None:
+        """
+        모든 일자를 무효화한다. 진행 중인 조회 결과도 저장되지 않는다.
+        """
+        with self._lock:
+            self._flushes += 1
+            self._days.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float | int]:
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / requests if requests else 0.0,
+                "days": len(self._days),
+                "bytes": self._bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._days.clear()
+            self._generations.clear()
+            self._flushes = 0
+            self._bytes = 0
+            self.hits = self.misses = 0
+
+    def _remove(self, day: date) -> None:
+        item = self._days.pop(day, None)
+        if item is not None:
+            self._bytes -= sys.getsizeof(item[0])
+
+
+availability_cache = AvailabilityCache(
+    settings.AVAILABILITY_CACHE_MAX_BYTES, settings.AVAILABILITY_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,215 @@
+import csv
+import json
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, Callable, Dict, List, Tuple
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from app.src.config.database import SessionLocal
+from app.src.reservation import repository as reservation_repository
+from app.src.reservation.dto.request.create_reservation_request import (
+    CreateReservationRequest,
+)
+from app.src.reservation.dto.response.import_reservations_response import (
+    ImportReservationResult,
+    ImportReservationsSummary,
+)
+from app.src.reservation.model import ReservationStatus
+from app.src.reservation.utils.constants import (
+    BULK_IMPORT_BATCH_SIZE,
+    BULK_IMPORT_SPOOL_MAX_BYTES,
+)
+from app.src.reservation.utils.slot import count_slots, to_slot_index
+from app.src.reservation.utils.slot_occupancy import SlotOccupancy
+
+CSV_CONTENT_TYPES = ("text/csv",)
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl")
+
+Row = Tuple[int, CreateReservationRequest]
+READ_CHUNK_BYTES = 64 * 1024
+
+
+async def spool(
+    chunks: AsyncIterator[bytes], max_memory_bytes: int = BULK_IMPORT_SPOOL_MAX_BYTES
+) -> SpooledTemporaryFile:
+    """
+    요청 본문을 끝까지 읽어 임시 파일에 보관하는 함수
+
+    - 응답 스트리밍이 시작되면 ASGI spec 2.4 미만 서버에서는 disconnect 감지를 위해 receive 를 계속 호출하고,
+      이때 받은 본문 메시지는 버려지므로 응답을 시작하기 전에 본문을 모두 읽어야 함
+    - max_memory_bytes 를 넘는 본문은 디스크에 기록됨
+    """
+    file = SpooledTemporaryFile(max_size=max_memory_bytes)
+    try:
+        async for chunk in chunks:
+            file.write(chunk)
+    except BaseException:
+        file.close()
+        raise
+    file.seek(0)
+    return file
+
+
+async def iter_spooled(file: SpooledTemporaryFile) -> AsyncIterator[bytes]:
+    """
+    spool 로 보관한 본문을 chunk 단위로 읽고, 모두 읽으면 임시 파일을 닫는 함수
+    """
+    try:
+        while chunk := file.read(READ_CHUNK_BYTES):
+            yield chunk
+    finally:
+        file.close()
+
+
+async def import_reservations(
+    user_id: int,
+    content_type: str,
+    chunks: AsyncIterator[bytes],
+    batch_size: int = BULK_IMPORT_BATCH_SIZE,
+) -> AsyncIterator[str]:
+    """
+    CSV / NDJSON 으로 전달된 예약들을 읽는 대로 검증해 일괄 등록하고, 행 별 결과를 NDJSON 으로 반환하는 함수
+
+    - 형식 오류, 입력 검증 오류는 발견되는 즉시 반환함
+    - 검증된 행은 batch 단위로 모아, batch 구간 전체의 슬롯 예약 가능 인원을 한 번만 조회해 정원을 검사함
+    - 정원 안에 들어오는 행은 multi-row insert 로 등록하고 batch 마다 commit 함
+      (요청 세션은 응답이 시작될 때 종료되므로 batch 마다 별도 세션을 사용하며, 중간에 실패해도 이전 batch 는 유지됨)
+    - 마지막 줄에는 등록/실패 건수를 반환함
+    """
+    parse = _csv_parser() if content_type in CSV_CONTENT_TYPES else _parse_ndjson
+
+    created_count = failed_count = 0
+    batch: List[Row] = []
+
+    line = 0
+    async for text in _iter_lines(chunks):
+        line += 1
+        if not text.strip():
+            continue
+
+        try:
+            row = parse(text)
+            if row is None:
+                continue
+            batch.append((line, CreateReservationRequest(**row)))
+        except (ValueError, TypeError) as e:
+            failed_count += 1
+            yield _to_line(
+                ImportReservationResult(line=line, created=False, detail=_error_detail(e))
+            )
+            continue
+
+        if len(batch) >= batch_size:
+            for result in await run_in_threadpool(_import_batch, user_id, batch):
+                created_count += result.created
+                failed_count += not result.created
+                yield _to_line(result)
+            batch = []
+
+    if batch:
+        for result in await run_in_threadpool(_import_batch, user_id, batch):
+            created_count += result.created
+            failed_count += not result.created
+            yield _to_line(result)
+
+    yield _to_line(
+        ImportReservationsSummary(created_count=created_count, failed_count=failed_count)
+    )
+
+
+def _import_batch(user_id: int, batch: List[Row]) -> List[ImportReservationResult]:
+    """
+    batch 구간의 확정된 예약 인원을 한 번에 집계해 행 별 정원을 검사하고, 통과한 행을 한 번에 등록하는 함수
+    등록되는 예약은 대기 상태이므로 서로의 정원에 영향을 주지 않는다.
+    """
+    db = SessionLocal()
+    try:
+        start = min(request.start for _, request in batch)
+        end = max(request.end for _, request in batch)
+        capacities = SlotOccupancy.from_usages(
+            start,
+            end,
+            reservation_repository.find_slot_usages(
+                db, start, end, [ReservationStatus.CONFIRMED]
+            ),
+        ).capacities
+
+        results: Dict[int, ImportReservationResult] = {}
+        accepted: List[Row] = []
+        for line, request in batch:
+            slot_start = to_slot_index(start, request.start)
+            slot_end = slot_start + count_slots(request.start, request.end)
+            if min(capacities[slot_start:slot_end]) < request.number_of_people:
+                results[line] = ImportReservationResult(
+                    line=line, created=False, detail="예약 가능 인원을 초과했습니다."
+                )
+            else:
+                accepted.append((line, request))
+
+        reservation_ids = reservation_repository.create_all(
+            db, [request.toModel(user_id) for _, request in accepted]
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    for (line, _), reservation_id in zip(accepted, reservation_ids):
+        results[line] = ImportReservationResult(
+            line=line, created=True, reservation_id=reservation_id
+        )
+    return [results[line] for line, _ in batch]
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace").rstrip("\r")
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace").rstrip("\r")
+
+
+def _parse_ndjson(text: str) -> Dict:
+    row = json.loads(text)
+    if not isinstance(row, dict):
+        raise ValueError("각 행은 JSON 객체여야 합니다.")
+    return row
+
+
+def _csv_parser() -> Callable[[str], Dict | None]:
+    """
+    첫 번째 행을 header 로 사용하는 CSV 행 parser 를 반환하는 함수
+    header 행은 None 을 반환하고, 이후 행은 header 를 key 로 하는 dict 를 반환한다.
+    """
+    header: List[str] = []
+
+    def parse(text: str) -> Dict | None:
+        values = next(csv.reader([text]))
+        if not header:
+            header.extend(value.strip() for value in values)
+            return None
+        if len(values) != len(header):
+            raise ValueError("header 와 컬럼 개수가 일치하지 않습니다.")
+        return dict(zip(header, values))
+
+    return parse
+
+
+def _error_detail(error: ValueError | TypeError) -> str:
+    if not isinstance(error, ValidationError):
+        return str(error)
+
+    details = []
+    for e in error.errors():
+        field = ".".join(str(loc) for loc in e["loc"])
+        details.append(f"{field}: {e['msg']}" if field else e["msg"])
+    return "; ".join(details)
+
+
+def _to_line(result) -> str:
+    return result.model_dump_json() + "\n"
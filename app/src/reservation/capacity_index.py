@@ -0,0 +1,199 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.src.config.database import SessionLocal, XactSnapshot, current_snapshot
+from app.src.reservation import repository as reservation_repository
+from app.src.reservation.model import Reservation, ReservationStatus
+from app.src.reservation.utils.constants import CAPACITY_INDEX_HORIZON_DAYS
+from app.src.reservation.utils.segment_tree import MinSegmentTree
+from app.src.reservation.utils.slot import count_slots, to_slot_index
+from app.src.reservation.utils.slot_occupancy import SlotOccupancy
+
+logger = logging.getLogger(__name__)
+
+
+class CapacityIndex:
+    """
+    예약 가능 기간 전체의 슬롯별 예약 가능 인원을 프로세스 메모리에 유지하는 인덱스
+
+    - segment tree 를 통해 "[start, end) 구간에서 n명을 수용할 수 있는가"를 O(log 슬롯 수)에 판단함
+    - 확정된 예약만 반영하며, 예약 상태 변경이 commit 된 이후에 갱신됨
+    - 다른 프로세스의 변경은 변경 알림을 받은 이후에 반영되므로, 판단 결과는 DB 검증의 보조 수단으로만 사용해야 함
+    - 재생성 중(begin_build ~ build)에 반영된 변경은 따로 모아 두었다가, 재생성에 사용한 snapshot 에 포함되지 않은 변경만
+      새 인덱스로 교체할 때 다시 반영함(변경을 commit 한 트랜잭션 ID 로 판단)
+    """
+
+    def __init__(self, horizon_days: int = CAPACITY_INDEX_HORIZON_DAYS):
+        self.horizon_days = horizon_days
+        self._lock = threading.Lock()
+        self._tree: MinSegmentTree | None = None
+        self._origin: datetime | None = None
+        self._end: datetime | None = None
+        self._pending: List[Tuple[datetime, datetime, int, int | None]] | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._tree is not None
+
+    @property
+    def stale(self) -> bool:
+        """인덱스를 생성한 이후 날짜가 바뀌어, 인덱스 범위가 예약 가능 기간을 모두 포함하지 못하는 상태"""
+        origin = self._origin
+        return origin is not None and origin.date() < datetime.today().date()
+
+    def begin_build(self) -> None:
+        """
+        재생성에 사용할 예약을 조회하기 전에 호출해, 조회 이후 반영되는 변경을 모으기 시작한다.
+        """
+        with self._lock:
+            self._pending = []
+
+    def cancel_build(self) -> None:
+        with self._lock:
+            self._pending = None
+
+    def build(
+        self,
+        origin: datetime,
+        reservations: List[Reservation],
+        snapshot: XactSnapshot | None = None,
+    ) -> None:
+        end = origin + timedelta(days=self.horizon_days)
+        occupancy = SlotOccupancy(origin, end)
+        for reservation in reservations:
+            if reservation.status != ReservationStatus.CONFIRMED:
+                continue
+            occupancy.add(
+                reservation.start_time,
+                reservation.end_time,
+                reservation.number_of_people,
+            )
+
+        tree = MinSegmentTree(occupancy.capacities)
+        with self._lock:
+            # 예약을 조회하는 동안 기존 인덱스에만 반영된 변경 중, 조회 결과에 포함되지 않은 변경을 새 인덱스에 반영한다
+            for start, end_time, value, xact_id in self._pending or ():
+                if (
+                    snapshot is not None
+                    and xact_id is not None
+                    and snapshot.visible(xact_id)
+                ):
+                    continue
+                tree.range_add(
+                    to_slot_index(origin, start), count_slots(origin, end_time), value
+                )
+            self._pending = None
+            self._tree, self._origin, self._end = tree, origin, end
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._tree, self._origin, self._end = None, None, None
+
+    def reserve(
+        self,
+        start: datetime,
+        end: datetime,
+        number_of_people: int,
+        xact_id: int | None = None,
+    ) -> None:
+        self._add(start, end, -number_of_people, xact_id)
+
+    def release(
+        self,
+        start: datetime,
+        end: datetime,
+        number_of_people: int,
+        xact_id: int | None = None,
+    ) -> None:
+        self._add(start, end, number_of_people, xact_id)
+
+    def fits(self, start: datetime, end: datetime, number_of_people: int) -> bool | None:
+        """
+        구간 내 모든 슬롯이 예약 인원을 수용할 수 있는지 반환한다.
+        인덱스가 준비되지 않았거나 인덱스 범위를 벗어나는 구간이라면 None 을 반환한다.
+        """
+        with self._lock:
+            if not self._covers(start, end):
+                return None
+            return (
+                self._tree.range_min(
+                    to_slot_index(self._origin, start),
+                    count_slots(self._origin, end),
+                )
+                >= number_of_people
+            )
+
+    def _add(
+        self, start: datetime, end: datetime, value: int, xact_id: int | None
+    ) -> None:
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((start, end, value, xact_id))
+            if self._tree is None:
+                return
+            self._tree.range_add(
+                to_slot_index(self._origin, start),
+                count_slots(self._origin, end),
+                value,
+            )
+
+    def _covers(self, start: datetime, end: datetime) -> bool:
+        return (
+            self._tree is not None
+            and self._origin <= start
+            and end <= self._end
+            and start < end
+        )
+
+
+capacity_index = CapacityIndex()
+_rebuild_lock = threading.Lock()
+
+
+def rebuild(db: Session) -> None:
+    """
+    오늘 0시부터 인덱스 범위까지의 확정된 예약을 조회해 인덱스를 다시 생성하는 함수
+    """
+    origin = datetime.combine(datetime.today(), datetime.min.time())
+    capacity_index.begin_build()
+    try:
+        # snapshot 과 예약 조회가 같은 시점을 보도록 하나의 REPEATABLE READ 트랜잭션에서 조회한다
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        snapshot = current_snapshot(db)
+        reservations = reservation_repository.find_all_by_range_and_status(
+            db,
+            origin,
+            origin + timedelta(days=capacity_index.horizon_days),
+            [ReservationStatus.CONFIRMED],
+            False,
+        )
+    except Exception:
+        capacity_index.cancel_build()
+        raise
+    capacity_index.build(origin, reservations, snapshot)
+
+
+def rebuild_in_background() -> None:
+    """
+    인덱스와 DB 의 판단이 어긋난 경우, 별도 세션으로 인덱스를 다시 생성하는 함수
+    이미 재생성 중이라면 중복으로 실행하지 않는다.
+    """
+    if not _rebuild_lock.acquire(blocking=False):
+        return
+
+    def _rebuild():
+        db = SessionLocal()
+        try:
+            rebuild(db)
+        except Exception:
+            logger.exception("슬롯 용량 인덱스 재생성에 실패했습니다.")
+            capacity_index.invalidate()
+        finally:
+            db.close()
+            _rebuild_lock.release()
+
+    threading.Thread(target=_rebuild, daemon=True).start()
@@ -0,0 +1,64 @@
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.src.config import settings
+from app.src.config.database import current_xact_id
+from app.src.config.invalidation import notify_chunks
+from app.src.reservation import capacity_index as capacity_index_module
+from app.src.reservation.availability_cache import availability_cache
+from app.src.reservation.capacity_index import capacity_index
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "reservation_changes"
+
+# (시작 시간, 종료 시간, 잔여 인원 변화량), 확정이면 음수, 취소/수정으로 반납하면 양수
+Change = Tuple[datetime, datetime, int]
+
+
+def publish(db: Session, changes: List[Change]) -> None:
+    """
+    확정 인원 변경을 다른 프로세스에 알리는 함수
+    현재 트랜잭션에서 NOTIFY 하므로 commit 된 변경만 전달되며, 현재 프로세스의 캐시는 commit 이후 작업으로 갱신된다.
+    슬롯 용량 인덱스가 재생성 중 중복 반영하지 않도록 트랜잭션 ID 를 함께 전달한다.
+    """
+    if not settings.INVALIDATION_BUS_ENABLED or not changes:
+        return
+    notify_chunks(
+        db,
+        CHANNEL,
+        "changes",
+        [[start.isoformat(), end.isoformat(), delta] for start, end, delta in changes],
+        {"xact_id": current_xact_id(db)},
+    )
+
+
+def apply(payload: Dict[str, Any]) -> None:
+    """
+    다른 프로세스에서 commit 된 확정 인원 변경을 프로세스 내 캐시에 반영하는 함수
+
+    - 예약 가능 시간 조회 캐시는 변경 구간이 걸친 일자를 무효화함
+    - 슬롯 용량 인덱스는 변화량을 그대로 반영함
+    """
+    xact_id = payload.get("xact_id")
+    for start, end, delta in payload["changes"]:
+        start, end = datetime.fromisoformat(start), datetime.fromisoformat(end)
+        availability_cache.invalidate(start, end)
+        if delta < 0:
+            capacity_index.reserve(start, end, -delta, xact_id)
+        else:
+            capacity_index.release(start, end, delta, xact_id)
+
+
+def reset() -> None:
+    """
+    변경 알림을 놓쳤을 수 있을 때(수신 connection 재연결 등) 프로세스 내 캐시를 모두 비우는 함수
+    """
+    logger.info("예약 변경 알림을 놓쳤을 수 있어 캐시를 비웁니다.")
+    availability_cache.flush()
+    if settings.CAPACITY_INDEX_ENABLED:
+        capacity_index.invalidate()
+        capacity_index_module.rebuild_in_background()
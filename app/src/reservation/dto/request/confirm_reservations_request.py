@@ -0,0 +1,15 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from app.src.reservation.utils.constants import MAX_BATCH_CONFIRM_SIZE
+
+
+class ConfirmReservationsRequest(BaseModel):
+    reservation_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_CONFIRM_SIZE,
+        description="확정할 예약 ID 목록",
+        example=[1, 2, 3],
+    )
@@ -8,7 +8,6 @@ from app.src.reservation.utils.model_validator import (
     validate_reservation_date_format,
     validate_reservation_datetime,
 )
-from app.src.user.model import User
 
 
 class CreateReservationRequest(BaseModel):
@@ -34,9 +33,9 @@ class CreateReservationRequest(BaseModel):
         validate_reservation_datetime(self.start, self.end)
         return self
 
-    def toModel(self, user: User) -> Reservation:
+    def toModel(self, user_id: int) -> Reservation:
         return Reservation(
-            user_id=user.id,
+            user_id=user_id,
             start_time=self.start,
             end_time=self.end,
             number_of_people=self.number_of_people,
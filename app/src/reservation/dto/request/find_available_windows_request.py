@@ -0,0 +1,33 @@
+from pydantic import Field, model_validator
+
+from app.src.reservation.dto.request.get_available_schedule_request import (
+    GetAvailableScheduleRequest,
+)
+from app.src.reservation.utils.constants import (
+    MAX_CAPACITY,
+    MAX_WINDOW_LIMIT,
+    MIN_RESERVATION_MINUTES,
+    SLOT_MINUTES,
+)
+
+
+class FindAvailableWindowsRequest(GetAvailableScheduleRequest):
+    duration: int = Field(
+        ..., ge=MIN_RESERVATION_MINUTES, description="예약 시간(분)", example=60
+    )
+    number_of_people: int = Field(
+        ge=1, le=MAX_CAPACITY, description="예약 인원 수", example=1
+    )
+    limit: int = Field(
+        default=3,
+        ge=1,
+        le=MAX_WINDOW_LIMIT,
+        description="조회할 예약 가능 구간 개수",
+        example=3,
+    )
+
+    @model_validator(mode="after")
+    def validate_duration(self):
+        if self.duration % SLOT_MINUTES != 0:
+            raise ValueError("예약 시간은 10분 단위로 입력해야 합니다.")
+        return self
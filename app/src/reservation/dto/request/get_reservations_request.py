@@ -1,8 +1,9 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 from app.src.reservation.utils.constants import DATE_FORMAT
+from app.src.reservation.utils.cursor import Cursor, decode_cursor
 from app.src.reservation.utils.model_validator import validate_reservation_date_format
 
 
@@ -15,6 +16,12 @@ class GetReservationsRequest(BaseModel):
     end: datetime = Field(
         ..., description="조회 종료 일자(YYYY-MM-DD)", example="2025-05-01"
     )
+    cursor: str | None = Field(
+        default=None,
+        description="다음 페이지 cursor(이전 응답의 X-Next-Cursor header), 지정하면 page 는 무시됨",
+    )
+
+    _after: Cursor | None = PrivateAttr(default=None)
 
     @field_validator("start", "end", mode="before")
     @classmethod
@@ -29,4 +36,12 @@ class GetReservationsRequest(BaseModel):
 
         self.end = datetime.combine(self.end, datetime.max.time())
 
+        if self.cursor is not None:
+            self._after = decode_cursor(self.cursor)
+
         return self
+
+    @property
+    def after(self) -> Cursor | None:
+        """cursor 로 전달된 마지막 조회 예약의 (start_time, id)"""
+        return self._after
@@ -28,10 +28,11 @@ class UpdateReservationRequest(BaseModel):
         example=1,
     )
 
-    @classmethod
     @field_validator("start", "end", mode="before")
-    def validate_datetime_format(cls, value: str) -> str:
-        validate_reservation_date_format(value, DATETIME_FORMAT)
+    @classmethod
+    def validate_datetime_format(cls, value: str | None) -> str | None:
+        if value is not None:
+            validate_reservation_date_format(value, DATETIME_FORMAT)
         return value
 
     @model_validator(mode="after")
@@ -0,0 +1,13 @@
+from typing import List
+from pydantic import BaseModel
+
+
+class ConfirmReservationResult(BaseModel):
+    reservation_id: int
+    confirmed: bool
+    detail: str | None = None
+
+
+class ConfirmReservationsResponse(BaseModel):
+    confirmed_count: int
+    results: List[ConfirmReservationResult]
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class ImportReservationResult(BaseModel):
+    line: int
+    created: bool
+    reservation_id: int | None = None
+    detail: str | None = None
+
+
+class ImportReservationsSummary(BaseModel):
+    created_count: int
+    failed_count: int
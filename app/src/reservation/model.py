@@ -1,8 +1,19 @@
 import enum
-from sqlalchemy import Column, ForeignKey, Integer, DateTime, Enum, String
+from sqlalchemy import (
+    Column,
+    Computed,
+    ForeignKey,
+    Index,
+    Integer,
+    DateTime,
+    Enum,
+    String,
+)
+from sqlalchemy.dialects.postgresql import TSRANGE
 from sqlalchemy.orm import relationship
 
 from app.src.common.model import BaseTable
+from app.src.config.database import Base
 
 
 class ReservationStatus(str, enum.Enum):
@@ -22,5 +33,34 @@ class Reservation(BaseTable):
     reservation_name = Column(String, nullable=False)
     number_of_people = Column(Integer, nullable=False)
     status = Column(Enum(ReservationStatus), default=ReservationStatus.PENDING)
+    # 예약 구간 [start_time, end_time), 구간 겹침(&&) 조회 시 GiST 인덱스를 사용하기 위한 컬럼
+    period = Column(
+        TSRANGE,
+        Computed("tsrange(start_time, end_time, '[)')", persisted=True),
+        nullable=False,
+    )
+
+    # 낙관적 lock 을 위한 버전, 변경 시 이전 버전을 조건으로 update 하고 1 증가함
+    version = Column(Integer, nullable=False, server_default="1")
 
     user = relationship("User")
+
+    __table_args__ = (
+        Index("ix_reservations_period", period, postgresql_using="gist"),
+        # 예약 목록의 (start_time, id) 정렬, cursor 조회용 인덱스
+        Index("ix_reservations_start_time_id", start_time, id),
+        Index("ix_reservations_user_id_start_time_id", user_id, start_time, id),
+    )
+    __mapper_args__ = {"version_id_col": version}
+
+
+class SlotCapacity(Base):
+    """
+    10분 슬롯 단위의 잔여 예약 가능 인원 ledger
+    확정된 예약 인원만큼 차감된 값을 유지하며, 예약 확정/취소/수정 시 함께 갱신됩니다.
+    """
+
+    __tablename__ = "slot_capacity"
+
+    slot_start = Column(DateTime, primary_key=True)
+    remaining = Column(Integer, nullable=False)
@@ -1,9 +1,25 @@
 import datetime
-from typing import List
-from sqlalchemy.orm import Session
+from typing import Dict, List
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    Row,
+    and_,
+    column,
+    func,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Query, Session
 
-from app.src.reservation.model import Reservation, ReservationStatus
-from app.src.user.model import User
+from app.src.common.token import Principal
+from app.src.reservation.model import Reservation, ReservationStatus, SlotCapacity
+from app.src.reservation.utils.constants import ADVISORY_LOCK_NAMESPACE, MAX_CAPACITY
+from app.src.reservation.utils.cursor import Cursor
+from app.src.reservation.utils.slot import SLOT_DELTA
 
 
 def create(db: Session, reservation: Reservation) -> Reservation:
@@ -14,6 +30,33 @@ def create(db: Session, reservation: Reservation) -> Reservation:
     return reservation
 
 
+def create_all(db: Session, reservations: List[Reservation]) -> List[int]:
+    """
+    예약들을 multi-row insert 로 한 번에 등록하고, 입력 순서대로 생성된 ID 를 반환한다.
+    """
+    if len(reservations) == 0:
+        return []
+
+    return list(
+        db.scalars(
+            insert(Reservation).returning(
+                Reservation.id, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    "user_id": reservation.user_id,
+                    "start_time": reservation.start_time,
+                    "end_time": reservation.end_time,
+                    "reservation_name": reservation.reservation_name,
+                    "number_of_people": reservation.number_of_people,
+                    "status": ReservationStatus.PENDING,
+                }
+                for reservation in reservations
+            ],
+        )
+    )
+
+
 def find_by_id(db: Session, reservation_id: int, lock: bool = False) -> Reservation:
     query = db.query(Reservation).filter(Reservation.id == reservation_id)
     if lock:
@@ -21,42 +64,73 @@ def find_by_id(db: Session, reservation_id: int, lock: bool = False) -> Reservat
     return query.first()
 
 
-def find_all_by_date_and_page(
-    db: Session, start: datetime, end: datetime, page: int, limit: int
-) -> List[Reservation]:
+def find_version_by_id(db: Session, reservation_id: int) -> Row | None:
+    # 예약 상세 조회의 ETag 확인용으로, 예약 row 전체를 불러오지 않고 필요한 컬럼만 조회한다
     return (
+        db.query(Reservation.user_id, Reservation.version, Reservation.updated_at)
+        .filter(Reservation.id == reservation_id)
+        .first()
+    )
+
+
+def find_all_by_ids(
+    db: Session, reservation_ids: List[int], lock: bool = False
+) -> List[Reservation]:
+    # 여러 예약에 lock 을 거는 경우 항상 id 순서로 획득해 교착 상태를 방지한다
+    query = (
         db.query(Reservation)
-        .filter(
-            Reservation.start_time.between(start, end),
-            Reservation.end_time.between(start, end),
-        )
-        .order_by(Reservation.start_time.asc())
-        .offset((page - 1) * limit)
-        .limit(limit)
-        .all()
+        .filter(Reservation.id.in_(reservation_ids))
+        .order_by(Reservation.id.asc())
+    )
+    if lock:
+        query = query.with_for_update()
+    return query.all()
+
+
+def find_all_by_date_and_page(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    page: int,
+    limit: int,
+    after: Cursor | None = None,
+) -> List[Reservation]:
+    query = db.query(Reservation).filter(
+        Reservation.start_time.between(start, end),
+        Reservation.end_time.between(start, end),
     )
+    return _paginate(query, page, limit, after).all()
 
 
 def find_all_by_user_and_date_and_page(
     db: Session,
-    user: User,
+    user: Principal,
     start: datetime,
     end: datetime,
     page: int,
     limit: int,
+    after: Cursor | None = None,
 ) -> List[Reservation]:
-    return (
-        db.query(Reservation)
-        .filter(
-            Reservation.user_id == user.id,
-            Reservation.start_time.between(start, end),
-            Reservation.end_time.between(start, end),
-        )
-        .order_by(Reservation.start_time.asc())
-        .offset((page - 1) * limit)
-        .limit(limit)
-        .all()
+    query = db.query(Reservation).filter(
+        Reservation.user_id == user.id,
+        Reservation.start_time.between(start, end),
+        Reservation.end_time.between(start, end),
     )
+    return _paginate(query, page, limit, after).all()
+
+
+def _paginate(query: Query, page: int, limit: int, after: Cursor | None) -> Query:
+    """
+    (start_time, id) 순으로 정렬해 한 페이지를 조회하는 query 를 반환한다.
+    cursor(after)가 있다면 offset 대신 (start_time, id) > after 조건으로 이어서 조회하므로,
+    (start_time, id) 인덱스를 따라 읽어 페이지 깊이와 관계없이 limit 개만 읽는다.
+    """
+    query = query.order_by(Reservation.start_time.asc(), Reservation.id.asc())
+    if after is not None:
+        query = query.filter(tuple_(Reservation.start_time, Reservation.id) > after)
+    else:
+        query = query.offset((page - 1) * limit)
+    return query.limit(limit)
 
 
 def find_all_by_range_and_status(
@@ -66,9 +140,12 @@ def find_all_by_range_and_status(
     status: List[ReservationStatus],
     lock: bool,
 ) -> List[Reservation]:
+    """
+    [start, end) 구간과 겹치는 예약을 조회한다.
+    구간 경계에 걸쳐있는 예약도 포함되며, period 컬럼의 GiST 인덱스를 사용한다.
+    """
     query = db.query(Reservation).filter(
-        Reservation.start_time.between(start, end),
-        Reservation.end_time.between(start, end),
+        Reservation.period.overlaps(func.tsrange(start, end, "[)")),
         Reservation.status.in_(status),
     )
 
@@ -76,3 +153,174 @@ def find_all_by_range_and_status(
         query = query.with_for_update()
 
     return query.all()
+
+
+def find_slot_usages(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    status: List[ReservationStatus],
+) -> List[int]:
+    """
+    [start, end) 구간의 10분 슬롯별 예약 인원 합계를 시작 시간 순으로 조회한다.
+    슬롯 생성과 합계 계산을 하나의 쿼리로 처리해, 예약 데이터를 애플리케이션으로 가져오지 않는다.
+    """
+    slot_usage = _slot_usage_query(start, end, status)
+    return [row.used for row in db.execute(slot_usage.order_by("slot_start")).all()]
+
+
+def find_first_violated_slot(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    number_of_people: int,
+    status: List[ReservationStatus],
+) -> datetime.datetime | None:
+    """
+    [start, end) 구간에서 예약 인원을 추가하면 정원을 초과하는 첫 번째 슬롯의 시작 시간을 조회한다.
+    정원을 초과하는 슬롯이 없다면 None 을 반환한다.
+    """
+    slot_usage = _slot_usage_query(start, end, status).subquery()
+    return db.execute(
+        select(slot_usage.c.slot_start)
+        .where(slot_usage.c.used > MAX_CAPACITY - number_of_people)
+        .order_by(slot_usage.c.slot_start)
+        .limit(1)
+    ).scalar()
+
+
+def _slot_usage_query(
+    start: datetime, end: datetime, status: List[ReservationStatus]
+):
+    slot = (
+        func.generate_series(start, end - SLOT_DELTA, SLOT_DELTA)
+        .table_valued(column("slot_start", DateTime))
+        .render_derived(name="slot")
+    )
+
+    return (
+        select(
+            slot.c.slot_start,
+            func.coalesce(func.sum(Reservation.number_of_people), 0).label("used"),
+        )
+        .select_from(
+            slot.outerjoin(
+                Reservation,
+                and_(
+                    Reservation.period.overlaps(
+                        func.tsrange(
+                            slot.c.slot_start, slot.c.slot_start + SLOT_DELTA, "[)"
+                        )
+                    ),
+                    Reservation.status.in_(status),
+                ),
+            )
+        )
+        .group_by(slot.c.slot_start)
+    )
+
+
+def find_slot_capacities(
+    db: Session, start: datetime, end: datetime, lock: bool = False
+) -> List[SlotCapacity]:
+    query = (
+        db.query(SlotCapacity)
+        .filter(
+            SlotCapacity.slot_start >= start,
+            SlotCapacity.slot_start < end,
+        )
+        .order_by(SlotCapacity.slot_start.asc())
+    )
+
+    if lock:
+        query = query.with_for_update()
+
+    return query.all()
+
+
+def create_slot_capacities(db: Session, slot_capacities: List[SlotCapacity]) -> None:
+    if len(slot_capacities) == 0:
+        return
+
+    # 동시에 같은 슬롯을 생성하는 경우 먼저 생성된 값을 유지한다
+    db.execute(
+        insert(SlotCapacity)
+        .values(
+            [
+                {"slot_start": slot.slot_start, "remaining": slot.remaining}
+                for slot in slot_capacities
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=[SlotCapacity.slot_start])
+    )
+
+
+def decrease_slot_capacity(
+    db: Session, start: datetime, end: datetime, number_of_people: int
+) -> int:
+    """
+    잔여 인원이 충분한 슬롯만 차감하고, 차감된 슬롯 개수를 반환한다.
+    반환값이 구간의 슬롯 개수보다 작다면 정원을 초과한 슬롯이 존재한다는 의미이다.
+    """
+    result = db.execute(
+        update(SlotCapacity)
+        .where(
+            SlotCapacity.slot_start >= start,
+            SlotCapacity.slot_start < end,
+            SlotCapacity.remaining >= number_of_people,
+        )
+        .values(remaining=SlotCapacity.remaining - number_of_people)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def decrease_slot_capacities(
+    db: Session, decreases: Dict[datetime.datetime, int]
+) -> int:
+    """
+    슬롯별로 서로 다른 인원을 한 번의 update 로 차감하고, 차감된 슬롯 개수를 반환한다.
+    잔여 인원이 부족한 슬롯은 차감하지 않으므로, 반환값이 요청한 슬롯 개수보다 작다면 정원을 초과한 슬롯이 존재한다는 의미이다.
+    """
+    if len(decreases) == 0:
+        return 0
+
+    amounts = values(
+        column("slot_start", DateTime), column("amount", Integer), name="amounts"
+    ).data(list(decreases.items()))
+    result = db.execute(
+        update(SlotCapacity)
+        .where(
+            SlotCapacity.slot_start == amounts.c.slot_start,
+            SlotCapacity.remaining >= amounts.c.amount,
+        )
+        .values(remaining=SlotCapacity.remaining - amounts.c.amount)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def increase_slot_capacity(
+    db: Session, start: datetime, end: datetime, number_of_people: int
+) -> int:
+    result = db.execute(
+        update(SlotCapacity)
+        .where(
+            SlotCapacity.slot_start >= start,
+            SlotCapacity.slot_start < end,
+        )
+        .values(remaining=SlotCapacity.remaining + number_of_people)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def lock_slot_stripes(db: Session, stripe_keys: List[int]) -> None:
+    """
+    stripe 단위 advisory lock 을 key 오름차순으로 획득한다.
+    모든 트랜잭션이 같은 순서로 lock 을 획득하므로 교착 상태가 발생하지 않으며, lock 은 트랜잭션 종료 시 해제된다.
+    """
+    for stripe_key in sorted(stripe_keys):
+        db.execute(
+            select(func.pg_advisory_xact_lock(ADVISORY_LOCK_NAMESPACE, stripe_key))
+        )
@@ -1,13 +1,40 @@
 from typing import Annotated, List
-from fastapi import APIRouter, Body, Depends, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.src.config.database import get_db_from_request
+from app.src.common import etag as etag_util
+from app.src.config import settings
+from app.src.config.database import (
+    RequestSession,
+    get_db_from_request,
+    is_replica_session,
+    run_with_session,
+    run_with_session_and_compute,
+)
+from app.src.config.replica import read_from_replica
 from app.src.middleware.authenticate import authenticate_admin, authenticate_user
+from app.src.reservation.dto.request.confirm_reservations_request import (
+    ConfirmReservationsRequest,
+)
 from app.src.reservation.dto.request.create_reservation_request import (
     CreateReservationRequest,
 )
+from app.src.reservation import bulk_import
 from app.src.reservation import service as reservation_service
+from app.src.reservation.dto.request.find_available_windows_request import (
+    FindAvailableWindowsRequest,
+)
 from app.src.reservation.dto.request.get_available_schedule_request import (
     GetAvailableScheduleRequest,
 )
@@ -17,81 +44,234 @@ from app.src.reservation.dto.request.get_reservations_request import (
 from app.src.reservation.dto.request.update_reservation_request import (
     UpdateReservationRequest,
 )
+from app.src.reservation.dto.response.confirm_reservations_response import (
+    ConfirmReservationsResponse,
+)
 from app.src.reservation.dto.response.get_available_schedule_response import (
     GetAvailableScheduleResponse,
 )
 from app.src.reservation.dto.response.reservation_response import ReservationResponse
-from app.src.user.model import User
+from app.src.reservation.utils.cursor import next_cursor
+from app.src.common.token import Principal
 
 
 router = APIRouter(prefix="/reservations", tags=["reservations"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.get("", response_model=List[ReservationResponse])
-def get_reservations(
-    user: Annotated[User, Depends(authenticate_user)],
+@read_from_replica
+async def get_reservations(
+    user: Annotated[Principal, Depends(authenticate_user)],
     request: Annotated[GetReservationsRequest, Query()],
-    db: Session = Depends(get_db_from_request),
+    response: Response,
+    db: Session | AsyncSession = Depends(get_db_from_request),
 ) -> List[ReservationResponse]:
-    result = reservation_service.find_all_by_date(db, user, request)
-    return [ReservationResponse.from_model(reservation) for reservation in result]
+    """
+    예약 목록 조회 API
+    다음 페이지가 있다면 X-Next-Cursor header 로 cursor 를 반환하며, cursor 로 조회하면 페이지 깊이와 관계없이 일정한 속도로 조회됩니다.
+    """
+    reservations = await run_with_session(
+        db,
+        lambda session: [
+            ReservationResponse.from_model(reservation)
+            for reservation in reservation_service.find_all_by_date(
+                session, user, request
+            )
+        ],
+    )
+
+    cursor = next_cursor(reservations, request.limit)
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+    return reservations
 
 
 @router.get("/schedules", response_model=List[GetAvailableScheduleResponse])
-def get_available_schedules(
-    user: Annotated[User, Depends(authenticate_user)],
+@read_from_replica
+async def get_available_schedules(
+    user: Annotated[Principal, Depends(authenticate_user)],
     request: Annotated[GetAvailableScheduleRequest, Query()],
-    db: Session = Depends(get_db_from_request),
+    http_request: Request,
+    response: Response,
+    db: Session | AsyncSession = Depends(get_db_from_request),
 ) -> List[GetAvailableScheduleResponse]:
-    return reservation_service.find_available_schedules(db, request)
+    async def find_schedules(
+        session: Session | AsyncSession,
+    ) -> List[GetAvailableScheduleResponse]:
+        # 세션 작업에서는 슬롯별 예약 인원만 조회하고, 응답 계산은 이벤트 루프 밖에서 실행한다
+        return await run_with_session_and_compute(
+            session,
+            lambda sync_session: reservation_service.find_schedule_usages(
+                sync_session, request
+            ),
+            lambda usages: reservation_service.to_available_schedules(request, usages),
+        )
+
+    async def find_shared() -> List[GetAvailableScheduleResponse]:
+        # 공유되는 실행은 먼저 들어온 요청이 취소되어도 계속되므로, 요청 세션 대신 별도의 세션을 사용한다
+        holder = RequestSession(read_only=True)
+        try:
+            return await find_schedules(holder.get(replica=is_replica_session(db)))
+        finally:
+            await holder.finish(commit=False)
+
+    # ETag 는 조회 전에 확인한 일자별 generation 으로 생성한다
+    key = reservation_service.available_schedules_key(db, request)
+    etag = reservation_service.available_schedules_etag(key)
+    if etag is not None and etag_util.matches(http_request, etag):
+        return etag_util.not_modified(etag)
+
+    # 같은 구간을 동시에 조회하는 요청은 먼저 들어온 요청의 실행 결과를 공유한다
+    if not settings.SCHEDULES_SINGLE_FLIGHT_ENABLED:
+        schedules = await find_schedules(db)
+    else:
+        schedules = await reservation_service.schedules_flight.do(key, find_shared)
+
+    # 조회 중 해당 일자가 무효화되었다면 결과가 어느 generation 의 값인지 알 수 없으므로 ETag 를 응답하지 않는다
+    if etag is not None and reservation_service.available_schedules_key(db, request) == key:
+        response.headers[etag_util.ETAG_HEADER] = etag
+    return schedules
+
+
+@router.get("/schedules/windows", response_model=List[GetAvailableScheduleResponse])
+async def find_available_windows(
+    user: Annotated[Principal, Depends(authenticate_user)],
+    request: Annotated[FindAvailableWindowsRequest, Query()],
+    db: Session | AsyncSession = Depends(get_db_from_request),
+) -> List[GetAvailableScheduleResponse]:
+    return await run_with_session_and_compute(
+        db,
+        lambda session: reservation_service.find_window_usages(session, request),
+        lambda usages: reservation_service.to_available_windows(request, usages),
+    )
 
 
 @router.get("/{reservation_id}", response_model=ReservationResponse)
-def get_reservation(
-    user: Annotated[User, Depends(authenticate_user)],
+@read_from_replica
+async def get_reservation(
+    user: Annotated[Principal, Depends(authenticate_user)],
     reservation_id: int,
-    db: Session = Depends(get_db_from_request),
+    http_request: Request,
+    response: Response,
+    db: Session | AsyncSession = Depends(get_db_from_request),
 ) -> ReservationResponse:
-    result = reservation_service.find_by_id(db, user, reservation_id)
-    return ReservationResponse.from_model(result)
+    # If-None-Match 가 있다면 version 과 수정 시각만 조회해 변경되지 않은 예약은 304 를 응답한다
+    if http_request.headers.get("if-none-match"):
+        etag = await run_with_session(
+            db,
+            lambda session: reservation_service.find_etag_by_id(
+                session, user, reservation_id
+            ),
+        )
+        if etag_util.matches(http_request, etag):
+            return etag_util.not_modified(etag)
+
+    def find(session: Session) -> ReservationResponse:
+        reservation = reservation_service.find_by_id(session, user, reservation_id)
+        response.headers[etag_util.ETAG_HEADER] = reservation_service.reservation_etag(
+            reservation.id, reservation.version, reservation.updated_at
+        )
+        return ReservationResponse.from_model(reservation)
+
+    return await run_with_session(db, find)
 
 
 @router.post("", response_model=ReservationResponse)
-def create_reservation(
-    user: Annotated[User, Depends(authenticate_user)],
+async def create_reservation(
+    user: Annotated[Principal, Depends(authenticate_user)],
     request: Annotated[CreateReservationRequest, Body()],
-    db: Session = Depends(get_db_from_request),
+    db: Session | AsyncSession = Depends(get_db_from_request),
 ) -> ReservationResponse:
-    result = reservation_service.create_reservation(db, user, request)
-    return ReservationResponse.from_model(result)
+    return await run_with_session(
+        db,
+        lambda session: ReservationResponse.from_model(
+            reservation_service.create_reservation(session, user, request)
+        ),
+    )
+
+
+@router.post("/import")
+async def import_reservations(
+    user: Annotated[Principal, Depends(authenticate_user)],
+    request: Request,
+) -> StreamingResponse:
+    """
+    예약 일괄 등록 API
+    CSV(text/csv, 첫 행은 header) 또는 NDJSON(application/x-ndjson) 본문을 임시 파일에 받아 둔 뒤 행 단위로 처리하고,
+    행 별 등록 결과를 NDJSON 으로 스트리밍합니다.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type not in (
+        bulk_import.CSV_CONTENT_TYPES + bulk_import.NDJSON_CONTENT_TYPES
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="text/csv 또는 application/x-ndjson 형식만 지원합니다.",
+        )
+
+    body = await bulk_import.spool(request.stream())
+    return StreamingResponse(
+        bulk_import.import_reservations(
+            user.id, content_type, bulk_import.iter_spooled(body)
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post("/confirm", response_model=ConfirmReservationsResponse)
+async def confirm_reservations(
+    user: Annotated[Principal, Depends(authenticate_admin)],
+    request: Annotated[ConfirmReservationsRequest, Body()],
+    db: Session | AsyncSession = Depends(get_db_from_request),
+) -> ConfirmReservationsResponse:
+    return await run_with_session(
+        db,
+        lambda session: reservation_service.confirm_reservations(session, user, request),
+    )
 
 
 @router.post("/{reservation_id}/confirm", response_model=ReservationResponse)
-def confirm_reservation(
-    user: Annotated[User, Depends(authenticate_admin)],
+async def confirm_reservation(
+    user: Annotated[Principal, Depends(authenticate_admin)],
     reservation_id: int,
-    db: Session = Depends(get_db_from_request),
+    db: Session | AsyncSession = Depends(get_db_from_request),
 ) -> ReservationResponse:
-    result = reservation_service.confirm_reservation(db, user, reservation_id)
-    return ReservationResponse.from_model(result)
+    return await run_with_session(
+        db,
+        lambda session: ReservationResponse.from_model(
+            reservation_service.confirm_reservation(session, user, reservation_id)
+        ),
+    )
 
 
 @router.post("/{reservation_id}/cancel", response_model=ReservationResponse)
-def cancel_reservation(
-    user: Annotated[User, Depends(authenticate_user)],
+async def cancel_reservation(
+    user: Annotated[Principal, Depends(authenticate_user)],
     reservation_id: int,
-    db: Session = Depends(get_db_from_request),
+    db: Session | AsyncSession = Depends(get_db_from_request),
 ) -> ReservationResponse:
-    result = reservation_service.cancel_reservation(db, user, reservation_id)
-    return ReservationResponse.from_model(result)
+    return await run_with_session(
+        db,
+        lambda session: ReservationResponse.from_model(
+            reservation_service.cancel_reservation(session, user, reservation_id)
+        ),
+    )
 
 
 @router.patch("/{reservation_id}", response_model=ReservationResponse)
-def update_reservation(
-    user: Annotated[User, Depends(authenticate_user)],
+async def update_reservation(
+    user: Annotated[Principal, Depends(authenticate_user)],
     reservation_id: int,
     request: Annotated[UpdateReservationRequest, Body()],
-    db: Session = Depends(get_db_from_request),
+    db: Session | AsyncSession = Depends(get_db_from_request),
 ) -> ReservationResponse:
-    result = reservation_service.update_reservation(db, user, reservation_id, request)
-    return ReservationResponse.from_model(result)
+    return await run_with_session(
+        db,
+        lambda session: ReservationResponse.from_model(
+            reservation_service.update_reservation(
+                session, user, reservation_id, request
+            )
+        ),
+    )
@@ -1,12 +1,24 @@
 import datetime
-from typing import List
+import logging
+import time
+from array import array
+from collections import deque
+from typing import Callable, Hashable, List, Sequence, Tuple, TypeVar
 from fastapi import HTTPException, status
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
 
+from app.src.reservation.dto.request.confirm_reservations_request import (
+    ConfirmReservationsRequest,
+)
 from app.src.reservation.dto.request.create_reservation_request import (
     CreateReservationRequest,
 )
+from app.src.reservation.dto.request.find_available_windows_request import (
+    FindAvailableWindowsRequest,
+)
 from app.src.reservation.dto.request.get_available_schedule_request import (
     GetAvailableScheduleRequest,
 )
@@ -16,35 +28,98 @@ from app.src.reservation.dto.request.get_reservations_request import (
 from app.src.reservation.dto.request.update_reservation_request import (
     UpdateReservationRequest,
 )
+from app.src.reservation.dto.response.confirm_reservations_response import (
+    ConfirmReservationResult,
+    ConfirmReservationsResponse,
+)
 from app.src.reservation.dto.response.get_available_schedule_response import (
     GetAvailableScheduleResponse,
 )
+from app.src.config import settings
+from app.src.common import metrics
+from app.src.common.etag import make_etag
+from app.src.common.retry import backoff_delay
+from app.src.common.single_flight import SingleFlight
+from app.src.config.invalidation import ORIGIN
+from app.src.config.database import (
+    count_after_commit,
+    current_xact_id,
+    discard_after_commit,
+    is_replica_session,
+    run_after_commit,
+    sleep_in_session,
+)
+from app.src.reservation import capacity_index as capacity_index_module
+from app.src.reservation import changes as reservation_changes
+from app.src.reservation.availability_cache import (
+    ONE_DAY,
+    SLOTS_PER_DAY,
+    availability_cache,
+)
 from app.src.reservation import repository as reservation_repository
-from app.src.reservation.model import Reservation, ReservationStatus
-from app.src.reservation.utils.constants import (
-    MAX_CAPACITY,
-    SLOT_MINUTES,
+from app.src.reservation.capacity_index import capacity_index
+from app.src.reservation.model import Reservation, ReservationStatus, SlotCapacity
+from app.src.reservation.utils import slot as slot_util
+from app.src.reservation.utils.constants import SLOT_MINUTES
+from app.src.reservation.utils.segment_tree import MinSegmentTree
+from app.src.reservation.utils.slot_occupancy import SlotOccupancy
+from app.src.common.token import Principal
+from app.src.user.model import Role
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 동시에 들어온 같은 예약 가능 시간 조회를 하나의 실행으로 묶음
+schedules_flight: SingleFlight[List[GetAvailableScheduleResponse]] = SingleFlight(
+    "reservation.schedules"
 )
-from app.src.user.model import Role, User
 
 
 def find_all_by_date(
-    db: Session, user: User, request: GetReservationsRequest
+    db: Session, user: Principal, request: GetReservationsRequest
 ) -> List[Reservation]:
     if user.role == Role.ADMIN:
         return reservation_repository.find_all_by_date_and_page(
-            db, request.start, request.end, request.page, request.limit
+            db, request.start, request.end, request.page, request.limit, request.after
         )
 
     return reservation_repository.find_all_by_user_and_date_and_page(
-        db, user, request.start, request.end, request.page, request.limit
+        db,
+        user,
+        request.start,
+        request.end,
+        request.page,
+        request.limit,
+        request.after,
     )
 
 
 def find_by_id(
-    db: Session, user: User, reservation_id: int, lock: bool = False
+    db: Session, user: Principal, reservation_id: int, lock: bool = False
 ) -> Reservation:
     reservation = reservation_repository.find_by_id(db, reservation_id, lock)
+    _validate_readable(user, reservation)
+    return reservation
+
+
+def find_etag_by_id(db: Session, user: Principal, reservation_id: int) -> str:
+    """
+    예약 상세 조회의 ETag 를 반환하는 함수
+    If-None-Match 확인용으로, 예약 row 전체를 불러오지 않고 version 과 수정 시각만 조회한다.
+    """
+    row = reservation_repository.find_version_by_id(db, reservation_id)
+    _validate_readable(user, row)
+    return reservation_etag(reservation_id, row.version, row.updated_at)
+
+
+def reservation_etag(
+    reservation_id: int, version: int, updated_at: datetime.datetime
+) -> str:
+    return make_etag("reservation", reservation_id, version, updated_at.isoformat())
+
+
+def _validate_readable(user: Principal, reservation: Reservation | Row | None) -> None:
     if not reservation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -57,184 +132,707 @@ def find_by_id(
             detail="조회할 수 없는 예약 정보입니다.",
         )
 
-    return reservation
-
 
 def find_available_schedules(
     db: Session, request: GetAvailableScheduleRequest
 ) -> List[GetAvailableScheduleResponse]:
-    reservations = reservation_repository.find_all_by_range_and_status(
-        db, request.start, request.end, [ReservationStatus.CONFIRMED], False
+    return to_available_schedules(request, find_schedule_usages(db, request))
+
+
+def find_schedule_usages(
+    db: Session, request: GetAvailableScheduleRequest
+) -> Sequence[int]:
+    """
+    예약 가능 시간 조회 구간의 슬롯별 확정 예약 인원을 일자별 캐시와 DB 에서 조회하는 함수
+    """
+    return _find_cached_slot_usages(db, request.start, request.end)
+
+
+def to_available_schedules(
+    request: GetAvailableScheduleRequest, usages: Sequence[int]
+) -> List[GetAvailableScheduleResponse]:
+    """
+    슬롯별 확정 예약 인원으로 예약 가능 시간을 계산하는 함수
+    DB 를 사용하지 않으므로 세션 작업과 분리해 worker thread 에서 실행할 수 있다.
+    """
+    occupancy = SlotOccupancy.from_usages(request.start, request.end, usages)
+    return _merge_schedules(occupancy)
+
+
+def available_schedules_key(
+    db: Session, request: GetAvailableScheduleRequest
+) -> Hashable:
+    """
+    예약 가능 시간 조회를 묶는 key 를 반환하는 함수
+
+    - 조회 구간이 걸친 일자의 generation 을 포함해, 실행 중에 commit 된 변경 이후 들어온 요청은 새로 조회함
+    - replica 에서 조회한 결과는 primary 로 조회해야 하는 요청과 공유하지 않음
+    """
+    return (
+        request.start,
+        request.end,
+        is_replica_session(db),
+        availability_cache.generations(request.start, request.end),
     )
 
-    schedules = _generate_slots_with_reservation(
-        start=request.start,
-        end=request.end,
-        reservations=reservations,
+
+def available_schedules_etag(key: Hashable) -> str | None:
+    """
+    예약 가능 시간 조회의 ETag 를 반환하는 함수
+
+    - 조회 구간 일자별 generation(확정 인원 변경 시 증가하는 version)으로 생성하므로 DB 를 조회하지 않음
+    - generation 은 프로세스마다 따로 증가하므로 프로세스 식별값을 포함해, 다른 프로세스의 ETag 와 일치하지 않도록 함
+    - 캐시에는 primary 에서 집계한 값만 저장되므로, 같은 generation 의 응답은 같은 primary 데이터로 만들어짐
+    - 다른 프로세스의 변경 알림을 받지 않거나(INVALIDATION_BUS_ENABLED=false), replica 에서 조회하는 경우
+      generation 이 조회 결과보다 앞설 수 있으므로 생성하지 않음
+    """
+    start, end, replica, generations = key
+    if replica or not settings.INVALIDATION_BUS_ENABLED:
+        return None
+    return make_etag("schedules", ORIGIN, start.isoformat(), end.isoformat(), *generations)
+
+
+def find_available_windows(
+    db: Session, request: FindAvailableWindowsRequest
+) -> List[GetAvailableScheduleResponse]:
+    """
+    조회 구간에서 예약 인원을 수용할 수 있는 예약 시간 길이의 구간을, 시작 시간이 빠른 순으로 최대 limit 개 반환하는 함수
+    """
+    return to_available_windows(request, find_window_usages(db, request))
+
+
+def find_window_usages(
+    db: Session, request: FindAvailableWindowsRequest
+) -> Sequence[int]:
+    return _find_slot_usages(db, request.start, request.end)
+
+
+def to_available_windows(
+    request: FindAvailableWindowsRequest, usages: Sequence[int]
+) -> List[GetAvailableScheduleResponse]:
+    """
+    슬롯별 확정 예약 인원으로 예약 가능한 구간을 찾는 함수
+    DB 를 사용하지 않으므로 세션 작업과 분리해 worker thread 에서 실행할 수 있다.
+    """
+    occupancy = SlotOccupancy.from_usages(request.start, request.end, usages)
+    # 예약은 현재 시점으로부터 3일 이후, 180일 이내에 시작해야 한다
+    now = datetime.datetime.now()
+    return _find_available_windows(
+        occupancy,
+        request.duration // SLOT_MINUTES,
+        request.number_of_people,
+        request.limit,
+        min_start=now + datetime.timedelta(days=3),
+        max_start=now + datetime.timedelta(days=180),
     )
-    return _merge_schedules(schedules)
 
 
 def create_reservation(
-    db: Session, user: User, request: CreateReservationRequest
+    db: Session, user: Principal, request: CreateReservationRequest
 ) -> Reservation:
     _validate_reservation_datetime(
         db, request.start, request.end, request.number_of_people
     )
 
-    return reservation_repository.create(db, request.toModel(user))
+    return reservation_repository.create(db, request.toModel(user.id))
+
+
+def confirm_reservation(db: Session, user: Principal, reservation_id: int) -> Reservation:
+    return _run_with_lock_mode(
+        db, lambda lock: _confirm_reservation(db, user, reservation_id, lock)
+    )
 
 
-def confirm_reservation(db: Session, user: User, reservation_id: int) -> Reservation:
-    reservation = find_by_id(db, user, reservation_id, True)
+def _confirm_reservation(
+    db: Session, user: Principal, reservation_id: int, lock: bool
+) -> Reservation:
+    reservation = find_by_id(db, user, reservation_id, lock)
     _validate_reservation_status(user, reservation)
 
-    _validate_reservation_datetime(
-        db,
-        reservation.start_time,
-        reservation.end_time,
-        reservation.number_of_people,
-        True,
-    )
+    if reservation.status != ReservationStatus.CONFIRMED:
+        _reserve_slot_capacity(
+            db,
+            reservation.start_time,
+            reservation.end_time,
+            reservation.number_of_people,
+        )
     reservation.status = ReservationStatus.CONFIRMED
     return reservation
 
 
+def confirm_reservations(
+    db: Session, user: Principal, request: ConfirmReservationsRequest
+) -> ConfirmReservationsResponse:
+    return _run_with_lock_mode(
+        db, lambda lock: _confirm_reservations(db, user, request.reservation_ids, lock)
+    )
+
+
+def _confirm_reservations(
+    db: Session, user: Principal, reservation_ids: List[int], lock: bool
+) -> ConfirmReservationsResponse:
+    """
+    여러 예약을 하나의 트랜잭션에서 일괄 확정하는 함수
+
+    - 예약들을 한 번에 조회하고, 모든 예약을 포함하는 구간의 ledger 를 한 번만 lock/조회함
+    - 시작 시간 순으로 잔여 인원을 차감해가며 정원 안에 들어오는 예약만 확정하고, 나머지는 사유와 함께 반환함
+    - 확정된 예약들의 인원은 슬롯별로 합산해 한 번의 update 로 ledger 에 반영함
+    """
+    reservation_ids = list(dict.fromkeys(reservation_ids))
+    reservations = {
+        reservation.id: reservation
+        for reservation in reservation_repository.find_all_by_ids(
+            db, reservation_ids, lock
+        )
+    }
+
+    results = {}
+    pending = []
+    for reservation_id in reservation_ids:
+        reservation = reservations.get(reservation_id)
+        if reservation is None:
+            results[reservation_id] = ConfirmReservationResult(
+                reservation_id=reservation_id,
+                confirmed=False,
+                detail="존재하지 않는 예약입니다.",
+            )
+            continue
+
+        _validate_reservation_status(user, reservation)
+        if reservation.status == ReservationStatus.CONFIRMED:
+            results[reservation_id] = ConfirmReservationResult(
+                reservation_id=reservation_id, confirmed=True
+            )
+        else:
+            pending.append(reservation)
+
+    if pending:
+        confirmed_ids = {
+            reservation.id
+            for reservation in _reserve_batch_slot_capacity(db, pending)
+        }
+        for reservation in pending:
+            if reservation.id in confirmed_ids:
+                reservation.status = ReservationStatus.CONFIRMED
+                results[reservation.id] = ConfirmReservationResult(
+                    reservation_id=reservation.id, confirmed=True
+                )
+            else:
+                results[reservation.id] = ConfirmReservationResult(
+                    reservation_id=reservation.id,
+                    confirmed=False,
+                    detail="예약 가능 인원을 초과했습니다.",
+                )
+
+    return ConfirmReservationsResponse(
+        confirmed_count=sum(result.confirmed for result in results.values()),
+        results=[results[reservation_id] for reservation_id in reservation_ids],
+    )
+
+
+def _reserve_batch_slot_capacity(
+    db: Session, reservations: List[Reservation]
+) -> List[Reservation]:
+    """
+    여러 예약이 차지하는 슬롯의 잔여 인원을 시작 시간 순으로 차감하고, 정원 안에 들어온 예약들을 반환하는 함수
+
+    - 전체 구간의 잔여 인원을 segment tree 로 구성해 예약마다 O(log n) 으로 검사/차감함
+    - lock 을 걸지 않는 방식에서 그 사이 다른 요청이 잔여 인원을 차감했다면 409 예외 발생(요청 트랜잭션은 rollback 됨)
+    """
+    reservations = sorted(
+        reservations, key=lambda reservation: (reservation.start_time, reservation.id)
+    )
+    origin = reservations[0].start_time
+    end = max(reservation.end_time for reservation in reservations)
+
+    capacities = MinSegmentTree(_lock_slot_capacity(db, origin, end))
+    decreases = [0] * (capacities.size + 1)
+    confirmed = []
+    for reservation in reservations:
+        slot_start = slot_util.to_slot_index(origin, reservation.start_time)
+        slot_end = slot_start + slot_util.count_slots(
+            reservation.start_time, reservation.end_time
+        )
+        if capacities.range_min(slot_start, slot_end) < reservation.number_of_people:
+            continue
+
+        capacities.range_add(slot_start, slot_end, -reservation.number_of_people)
+        decreases[slot_start] += reservation.number_of_people
+        decreases[slot_end] -= reservation.number_of_people
+        confirmed.append(reservation)
+
+    slot_decreases = {}
+    amount = 0
+    for idx in range(capacities.size):
+        amount += decreases[idx]
+        if amount > 0:
+            slot_decreases[origin + idx * slot_util.SLOT_DELTA] = amount
+
+    updated = reservation_repository.decrease_slot_capacities(db, slot_decreases)
+    if updated < len(slot_decreases):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="다른 요청과 충돌했습니다. 잠시 후 다시 시도해주세요.",
+        )
+
+    xact_id = current_xact_id(db)
+    for reservation in confirmed:
+        run_after_commit(
+            db,
+            lambda reservation=reservation: capacity_index.reserve(
+                reservation.start_time,
+                reservation.end_time,
+                reservation.number_of_people,
+                xact_id,
+            ),
+        )
+        run_after_commit(
+            db,
+            lambda reservation=reservation: availability_cache.invalidate(
+                reservation.start_time, reservation.end_time
+            ),
+        )
+    reservation_changes.publish(
+        db,
+        [
+            (reservation.start_time, reservation.end_time, -reservation.number_of_people)
+            for reservation in confirmed
+        ],
+    )
+    return confirmed
+
+
 def update_reservation(
-    db: Session, user: User, reservation_id: int, request: UpdateReservationRequest
+    db: Session, user: Principal, reservation_id: int, request: UpdateReservationRequest
+) -> Reservation:
+    return _run_with_lock_mode(
+        db, lambda lock: _update_reservation(db, user, reservation_id, request, lock)
+    )
+
+
+def _update_reservation(
+    db: Session,
+    user: Principal,
+    reservation_id: int,
+    request: UpdateReservationRequest,
+    lock: bool,
 ) -> Reservation:
-    reservation = find_by_id(db, user, reservation_id, True)
+    reservation = find_by_id(db, user, reservation_id, lock)
     _validate_reservation_status(user, reservation)
 
     number_of_people = request.number_of_people or reservation.number_of_people
     start = request.start or reservation.start_time
     end = request.end or reservation.end_time
 
-    update_data = request.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(reservation, key, value)
-    reservation.number_of_people = 0
-    db.flush()
+    # 확정된 예약이라면 기존 인원을 ledger 에 반납한 뒤, 변경된 구간/인원으로 다시 차감한다
+    # 기존/변경 구간을 먼저 slot_start 순서로 lock 해, 서로의 구간으로 예약을 옮기는 요청 간 교착 상태를 방지한다
+    if reservation.status == ReservationStatus.CONFIRMED:
+        _lock_slot_capacity_ranges(
+            db, [(reservation.start_time, reservation.end_time), (start, end)]
+        )
+        _release_slot_capacity(
+            db,
+            reservation.start_time,
+            reservation.end_time,
+            reservation.number_of_people,
+        )
+        _reserve_slot_capacity(db, start, end, number_of_people)
+    else:
+        _validate_reservation_datetime(db, start, end, number_of_people)
 
-    _validate_reservation_datetime(db, start, end, number_of_people)
+    # 요청 필드명(start, end)은 컬럼명과 다르므로, ledger 에 반영한 구간/인원을 그대로 저장한다
+    reservation.start_time = start
+    reservation.end_time = end
     reservation.number_of_people = number_of_people
 
     return reservation
 
 
-def cancel_reservation(db: Session, user: User, reservation_id: int) -> Reservation:
-    reservation = find_by_id(db, user, reservation_id)
+def cancel_reservation(db: Session, user: Principal, reservation_id: int) -> Reservation:
+    return _run_with_lock_mode(
+        db, lambda lock: _cancel_reservation(db, user, reservation_id, lock)
+    )
+
+
+def _cancel_reservation(
+    db: Session, user: Principal, reservation_id: int, lock: bool
+) -> Reservation:
+    reservation = find_by_id(db, user, reservation_id, lock)
     _validate_reservation_status(user, reservation)
 
+    if reservation.status == ReservationStatus.CONFIRMED:
+        _release_slot_capacity(
+            db,
+            reservation.start_time,
+            reservation.end_time,
+            reservation.number_of_people,
+        )
     reservation.status = ReservationStatus.CANCELLED
     return reservation
 
 
+def _run_with_lock_mode(db: Session, operation: Callable[[bool], T]) -> T:
+    """
+    예약 lock 방식에 따라 예약 변경 작업을 실행하는 함수
+
+    - row / advisory: 예약 row 를 select for update 로 조회해 한 번 실행함
+    - serializable: lock 없이 한 번 실행함. 충돌은 DB 가 직렬화 실패로 감지하고 미들웨어가 요청을 재실행함
+    - optimistic: lock 없이 savepoint 안에서 실행하고, 예약 version 이 다른 요청에 의해 바뀌었다면(StaleDataError)
+      savepoint 를 rollback 한 뒤 지수 backoff 만큼 대기 후 재시도함
+    - 최대 재시도 횟수를 넘으면 409 예외 발생
+    """
+    if settings.RESERVATION_LOCK_MODE == settings.LockMode.SERIALIZABLE:
+        return operation(False)
+    if settings.RESERVATION_LOCK_MODE != settings.LockMode.OPTIMISTIC:
+        return operation(True)
+
+    for attempt in range(settings.OPTIMISTIC_MAX_RETRIES + 1):
+        registered = count_after_commit(db)
+        savepoint = db.begin_nested()
+        try:
+            result = operation(False)
+            savepoint.commit()
+            return result
+        except StaleDataError:
+            savepoint.rollback()
+            discard_after_commit(db, registered)
+            logger.info("예약 version 충돌로 재시도합니다. (attempt=%s)", attempt + 1)
+        except Exception:
+            savepoint.rollback()
+            discard_after_commit(db, registered)
+            raise
+
+        if attempt < settings.OPTIMISTIC_MAX_RETRIES:
+            sleep_in_session(
+                db,
+                backoff_delay(
+                    attempt,
+                    settings.OPTIMISTIC_BACKOFF_BASE_MS,
+                    settings.OPTIMISTIC_BACKOFF_MAX_MS,
+                ),
+            )
+
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="다른 요청과 충돌했습니다. 잠시 후 다시 시도해주세요.",
+    )
+
+
 def _validate_reservation_datetime(
     db: Session,
     start: datetime,
     end: datetime,
     number_of_people: int,
-    lock: bool = False,
 ):
     """
     해당 시간 대에서 5만명이 넘는지 검사하는 함수
 
     - 동일한 구간에 시험이 치뤄지는 경우, 예약 가능 인원을 초과하는지 검사
-    - 예약하려는 시간대와 겹치는 예약 전체 조회
-    - 각 예약을 10분 단위의 슬롯으로 나눠서 구간 별로 5만명이 초과하는지 검사함
-    - 이 조회 데이터는 검증 후 5만명이 초과되는 상황 방지를 위해 update lock 을 통해 관리될 수 있음(db.commit 이전까지)
+    - 프로세스 내 슬롯 용량 인덱스가 예약 가능하다고 판단하면 DB 조회 없이 통과함
+    - 인덱스가 예약 불가로 판단했거나 판단할 수 없는 경우, DB 에서 정원을 초과하는 첫 번째 슬롯만 조회함
+    - 정원을 초과하는 슬롯이 존재한다면 예외 발생
     """
-    reservations = reservation_repository.find_all_by_range_and_status(
-        db,
-        start,
-        end,
-        [ReservationStatus.PENDING, ReservationStatus.CONFIRMED],
-        lock,
+    indexed = None
+    if settings.CAPACITY_INDEX_ENABLED:
+        if capacity_index.stale:
+            capacity_index_module.rebuild_in_background()
+
+        indexed = capacity_index.fits(start, end, number_of_people)
+        if indexed and not settings.CAPACITY_INDEX_VERIFY:
+            return
+
+    violated_slot = reservation_repository.find_first_violated_slot(
+        db, start, end, number_of_people, [ReservationStatus.CONFIRMED]
     )
+    exceeded = violated_slot is not None
 
-    # 슬롯별로 누적된 예약 수를 가져온다
-    schedules = _generate_slots_with_reservation(start, end, reservations)
+    # 인덱스와 DB 의 판단이 다르다면 DB 를 기준으로 처리하고, 인덱스는 다시 생성한다
+    if indexed is not None and indexed == exceeded:
+        logger.warning(
+            "슬롯 용량 인덱스가 DB 와 일치하지 않습니다. (start=%s, end=%s)", start, end
+        )
+        capacity_index_module.rebuild_in_background()
 
     # 슬롯 중 하나라도 5만명 초과되는지 체크
-    for schedule in schedules:
-        if schedule.available_capacity - number_of_people < 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="예약 가능 인원을 초과했습니다.",
-            )
+    if exceeded:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="예약 가능 인원을 초과했습니다.",
+        )
 
 
-def _generate_slots_with_reservation(
-    start: datetime,
-    end: datetime,
-    reservations: List[Reservation],
+def _reserve_slot_capacity(
+    db: Session, start: datetime, end: datetime, number_of_people: int
+) -> None:
+    """
+    예약 구간의 슬롯 잔여 인원을 차감하는 함수
+
+    - 잔여 인원이 충분한 슬롯만 차감하는 조건부 update 로 처리해, 동시 요청에서도 5만명을 초과하지 않음
+    - 차감 전 구간에 lock 을 걸어, 겹치는 구간을 동시에 확정할 때 교착 상태를 방지함
+    - 차감된 슬롯 수가 구간의 슬롯 수보다 작다면 예외 발생(요청 트랜잭션은 rollback 됨)
+    - 슬롯 용량 인덱스는 commit 이후에 갱신되고, 다른 프로세스에는 commit 시점에 변경 알림이 전달됨
+    """
+    _lock_slot_capacity(db, start, end)
+
+    updated = reservation_repository.decrease_slot_capacity(
+        db, start, end, number_of_people
+    )
+    if updated < slot_util.count_slots(start, end):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="예약 가능 인원을 초과했습니다.",
+        )
+
+    xact_id = current_xact_id(db)
+    run_after_commit(
+        db, lambda: capacity_index.reserve(start, end, number_of_people, xact_id)
+    )
+    run_after_commit(db, lambda: availability_cache.invalidate(start, end))
+    reservation_changes.publish(db, [(start, end, -number_of_people)])
+
+
+def _lock_slot_capacity(db: Session, start: datetime, end: datetime) -> List[int]:
+    """
+    예약 구간의 잔여 인원을 다른 트랜잭션이 동시에 차감하지 못하도록 lock 을 걸고, 슬롯별 잔여 인원을 반환하는 함수
+
+    - row: 구간이 차지하는 ledger 슬롯을 시작 시간 순으로 select for update 함
+    - advisory: 구간이 걸치는 stripe(기본 1일) 단위 advisory lock 을 key 순으로 획득함
+      ledger row 가 아직 없는 구간도 보호되며, 다른 stripe 의 확정 요청과는 경합하지 않음
+    - optimistic: lock 을 걸지 않음. 정원 초과는 조건부 차감이, 동시 상태 변경은 예약 version 비교가 막아줌
+    - serializable: lock 을 걸지 않음. 같은 ledger row 를 동시에 변경하는 트랜잭션은 DB 가 직렬화 실패로 중단시킴
+    """
+    if settings.RESERVATION_LOCK_MODE in (
+        settings.LockMode.OPTIMISTIC,
+        settings.LockMode.SERIALIZABLE,
+    ):
+        return _find_slot_capacities(db, start, end)
+
+    if settings.RESERVATION_LOCK_MODE == settings.LockMode.ADVISORY:
+        reservation_repository.lock_slot_stripes(
+            db,
+            slot_util.generate_stripe_keys(
+                start, end, settings.ADVISORY_LOCK_STRIPE_MINUTES
+            ),
+        )
+        return _find_slot_capacities(db, start, end)
+
+    return _find_slot_capacities(db, start, end, True)
+
+
+def _lock_slot_capacity_ranges(
+    db: Session, ranges: List[Tuple[datetime.datetime, datetime.datetime]]
+) -> None:
+    """
+    여러 구간의 잔여 인원을 slot_start 순서로 lock 하는 함수, 겹치거나 맞닿은 구간은 하나로 합쳐 lock 한다.
+    """
+    merged: List[Tuple[datetime.datetime, datetime.datetime]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    for start, end in merged:
+        _lock_slot_capacity(db, start, end)
+
+
+def _release_slot_capacity(
+    db: Session, start: datetime, end: datetime, number_of_people: int
+) -> None:
+    """
+    확정된 예약이 취소/수정될 때, 차지하던 슬롯의 잔여 인원을 되돌리는 함수
+    반납 전 구간에 lock 을 걸어, 다른 요청과 같은 순서(slot_start 순)로 row lock 을 획득하도록 한다.
+    """
+    _lock_slot_capacity(db, start, end)
+    reservation_repository.increase_slot_capacity(db, start, end, number_of_people)
+    xact_id = current_xact_id(db)
+    run_after_commit(
+        db, lambda: capacity_index.release(start, end, number_of_people, xact_id)
+    )
+    run_after_commit(db, lambda: availability_cache.invalidate(start, end))
+    reservation_changes.publish(db, [(start, end, number_of_people)])
+
+
+def _find_slot_capacities(
+    db: Session, start: datetime, end: datetime, lock: bool = False
 ) -> List[int]:
     """
-    예약 가능 시간을 반환하는 함수
-    예약 가능 시간 조회는 10분단위 조회가 가능하며,
-    시작/종료 일자 범위를 10분 단위로 나누고, 각 예약이 차지하는 스케줄을 갱신한다.
-    """
-    # 1. 스케줄 객체로 초기화
-    total_minutes = int((end - start).total_seconds() // 60) // SLOT_MINUTES
-    schedules = []
-    for idx in range(total_minutes):
-        slot_start = start + datetime.timedelta(minutes=idx * SLOT_MINUTES)
-        slot_end = slot_start + datetime.timedelta(minutes=SLOT_MINUTES)
-        schedules.append(
-            GetAvailableScheduleResponse(
-                start=slot_start,
-                end=slot_end,
-                available_capacity=MAX_CAPACITY,
-            )
+    예약 구간이 차지하는 슬롯별 잔여 인원을 반환하는 함수
+
+    - ledger 에 아직 생성되지 않은 슬롯은 DB 에서 집계한 확정 예약 인원을 기준으로 잔여 인원을 계산해 생성함
+    - 동시에 같은 슬롯을 생성하는 경우 먼저 생성된 값을 유지하므로, lock 조회 시에는 생성 후 다시 조회함
+    """
+    slot_starts = slot_util.generate_slot_starts(start, end)
+    capacities = {
+        slot.slot_start: slot.remaining
+        for slot in reservation_repository.find_slot_capacities(db, start, end, lock)
+    }
+
+    missing = [slot_start for slot_start in slot_starts if slot_start not in capacities]
+    if missing:
+        occupancy = _find_slot_occupancy(db, start, end)
+        seeded = {
+            occupancy.slot_start(idx): remaining
+            for idx, remaining in enumerate(occupancy.capacities)
+            if occupancy.slot_start(idx) not in capacities
+        }
+        reservation_repository.create_slot_capacities(
+            db,
+            [
+                SlotCapacity(slot_start=slot_start, remaining=remaining)
+                for slot_start, remaining in seeded.items()
+            ],
         )
+        capacities.update(seeded)
 
-    # 2. 예약을 스케줄에 반영
-    for res in reservations:
-        if res.status != ReservationStatus.CONFIRMED:
-            continue
+        if lock:
+            for slot in reservation_repository.find_slot_capacities(
+                db, start, end, lock
+            ):
+                capacities[slot.slot_start] = slot.remaining
 
-        start_diff = (res.start_time - start).total_seconds() // 60
-        end_diff = (res.end_time - start).total_seconds() // 60
+    return [capacities[slot_start] for slot_start in slot_starts]
 
-        start_idx = int(start_diff // SLOT_MINUTES)
-        end_idx = min(len(schedules), int((end_diff + SLOT_MINUTES) // SLOT_MINUTES))
 
-        for idx in range(start_idx, end_idx):
-            schedules[idx].available_capacity -= res.number_of_people
+def _find_slot_occupancy(db: Session, start: datetime, end: datetime) -> SlotOccupancy:
+    """
+    [start, end) 구간의 슬롯별 예약 가능 인원을 반환하는 함수
+    슬롯별 확정 예약 인원은 DB 에서 집계하므로, 예약 데이터를 조회하지 않는다.
+    """
+    return SlotOccupancy.from_usages(start, end, _find_slot_usages(db, start, end))
 
-    return schedules
 
+def _find_slot_usages(db: Session, start: datetime, end: datetime) -> Sequence[int]:
+    return reservation_repository.find_slot_usages(
+        db, start, end, [ReservationStatus.CONFIRMED]
+    )
 
-def _merge_schedules(
-    schedules: List[GetAvailableScheduleResponse],
-) -> List[GetAvailableScheduleResponse]:
+
+def _find_cached_slot_usages(
+    db: Session, start: datetime, end: datetime
+) -> Sequence[int]:
     """
-    예약이 불가한 스케줄을 필터링하고, 예약 가능 인원이 동일한 연속 구간을 병합하는 함수
+    일자 단위 [start, end) 구간의 슬롯별 확정 예약 인원을 일자별 캐시를 통해 반환하는 함수
+
+    - 캐시에 없는 일자만 연속된 구간 단위로 DB 에서 집계하고, 집계한 일자는 캐시에 저장함
+    - replica 에서 집계한 값은 무효화 이후의 변경이 반영되지 않았을 수 있으므로 캐시에 저장하지 않음
+      (primary 로 조회해야 하는 요청이 replica 의 오래된 값을 받지 않도록 함)
     """
-    if len(schedules) == 0:
-        return []
+    if not settings.AVAILABILITY_CACHE_ENABLED or start.time() != datetime.time.min:
+        return _find_slot_usages(db, start, end)
+
+    days = [start.date() + ONE_DAY * idx for idx in range((end - start).days)]
+    cached = {day: availability_cache.get(day) for day in days}
+    cacheable = not is_replica_session(db)
+
+    missing = [day for day in days if cached[day] is None]
+    while missing:
+        # 연속된 일자는 한 번에 집계한다
+        run = [missing.pop(0)]
+        while missing and missing[0] == run[-1] + ONE_DAY:
+            run.append(missing.pop(0))
+
+        generations = [availability_cache.generation(day) for day in run]
+        run_start = datetime.datetime.combine(run[0], datetime.time.min)
+        started = time.perf_counter()
+        usages = reservation_repository.find_slot_usages(
+            db, run_start, run_start + ONE_DAY * len(run), [ReservationStatus.CONFIRMED]
+        )
+        metrics.timings.record(
+            "availability_cache.rebuild", f"{len(run)}d", time.perf_counter() - started
+        )
+
+        for idx, (day, generation) in enumerate(zip(run, generations)):
+            day_usages = array(
+                "i", usages[idx * SLOTS_PER_DAY : (idx + 1) * SLOTS_PER_DAY]
+            )
+            if cacheable:
+                availability_cache.put(day, day_usages, generation)
+            cached[day] = day_usages
 
-    schedules = [schedule for schedule in schedules if schedule.available_capacity > 0]
+    usages = array("i")
+    for day in days:
+        usages.extend(cached[day])
+    return usages
+
+
+def _merge_schedules(occupancy: SlotOccupancy) -> List[GetAvailableScheduleResponse]:
+    """
+    예약이 불가한 스케줄을 필터링하고, 예약 가능 인원이 동일한 연속 구간을 병합하는 함수
+    병합된 구간에 대해서만 응답 객체를 생성한다.
+    """
+    capacities = occupancy.capacities
 
     merged = []
-    current = schedules[0]
-    for next_schedule in schedules[1:]:
-        if (
-            current.end == next_schedule.start
-            and current.available_capacity == next_schedule.available_capacity
-        ):
-            current.end = next_schedule.end
+    run_start = 0
+    for idx in range(1, occupancy.size + 1):
+        if idx < occupancy.size and capacities[idx] == capacities[run_start]:
             continue
 
-        merged.append(current)
-        current = next_schedule
-    merged.append(current)
+        if capacities[run_start] > 0:
+            merged.append(
+                GetAvailableScheduleResponse(
+                    start=occupancy.slot_start(run_start),
+                    end=occupancy.slot_start(idx),
+                    available_capacity=capacities[run_start],
+                )
+            )
+        run_start = idx
 
     return merged
 
 
-def _validate_reservation_status(user: User, reservation: Reservation) -> None:
+def _find_available_windows(
+    occupancy: SlotOccupancy,
+    width: int,
+    number_of_people: int,
+    limit: int,
+    min_start: datetime,
+    max_start: datetime,
+) -> List[GetAvailableScheduleResponse]:
+    """
+    슬롯 width 개로 이루어진 구간 중, 모든 슬롯의 예약 가능 인원이 예약 인원 이상인 구간을 찾는 함수
+
+    - 구간을 한 슬롯씩 밀면서 구간 최솟값을 단조 증가 deque 로 유지함 -> 전체 O(슬롯 수)
+    - 구간의 예약 가능 인원은 구간 내 슬롯의 최솟값으로 반환함
+    """
+    capacities = occupancy.capacities
+
+    windows = []
+    candidates = deque()  # 예약 가능 인원이 증가하는 순서의 슬롯 인덱스
+    for idx in range(occupancy.size):
+        while candidates and capacities[candidates[-1]] >= capacities[idx]:
+            candidates.pop()
+        candidates.append(idx)
+
+        window_start = idx - width + 1
+        if window_start < 0:
+            continue
+        if candidates[0] < window_start:
+            candidates.popleft()
+
+        start = occupancy.slot_start(window_start)
+        if start < min_start:
+            continue
+        if start > max_start:
+            break
+
+        minimum = capacities[candidates[0]]
+        if minimum >= number_of_people:
+            windows.append(
+                GetAvailableScheduleResponse(
+                    start=start,
+                    end=occupancy.slot_start(idx + 1),
+                    available_capacity=minimum,
+                )
+            )
+            if len(windows) == limit:
+                break
+
+    return windows
+
+
+def _validate_reservation_status(user: Principal, reservation: Reservation) -> None:
     if user.role != Role.ADMIN and reservation.status != ReservationStatus.PENDING:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -4,3 +4,21 @@ MAX_CAPACITY = 50_000
 
 DATETIME_FORMAT = "%Y-%m-%d %H:%M"
 DATE_FORMAT = "%Y-%m-%d"
+
+# 예약 가능 기간(180일)을 모두 포함하도록 여유를 둔 슬롯 용량 인덱스의 범위
+CAPACITY_INDEX_HORIZON_DAYS = 182
+
+# 예약 가능 구간 검색 시 최소 예약 시간(분), 최대 반환 개수
+MIN_RESERVATION_MINUTES = 30
+MAX_WINDOW_LIMIT = 100
+
+# 슬롯 ledger 를 보호하는 advisory lock 의 key 네임스페이스(pg_advisory_xact_lock 의 첫 번째 key)
+ADVISORY_LOCK_NAMESPACE = 1001
+
+# 일괄 확정 요청에서 한 번에 처리할 수 있는 최대 예약 개수
+MAX_BATCH_CONFIRM_SIZE = 1000
+
+# 일괄 등록 시 한 번에 정원 검사/insert 하는 행 개수
+BULK_IMPORT_BATCH_SIZE = 500
+# 일괄 등록 요청 본문을 메모리에 보관하는 최대 크기(byte), 초과하면 임시 파일에 기록
+BULK_IMPORT_SPOOL_MAX_BYTES = 1024 * 1024
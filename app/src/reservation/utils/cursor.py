@@ -0,0 +1,34 @@
+import base64
+import json
+from datetime import datetime
+from typing import Sequence, Tuple
+
+# 예약 목록 정렬 기준 (start_time, id)
+Cursor = Tuple[datetime, int]
+
+
+def encode_cursor(start_time: datetime, reservation_id: int) -> str:
+    """
+    마지막으로 조회한 예약의 (start_time, id)를 다음 페이지 조회에 사용할 cursor 문자열로 변환하는 함수
+    """
+    payload = json.dumps([start_time.isoformat(), reservation_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        start_time, reservation_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(start_time), int(reservation_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("올바르지 않은 cursor 입니다.") from e
+
+
+def next_cursor(reservations: Sequence, limit: int) -> str | None:
+    """
+    조회 결과가 limit 만큼 채워졌다면 마지막 예약 다음부터 조회하는 cursor 를, 아니라면 None 을 반환하는 함수
+    """
+    if len(reservations) < limit:
+        return None
+    last = reservations[-1]
+    return encode_cursor(last.start_time, last.id)
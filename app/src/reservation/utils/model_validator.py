@@ -27,7 +27,8 @@ def validate_reservation_datetime(start: datetime, end: datetime):
 
 
 def validate_reservation_date_format(date: str, format: str):
+    # 문자열이 아닌 값(숫자, null 등)은 strptime 이 TypeError 를 발생시키므로 형식 오류로 함께 처리한다
     try:
         datetime.strptime(date, format)
-    except ValueError as e:
+    except (ValueError, TypeError) as e:
         raise ValueError(f"해당 요청 형식은 '{format}' 포맷이어야 합니다.") from e
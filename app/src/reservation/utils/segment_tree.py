@@ -0,0 +1,70 @@
+from typing import List, Sequence
+
+
+class MinSegmentTree:
+    """
+    구간 덧셈(range add)과 구간 최솟값(range min) 조회를 지원하는 segment tree
+
+    - 구간 덧셈은 완전히 포함되는 노드에 lazy 값으로 기록하고 자식에게 전파하지 않음
+    - 노드의 최솟값은 (자식 최솟값 중 작은 값 + 자신의 lazy 값)으로 유지됨
+    - 모든 연산은 [start, end) 반개구간을 사용하며 O(log n) 에 처리됨
+    """
+
+    def __init__(self, values: Sequence[int]):
+        self.size = len(values)
+        self._min: List[int] = [0] * (4 * max(1, self.size))
+        self._lazy: List[int] = [0] * (4 * max(1, self.size))
+        if self.size > 0:
+            self._build(1, 0, self.size, values)
+
+    def range_add(self, start: int, end: int, value: int) -> None:
+        start, end = max(0, start), min(self.size, end)
+        if start >= end:
+            return
+        self._add(1, 0, self.size, start, end, value)
+
+    def range_min(self, start: int, end: int) -> int:
+        start, end = max(0, start), min(self.size, end)
+        if start >= end:
+            raise ValueError("조회 구간이 비어있습니다.")
+        return self._query(1, 0, self.size, start, end)
+
+    def _build(self, node: int, lo: int, hi: int, values: Sequence[int]) -> None:
+        if hi - lo == 1:
+            self._min[node] = values[lo]
+            return
+
+        mid = (lo + hi) // 2
+        self._build(node * 2, lo, mid, values)
+        self._build(node * 2 + 1, mid, hi, values)
+        self._min[node] = min(self._min[node * 2], self._min[node * 2 + 1])
+
+    def _add(
+        self, node: int, lo: int, hi: int, start: int, end: int, value: int
+    ) -> None:
+        if end <= lo or hi <= start:
+            return
+        if start <= lo and hi <= end:
+            self._min[node] += value
+            self._lazy[node] += value
+            return
+
+        mid = (lo + hi) // 2
+        self._add(node * 2, lo, mid, start, end, value)
+        self._add(node * 2 + 1, mid, hi, start, end, value)
+        self._min[node] = (
+            min(self._min[node * 2], self._min[node * 2 + 1]) + self._lazy[node]
+        )
+
+    def _query(self, node: int, lo: int, hi: int, start: int, end: int) -> int:
+        if start <= lo and hi <= end:
+            return self._min[node]
+
+        mid = (lo + hi) // 2
+        result = None
+        if start < mid:
+            result = self._query(node * 2, lo, mid, start, end)
+        if mid < end:
+            right = self._query(node * 2 + 1, mid, hi, start, end)
+            result = right if result is None else min(result, right)
+        return result + self._lazy[node]
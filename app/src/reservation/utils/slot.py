@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from app.src.reservation.utils.constants import SECONDS_PER_MINUTE, SLOT_MINUTES
+
+SLOT_DELTA = timedelta(minutes=SLOT_MINUTES)
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_slot_index(origin: datetime, value: datetime) -> int:
+    """
+    origin 을 0번 슬롯으로 보고, value 가 속한 10분 슬롯의 인덱스를 반환하는 함수
+    """
+    minutes = int((value - origin).total_seconds() // SECONDS_PER_MINUTE)
+    return minutes // SLOT_MINUTES
+
+
+def count_slots(start: datetime, end: datetime) -> int:
+    """
+    [start, end) 구간이 걸치는 슬롯 개수를 반환하는 함수
+    종료 시간이 슬롯 경계가 아니라면 마지막 슬롯까지 포함한다.
+    """
+    seconds = (end - start).total_seconds()
+    slot_seconds = SLOT_MINUTES * SECONDS_PER_MINUTE
+    return max(0, int(-(-seconds // slot_seconds)))
+
+
+def generate_slot_starts(start: datetime, end: datetime) -> List[datetime]:
+    """
+    [start, end) 구간이 걸치는 슬롯들의 시작 시간을 반환하는 함수
+    """
+    return [start + idx * SLOT_DELTA for idx in range(count_slots(start, end))]
+
+
+def generate_stripe_keys(start: datetime, end: datetime, stripe_minutes: int) -> List[int]:
+    """
+    [start, end) 구간이 걸치는 stripe 들의 key 를 오름차순으로 반환하는 함수
+    stripe key 는 기준 시각(1970-01-01)부터 stripe 크기 단위로 센 인덱스이다.
+    """
+    if end <= start:
+        return []
+
+    first = int((start - EPOCH).total_seconds() // SECONDS_PER_MINUTE) // stripe_minutes
+    last_minute = -(-(end - EPOCH).total_seconds() // SECONDS_PER_MINUTE) - 1
+    last = int(last_minute) // stripe_minutes
+    return list(range(first, last + 1))
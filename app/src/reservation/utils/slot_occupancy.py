@@ -0,0 +1,74 @@
+from array import array
+from datetime import datetime
+from typing import Sequence
+
+from app.src.reservation.utils.constants import MAX_CAPACITY
+from app.src.reservation.utils.slot import SLOT_DELTA, count_slots, to_slot_index
+
+
+class SlotOccupancy:
+    """
+    [start, end) 구간의 10분 슬롯별 예약 가능 인원을 정수 배열로 관리하는 클래스
+
+    - 예약은 차분 배열(difference array)에 구간의 시작/끝만 기록함 -> 예약 1건당 O(1)
+    - capacities 조회 시 누적합으로 슬롯별 예약 가능 인원을 계산함 -> O(슬롯 수)
+    """
+
+    def __init__(self, start: datetime, end: datetime, capacity: int = MAX_CAPACITY):
+        self.start = start
+        self.end = end
+        self.capacity = capacity
+        self.size = count_slots(start, end)
+
+        self._diff = array("i", [0]) * (self.size + 1)
+        self._capacities: array | None = None
+
+    @classmethod
+    def from_usages(
+        cls,
+        start: datetime,
+        end: datetime,
+        usages: Sequence[int],
+        capacity: int = MAX_CAPACITY,
+    ) -> "SlotOccupancy":
+        """
+        슬롯별 예약 인원 합계(DB 에서 집계된 값)로 예약 가능 인원을 생성한다.
+        """
+        occupancy = cls(start, end, capacity)
+        if len(usages) != occupancy.size:
+            raise ValueError("슬롯 개수와 예약 인원 합계의 개수가 일치하지 않습니다.")
+
+        previous = 0
+        for idx, used in enumerate(usages):
+            occupancy._diff[idx] = previous - used
+            previous = used
+        occupancy._diff[occupancy.size] = previous
+        return occupancy
+
+    def add(self, start: datetime, end: datetime, number_of_people: int) -> None:
+        """
+        [start, end) 구간의 슬롯에서 예약 인원만큼 예약 가능 인원을 차감한다.
+        조회 구간을 벗어나는 부분은 잘라내고 반영한다.
+        """
+        start_idx = max(0, to_slot_index(self.start, start))
+        end_idx = min(self.size, count_slots(self.start, end))
+        if start_idx >= end_idx:
+            return
+
+        self._diff[start_idx] -= number_of_people
+        self._diff[end_idx] += number_of_people
+        self._capacities = None
+
+    @property
+    def capacities(self) -> array:
+        if self._capacities is None:
+            capacities = array("i", [0]) * self.size
+            current = self.capacity
+            for idx in range(self.size):
+                current += self._diff[idx]
+                capacities[idx] = current
+            self._capacities = capacities
+        return self._capacities
+
+    def slot_start(self, idx: int) -> datetime:
+        return self.start + idx * SLOT_DELTA
@@ -18,3 +18,5 @@ class User(BaseTable):
     password = Column(String)
     user_name = Column(String)
     role = Column(SqlEnum(Role), default=Role.USER)
+    # 증가시키면 이전에 발급한 토큰이 모두 폐기됨
+    token_epoch = Column(Integer, nullable=False, default=0, server_default="0")
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Tuple, TypeVar
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
+
+from app.src.common import metrics
+from app.src.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 설정한 cost 와 다른 해시는 needs_update 대상이 되어 로그인 시 다시 해싱된다
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+_executor: ProcessPoolExecutor | None = None
+_pending = 0
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_and_update(password: str, hashed_password: str) -> Tuple[bool, str | None]:
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+async def hash_password(password: str) -> str:
+    return await _run(_hash, password)
+
+
+async def verify_password(
+    password: str, hashed_password: str
+) -> Tuple[bool, str | None]:
+    """
+    비밀번호를 검증하고 (일치 여부, 새 해시)를 반환하는 함수
+    해시의 cost 가 설정과 다르다면 새 cost 로 다시 해싱한 값을, 아니라면 None 을 반환한다.
+    """
+    return await _run(_verify_and_update, password, hashed_password)
+
+
+async def _run(func: Callable[..., T], *args) -> T:
+    """
+    비밀번호 해싱 작업을 process pool 에서 실행하는 함수
+
+    bcrypt 는 CPU 를 오래 점유하므로 요청을 처리하는 worker thread 와 분리된 process 에서 실행하고,
+    대기 중인 작업이 PASSWORD_HASH_MAX_PENDING 을 넘으면 대기열을 늘리지 않고 503 을 응답한다.
+    """
+    global _pending
+    if _pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        metrics.counters.increment("password.rejected", func.__name__)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 잠시 후 다시 시도해주세요.",
+        )
+
+    _pending += 1
+    try:
+        if settings.PASSWORD_HASH_WORKERS <= 0:
+            return await run_in_threadpool(func, *args)
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_executor(), func, *args
+        )
+    finally:
+        _pending -= 1
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+    return _executor
+
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -1,3 +1,5 @@
+from typing import Dict, Iterable
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.src.user.model import User
@@ -12,3 +14,22 @@ def create(db: Session, user: User) -> User:
     db.flush()
     db.refresh(user)
     return user
+
+
+def find_token_epochs(db: Session, user_ids: Iterable[int]) -> Dict[int, int]:
+    rows = db.query(User.id, User.token_epoch).filter(User.id.in_(list(user_ids)))
+    return {user_id: token_epoch for user_id, token_epoch in rows}
+
+
+def increment_token_epoch(db: Session, user_id: int) -> int:
+    return db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_epoch=User.token_epoch + 1)
+        .returning(User.token_epoch)
+    ).scalar_one()
+
+
+def update_password(db: Session, user: User, password: str) -> None:
+    user.password = password
+    db.flush()
@@ -1,8 +1,11 @@
+from typing import Annotated
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.src.common.token import Token
+from app.src.common.token import Principal, Token
 from app.src.config.database import get_db_from_request
+from app.src.middleware.authenticate import authenticate_user
 from app.src.user.dto.request.user_create_request import UserCreateRequest
 from app.src.user.dto.request.user_login_request import UserLoginRequest
 from app.src.user.dto.response.user_create_response import UserCreateResponse
@@ -13,14 +16,27 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.post("/register", status_code=status.HTTP_201_CREATED)
-def register(
-    request: UserCreateRequest, db: Session = Depends(get_db_from_request)
+async def register(
+    request: UserCreateRequest,
+    db: Session | AsyncSession = Depends(get_db_from_request),
 ) -> UserCreateResponse:
-    return user_service.register(db, request)
+    return await user_service.register(db, request)
 
 
 @router.post("/login")
-def login(
-    request: UserLoginRequest, db: Session = Depends(get_db_from_request)
+async def login(
+    request: UserLoginRequest,
+    db: Session | AsyncSession = Depends(get_db_from_request),
 ) -> Token:
-    return user_service.login(db, request)
+    return await user_service.login(db, request)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    user: Annotated[Principal, Depends(authenticate_user)],
+    db: Session | AsyncSession = Depends(get_db_from_request),
+) -> None:
+    """
+    사용자에게 발급된 모든 토큰을 폐기합니다.
+    """
+    await user_service.revoke_tokens(db, user)
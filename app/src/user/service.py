@@ -1,57 +1,106 @@
+import time
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
 import jwt
-from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.src.common.token import Token
+from app.src.common import metrics
+from app.src.common.token import Principal, Token
+from app.src.config.database import run_after_commit, run_with_session
 from app.src.middleware.authenticate import ALGORITHM, SECRET_KEY
+from app.src.user import password, token_epoch
 from app.src.user import repository as user_repository
 from app.src.user.dto.request.user_create_request import UserCreateRequest
 from app.src.user.dto.request.user_login_request import UserLoginRequest
 from app.src.user.dto.response.user_create_response import UserCreateResponse
+from app.src.user.token_epoch import token_epochs
 
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
-def register(db: Session, user: UserCreateRequest) -> UserCreateResponse:
-    saved_user = user_repository.find_by_email(db, user.email)
+async def register(
+    db: Session | AsyncSession, user: UserCreateRequest
+) -> UserCreateResponse:
+    saved_user = await run_with_session(
+        db, lambda session: user_repository.find_by_email(session, user.email)
+    )
     if saved_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="중복된 이메일 입니다."
         )
 
-    user.password = _get_password_hash(user.password)
-    created_user = user_repository.create(db, user.toModel())
-
-    return UserCreateResponse.from_model(created_user)
-
-
-def login(db: Session, request: UserLoginRequest) -> Token:
-    user = user_repository.find_by_email(db, request.email)
+    user.password = await password.hash_password(user.password)
+    return await run_with_session(
+        db,
+        lambda session: UserCreateResponse.from_model(
+            user_repository.create(session, user.toModel())
+        ),
+    )
+
+
+async def login(db: Session | AsyncSession, request: UserLoginRequest) -> Token:
+    """
+    로그인 후 토큰을 발급하는 함수, 결과(success, failure, rejected) 별 소요 시간을 집계한다.
+    """
+    started = time.perf_counter()
+    outcome = "failure"
+    try:
+        token = await _login(db, request)
+        outcome = "success"
+        return token
+    except HTTPException as e:
+        if e.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
+            outcome = "rejected"
+        raise
+    finally:
+        metrics.timings.record("auth.login", outcome, time.perf_counter() - started)
+
+
+async def _login(db: Session | AsyncSession, request: UserLoginRequest) -> Token:
+    user = await run_with_session(
+        db, lambda session: user_repository.find_by_email(session, request.email)
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="존재하지 않는 이메일 입니다.",
         )
-    if not _verify_password(request.password, user.password):
+
+    verified, new_hash = await password.verify_password(request.password, user.password)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="비밀번호가 일치하지 않습니다.",
         )
+    # bcrypt cost 가 변경되었다면 새 cost 로 해싱한 비밀번호로 교체한다
+    if new_hash is not None:
+        await run_with_session(
+            db, lambda session: user_repository.update_password(session, user, new_hash)
+        )
 
-    return _create_access_token(data={"sub": user.email})
+    return _create_access_token(
+        data={
+            "sub": str(user.id),
+            "email": user.email,
+            "role": user.role.value,
+            "epoch": user.token_epoch,
+        }
+    )
 
 
-def _get_password_hash(password):
-    return pwd_context.hash(password)
+async def revoke_tokens(db: Session | AsyncSession, user: Principal) -> None:
+    """
+    사용자의 token epoch 를 증가시켜 이전에 발급된 토큰을 모두 폐기하는 함수
+    현재 프로세스의 캐시는 commit 이후 바로 갱신되고, 다른 프로세스는 commit 시점에 전달되는 변경 알림으로 반영된다.
+    """
 
+    def revoke(session: Session) -> None:
+        epoch = user_repository.increment_token_epoch(session, user.id)
+        run_after_commit(session, lambda: token_epochs.set(user.id, epoch))
+        token_epoch.publish(session, user.id, epoch)
 
-def _verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    await run_with_session(db, revoke)
 
 
 # JWT 토큰 생성 함수
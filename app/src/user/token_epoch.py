@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Dict
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.src.config import settings
+from app.src.config.database import SessionLocal
+from app.src.config.invalidation import notify
+from app.src.user import repository as user_repository
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "user_changes"
+
+
+class TokenEpochCache:
+    """
+    사용자별 token epoch 를 프로세스 메모리에 유지하는 캐시
+
+    - 토큰에는 발급 시점의 epoch 가 포함되며, 현재 epoch 보다 작은 토큰은 폐기된 토큰으로 봄
+    - 처음 인증하는 사용자만 DB 에서 조회하고, 이후에는 캐시된 값으로 확인함
+    - 다른 프로세스에서 폐기한 토큰은 변경 알림으로 반영되며, 알림을 놓친 경우에 대비해
+      캐시된 사용자의 epoch 는 백그라운드에서 한 번의 쿼리로 주기적으로 갱신됨
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._epochs: Dict[int, int] = {}
+
+    def get(self, user_id: int) -> int | None:
+        with self._lock:
+            return self._epochs.get(user_id)
+
+    def set(self, user_id: int, epoch: int) -> None:
+        with self._lock:
+            # 갱신 중 조회된 이전 값으로 덮어쓰지 않도록 큰 값만 반영한다
+            self._epochs[user_id] = max(epoch, self._epochs.get(user_id, epoch))
+
+    def load(self, user_id: int) -> int | None:
+        """
+        사용자의 epoch 를 DB 에서 조회해 캐시하는 함수, 존재하지 않는 사용자는 None 을 반환한다.
+        """
+        db = SessionLocal()
+        try:
+            epochs = user_repository.find_token_epochs(db, [user_id])
+        finally:
+            db.close()
+
+        if user_id not in epochs:
+            return None
+        self.set(user_id, epochs[user_id])
+        return self.get(user_id)
+
+    def refresh(self) -> None:
+        """
+        캐시된 모든 사용자의 epoch 를 다시 조회하는 함수, 삭제된 사용자는 캐시에서 제거한다.
+        """
+        with self._lock:
+            user_ids = list(self._epochs)
+        if not user_ids:
+            return
+
+        db = SessionLocal()
+        try:
+            epochs = user_repository.find_token_epochs(db, user_ids)
+        finally:
+            db.close()
+
+        with self._lock:
+            for user_id in user_ids:
+                if user_id in epochs:
+                    self._epochs[user_id] = max(
+                        epochs[user_id], self._epochs.get(user_id, 0)
+                    )
+                else:
+                    self._epochs.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epochs.clear()
+
+
+token_epochs = TokenEpochCache()
+
+
+def publish(db: Session, user_id: int, epoch: int) -> None:
+    """
+    token epoch 변경을 다른 프로세스에 알리는 함수, 현재 트랜잭션이 commit 될 때 전달된다.
+    """
+    if settings.INVALIDATION_BUS_ENABLED:
+        notify(db, CHANNEL, {"user_id": user_id, "epoch": epoch})
+
+
+def apply(payload: Dict[str, Any]) -> None:
+    token_epochs.set(payload["user_id"], payload["epoch"])
+
+
+async def refresh_periodically(cache: TokenEpochCache, interval_seconds: float) -> None:
+    """
+    interval 마다 캐시된 token epoch 를 갱신하는 백그라운드 작업, 조회에 실패하면 이전 값을 유지한다.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(cache.refresh)
+        except Exception:
+            logger.warning("token epoch 갱신에 실패했습니다.", exc_info=True)
@@ -0,0 +1,4 @@
+#!/bin/bash
+# replica(db-replica) 가 streaming replication 으로 접속할 수 있도록 허용한다
+set -e
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
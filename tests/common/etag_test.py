@@ -0,0 +1,39 @@
+import pytest
+from fastapi import Request
+
+from app.src.common.etag import make_etag, matches, not_modified
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.unit
+class TestETag:
+    def test_strong_etag_changes_with_parts(self):
+        """같은 값으로는 같은 ETag, 값이 바뀌면 다른 ETag 생성"""
+        etag = make_etag("reservation", 1, 2)
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert make_etag("reservation", 1, 2) == etag
+        assert make_etag("reservation", 1, 3) != etag
+
+    def test_match_any_of_listed_etags(self):
+        """If-None-Match 에 나열된 ETag 중 하나라도 일치하면 변경되지 않은 것으로 봄"""
+        etag = make_etag("schedules", 1)
+
+        assert matches(_request(f'"other", W/{etag}'), etag) is True
+        assert matches(_request("*"), etag) is True
+        assert matches(_request('"other"'), etag) is False
+        assert matches(_request(), etag) is False
+
+    def test_not_modified_response_has_no_body(self):
+        """304 응답은 body 없이 ETag 만 포함"""
+        etag = make_etag("schedules", 1)
+
+        response = not_modified(etag)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
@@ -0,0 +1,104 @@
+import asyncio
+import pytest
+
+from app.src.common import metrics
+from app.src.common.single_flight import SingleFlight
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    metrics.counters.reset()
+    yield
+    metrics.counters.reset()
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    def test_share_result_of_concurrent_calls(self):
+        """같은 key 로 동시에 들어온 요청은 한 번만 실행하고 결과를 공유"""
+        # given
+        flight = SingleFlight("test")
+        executed = 0
+
+        async def find():
+            nonlocal executed
+            executed += 1
+            await asyncio.sleep(0.01)
+            return [executed]
+
+        async def run():
+            return await asyncio.gather(*(flight.do("key", find) for _ in range(5)))
+
+        # when
+        results = asyncio.run(run())
+
+        # then
+        assert executed == 1
+        assert all(result is results[0] for result in results)
+        assert metrics.counters.get("single_flight.executed", "test") == 1
+        assert metrics.counters.get("single_flight.coalesced", "test") == 4
+        assert flight.in_flight == 0
+
+    def test_execute_again_after_completed(self):
+        """실행이 끝난 이후 들어온 요청은 다시 실행(결과를 캐시하지 않음)"""
+        # given
+        flight = SingleFlight("test")
+        executed = 0
+
+        async def find():
+            nonlocal executed
+            executed += 1
+            return executed
+
+        async def run():
+            return [await flight.do("key", find), await flight.do("key", find)]
+
+        # when
+        results = asyncio.run(run())
+
+        # then
+        assert results == [1, 2]
+
+    def test_share_exception(self):
+        """실행 중 발생한 예외는 기다리던 요청에도 전달"""
+        # given
+        flight = SingleFlight("test")
+
+        async def find():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        async def run():
+            return await asyncio.gather(
+                *(flight.do("key", find) for _ in range(3)), return_exceptions=True
+            )
+
+        # when
+        results = asyncio.run(run())
+
+        # then
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.in_flight == 0
+
+    def test_not_cancel_execution_when_first_request_cancelled(self):
+        """먼저 들어온 요청이 취소되어도, 기다리던 요청은 실행 결과를 받음"""
+        # given
+        flight = SingleFlight("test")
+
+        async def find():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        async def run():
+            first = asyncio.ensure_future(flight.do("key", find))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(flight.do("key", find))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        # when
+        result = asyncio.run(run())
+
+        # then
+        assert result == "result"
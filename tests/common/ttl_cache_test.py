@@ -0,0 +1,48 @@
+import time
+import pytest
+
+from app.src.common.ttl_cache import TTLCache
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    def test_evict_least_recently_used(self):
+        """가득 차면 가장 오래 사용하지 않은 항목부터 제거"""
+        # given
+        cache = TTLCache(maxsize=2)
+        expires_at = time.time() + 60
+        cache.put("a", 1, expires_at)
+        cache.put("b", 2, expires_at)
+        cache.get("a")
+
+        # when
+        cache.put("c", 3, expires_at)
+
+        # then
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_expire_at_expiration_time(self):
+        """만료 시각이 지난 항목은 반환하지 않고 제거"""
+        # given
+        cache = TTLCache(maxsize=2)
+        cache.put("a", 1, time.time() - 1)
+
+        # when
+        value = cache.get("a")
+
+        # then
+        assert value is None
+        assert len(cache) == 0
+
+    def test_disabled_when_maxsize_zero(self):
+        """최대 크기가 0 이면 저장하지 않음"""
+        # given
+        cache = TTLCache(maxsize=0)
+
+        # when
+        cache.put("a", 1, time.time() + 60)
+
+        # then
+        assert cache.get("a") is None
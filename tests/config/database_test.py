@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.util import greenlet_spawn
+
+from app.src.config.database import (
+    create_request_session,
+    XactSnapshot,
+    current_xact_id,
+    run_with_session,
+    run_with_session_and_compute,
+    sleep_in_session,
+)
+from app.src.user.model import User
+
+
+@pytest.mark.unit
+class TestRunWithSession:
+    def test_run_sync_when_async_session(self):
+        """AsyncSession 이면, 동기 작업을 run_sync 로 실행"""
+        # given
+        sync_session = MagicMock(spec=Session)
+        db = MagicMock(spec=AsyncSession)
+        db.run_sync = AsyncMock(side_effect=lambda operation: operation(sync_session))
+
+        # when
+        result = asyncio.run(run_with_session(db, lambda session: session))
+
+        # then
+        assert result is sync_session
+        db.run_sync.assert_awaited_once()
+
+    def test_run_in_worker_thread_when_sync_session(self):
+        """동기 Session 이면, 작업을 worker thread 에서 실행"""
+        # given
+        db = MagicMock(spec=Session)
+        event_loop_thread = threading.get_ident()
+
+        # when
+        session, thread = asyncio.run(
+            run_with_session(db, lambda session: (session, threading.get_ident()))
+        )
+
+        # then
+        assert session is db
+        assert thread != event_loop_thread
+
+
+@pytest.mark.unit
+class TestRunWithSessionAndCompute:
+    def test_compute_in_worker_thread_when_async_session(self):
+        """AsyncSession 이면, 조회만 run_sync 로 실행하고 계산은 worker thread 에서 실행"""
+        # given
+        sync_session = MagicMock(spec=Session)
+        db = MagicMock(spec=AsyncSession)
+        db.run_sync = AsyncMock(side_effect=lambda operation: operation(sync_session))
+
+        async def run():
+            event_loop_thread = threading.get_ident()
+            result = await run_with_session_and_compute(
+                db,
+                lambda session: session,
+                lambda session: (session, threading.get_ident()),
+            )
+            return result, event_loop_thread
+
+        # when
+        (session, thread), event_loop_thread = asyncio.run(run())
+
+        # then
+        assert session is sync_session
+        assert thread != event_loop_thread
+        db.run_sync.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestSleepInSession:
+    def test_await_asyncio_sleep_when_async_session(self, mocker):
+        """AsyncSession 의 run_sync 안에서는, 이벤트 루프를 막지 않도록 asyncio.sleep 을 기다림"""
+        # given
+        db = MagicMock(spec=Session)
+        db.info = {"async": True}
+        blocking_sleep = mocker.patch("app.src.config.database.time.sleep")
+        waits = []
+
+        async def fake_sleep(seconds):
+            waits.append(seconds)
+
+        mocker.patch("app.src.config.database.asyncio.sleep", side_effect=fake_sleep)
+
+        # when
+        asyncio.run(greenlet_spawn(sleep_in_session, db, 0.01))
+
+        # then
+        assert waits == [0.01]
+        blocking_sleep.assert_not_called()
+
+    def test_time_sleep_when_sync_session(self, mocker):
+        """동기 Session 은 worker thread 에서 실행되므로 time.sleep 으로 대기"""
+        # given
+        db = MagicMock(spec=Session)
+        db.info = {}
+        blocking_sleep = mocker.patch("app.src.config.database.time.sleep")
+
+        # when
+        sleep_in_session(db, 0.01)
+
+        # then
+        blocking_sleep.assert_called_once_with(0.01)
+
+
+@pytest.mark.unit
+class TestCreateRequestSession:
+    def test_read_only_session_uses_autocommit(self):
+        """읽기 전용 세션은 autocommit connection 을 사용"""
+        # when
+        db = create_request_session(read_only=True)
+
+        # then
+        assert db.get_bind().get_execution_options()["isolation_level"] == "AUTOCOMMIT"
+        assert db.info["read_only"] is True
+
+    def test_read_only_session_uses_snapshot_when_configured(self, mocker):
+        """DB_READ_SNAPSHOT 설정 시, REPEATABLE READ READ ONLY 트랜잭션을 사용"""
+        # given
+        mocker.patch("app.src.config.settings.DB_READ_SNAPSHOT", True)
+
+        # when
+        options = create_request_session(read_only=True).get_bind().get_execution_options()
+
+        # then
+        assert options["isolation_level"] == "REPEATABLE READ"
+        assert options["postgresql_readonly"] is True
+
+    def test_forbid_flush_in_read_only_session(self):
+        """읽기 전용 세션에서 객체를 변경하고 flush 하면 예외 발생"""
+        # given
+        db = create_request_session(read_only=True)
+        db.add(User(user_name="test", email="test@test.com", password="password"))
+
+        # when - then
+        with pytest.raises(RuntimeError):
+            db.flush()
+
+
+@pytest.mark.unit
+class TestXactSnapshot:
+    def test_visible_only_when_committed_before_snapshot(self):
+        """xmin 이전 트랜잭션과, xmax 이전이면서 진행 중이 아닌 트랜잭션의 변경만 snapshot 에 포함"""
+        # given
+        snapshot = XactSnapshot("100:105:101,103")
+
+        # when - then
+        assert snapshot.visible(99) is True
+        assert snapshot.visible(102) is True
+        assert snapshot.visible(103) is False
+        assert snapshot.visible(105) is False
+
+    def test_reuse_xact_id_until_transaction_ends(self):
+        """트랜잭션 ID 는 트랜잭션 안에서 한 번만 조회"""
+        # given
+        db = MagicMock(spec=Session)
+        db.info = {}
+        db.execute.return_value.scalar_one.return_value = "42"
+
+        # when
+        xact_ids = [current_xact_id(db), current_xact_id(db)]
+
+        # then
+        assert xact_ids == [42, 42]
+        db.execute.assert_called_once()
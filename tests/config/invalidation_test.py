@@ -0,0 +1,129 @@
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.src.config import invalidation
+from app.src.config.invalidation import ORIGIN, InvalidationListener, notify_chunks
+
+
+def _listener(handler, on_reset):
+    return InvalidationListener(
+        "postgresql+psycopg2://postgres:postgres@db:5432/reservation",
+        {"reservation_changes": handler},
+        on_reset,
+    )
+
+
+def _notification(payload, channel="reservation_changes"):
+    return SimpleNamespace(channel=channel, payload=json.dumps(payload))
+
+
+@pytest.mark.unit
+class TestNotify:
+    def test_split_payload_by_size(self, mocker):
+        """payload 크기 제한을 넘지 않도록 나누어 발행하고, 모든 항목을 순서대로 전달"""
+        # given
+        mocker.patch.object(invalidation, "MAX_PAYLOAD_BYTES", 100)
+        notify = mocker.patch.object(invalidation, "notify")
+        db = MagicMock()
+        items = [["2025-05-01T00:00:00", "2025-05-01T01:00:00", -idx] for idx in range(10)]
+
+        # when
+        notify_chunks(db, "reservation_changes", "changes", items)
+
+        # then
+        payloads = [call.args[2] for call in notify.call_args_list]
+        assert len(payloads) > 1
+        assert all(
+            len(json.dumps(payload["changes"], separators=(",", ":"))) <= 100
+            for payload in payloads
+        )
+        assert [item for payload in payloads for item in payload["changes"]] == items
+
+
+@pytest.mark.unit
+class TestInvalidationListener:
+    def test_dsn_uses_psycopg2_driver(self):
+        """SQLAlchemy URL 을 psycopg2 연결 문자열로 변환"""
+        listener = _listener(MagicMock(), MagicMock())
+
+        assert listener.dsn == "postgresql://postgres:postgres@db:5432/reservation"
+
+    def test_dispatch_to_channel_handler(self):
+        """다른 프로세스가 발행한 알림은 채널의 handler 로 전달"""
+        # given
+        handler = MagicMock()
+        listener = _listener(handler, MagicMock())
+
+        # when
+        listener.dispatch(_notification({"origin": "other", "changes": []}))
+
+        # then
+        handler.assert_called_once_with({"origin": "other", "changes": []})
+
+    def test_ignore_own_notification(self):
+        """자신이 발행한 알림은 commit 이후 이미 반영했으므로 무시"""
+        # given
+        handler = MagicMock()
+        listener = _listener(handler, MagicMock())
+
+        # when
+        listener.dispatch(_notification({"origin": ORIGIN, "changes": []}))
+
+        # then
+        handler.assert_not_called()
+
+    def test_reset_when_handler_failed(self):
+        """처리하지 못한 알림이 있으면 캐시 전체를 비움"""
+        # given
+        on_reset = MagicMock()
+        listener = _listener(MagicMock(side_effect=KeyError("changes")), on_reset)
+
+        # when
+        listener.dispatch(_notification({"origin": "other"}))
+
+        # then
+        on_reset.assert_called_once()
+
+    def test_reset_after_reconnect(self, mocker):
+        """처음 LISTEN 할 때는 캐시를 비우지 않고, 연결이 끊긴 뒤 다시 LISTEN 하면 놓친 알림에 대비해 캐시 전체를 비움"""
+        # given
+        on_reset = MagicMock()
+        listener = _listener(MagicMock(), on_reset)
+        listener.reconnect_seconds = 0
+        connect = mocker.patch.object(invalidation.psycopg2, "connect")
+        connect.side_effect = [OSError("connection lost"), MagicMock(), MagicMock()]
+        mocker.patch.object(
+            invalidation.select, "select", side_effect=OSError("connection lost")
+        )
+
+        # when
+        for _ in range(3):
+            try:
+                listener._listen()
+            except OSError:
+                pass
+
+        # then
+        assert on_reset.call_count == 1
+
+    def test_reset_on_first_listen_when_startup_wait_timed_out(self, mocker):
+        """서버 시작 시 LISTEN 을 기다리다 시간이 지나면, 처음 LISTEN 할 때도 캐시 전체를 비움"""
+        # given
+        on_reset = MagicMock()
+        listener = _listener(MagicMock(), on_reset)
+        mocker.patch.object(invalidation.psycopg2, "connect")
+        mocker.patch.object(
+            invalidation.select, "select", side_effect=OSError("connection lost")
+        )
+
+        # when
+        listening = listener.wait_until_listening(0)
+        with pytest.raises(OSError):
+            listener._listen()
+
+        # then
+        assert listening is False
+        on_reset.assert_called_once()
+        assert listener.wait_until_listening(0) is True
@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+from app.src.config.pool import PoolStats, instrumented_pool_class
+
+
+@pytest.mark.unit
+class TestInstrumentedPool:
+    def test_record_checkout_overflow_and_timeout(self):
+        """pool_size 를 넘으면 overflow 로, max_overflow 까지 넘으면 timeout 으로 기록"""
+        # given
+        stats = PoolStats()
+        pool = instrumented_pool_class(QueuePool, stats)(
+            creator=MagicMock, pool_size=1, max_overflow=1, timeout=0.01
+        )
+
+        # when
+        first = pool.connect()
+        second = pool.connect()
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+
+        # then
+        snapshot = stats.snapshot(pool)
+        assert snapshot["checkouts"] == 2
+        assert snapshot["overflow_events"] == 1
+        assert snapshot["timeouts"] == 1
+        assert snapshot["checked_out"] == 2
+        assert snapshot["wait_ms_max"] >= 10
+
+        first.close()
+        second.close()
+        assert stats.snapshot(pool)["checked_out"] == 0
+
+    def test_reuse_pooled_connection_without_overflow(self):
+        """pool 에 반납된 connection 을 다시 사용하면 overflow 로 기록하지 않음"""
+        # given
+        stats = PoolStats()
+        pool = instrumented_pool_class(QueuePool, stats)(
+            creator=MagicMock, pool_size=1, max_overflow=1
+        )
+
+        # when
+        for _ in range(3):
+            pool.connect().close()
+
+        # then
+        snapshot = stats.snapshot(pool)
+        assert snapshot["checkouts"] == 3
+        assert snapshot["overflow_events"] == 0
+        assert snapshot["checked_in"] == 1
@@ -0,0 +1,96 @@
+import time
+import pytest
+from unittest.mock import MagicMock
+from fastapi import Request
+
+from app.src.config.replica import (
+    READ_PRIMARY_COOKIE,
+    READ_PRIMARY_HEADER,
+    ReplicaLagMonitor,
+    read_your_writes_cookie,
+    requires_primary,
+)
+
+
+def _request(headers=()):
+    return Request({"type": "http", "headers": list(headers)})
+
+
+def _lag_engine(lag):
+    engine = MagicMock()
+    connection = engine.connect.return_value.__enter__.return_value
+    connection.execute.return_value.scalar.return_value = lag
+    return engine
+
+
+@pytest.mark.unit
+class TestRequiresPrimary:
+    def test_not_required_by_default(self):
+        """cookie, header 가 없으면 replica 로 조회할 수 있음"""
+        assert requires_primary(_request()) is False
+
+    def test_required_when_header_set(self):
+        """primary 조회 header 가 있으면 primary 로 조회"""
+        assert requires_primary(_request([(READ_PRIMARY_HEADER.encode(), b"1")])) is True
+
+    def test_required_until_cookie_expires(self):
+        """read-your-writes cookie 의 만료 시각 전까지만 primary 로 조회"""
+        # given
+        valid = f"{READ_PRIMARY_COOKIE}={int(time.time()) + 60}".encode()
+        expired = f"{READ_PRIMARY_COOKIE}={int(time.time()) - 1}".encode()
+
+        # then
+        assert requires_primary(_request([(b"cookie", valid)])) is True
+        assert requires_primary(_request([(b"cookie", expired)])) is False
+
+    def test_cookie_from_write_response(self):
+        """쓰기 응답의 cookie 값으로 primary 조회 여부를 판단"""
+        # given
+        cookie = read_your_writes_cookie(5).decode().split(";")[0].encode()
+
+        # then
+        assert requires_primary(_request([(b"cookie", cookie)])) is True
+
+
+@pytest.mark.unit
+class TestReplicaLagMonitor:
+    def test_available_when_lag_within_tolerance(self):
+        """복제 지연이 허용 범위 안이면 replica 를 사용할 수 있음"""
+        # given
+        monitor = ReplicaLagMonitor(_lag_engine(1.5), interval_seconds=60)
+
+        # when
+        monitor.refresh()
+
+        # then
+        assert monitor.lag_seconds == 1.5
+        assert monitor.available(2) is True
+        assert monitor.available(1) is False
+        assert monitor.expired is False
+
+    def test_not_available_when_lag_check_fails(self):
+        """복제 지연을 조회할 수 없으면 replica 를 사용하지 않음"""
+        # given
+        engine = MagicMock()
+        engine.connect.side_effect = ConnectionError()
+        monitor = ReplicaLagMonitor(engine, interval_seconds=60)
+
+        # when
+        monitor.refresh()
+
+        # then
+        assert monitor.lag_seconds is None
+        assert monitor.available(5) is False
+
+    def test_not_query_until_interval_expires(self):
+        """interval 동안은 마지막 측정값을 사용"""
+        # given
+        engine = _lag_engine(0)
+        monitor = ReplicaLagMonitor(engine, interval_seconds=60)
+
+        # when
+        monitor.refresh()
+        monitor.refresh()
+
+        # then
+        assert engine.connect.call_count == 1
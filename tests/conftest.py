@@ -1,6 +1,8 @@
 # tests/conftest.py
 import pytest
-from sqlalchemy import create_engine
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from app.src.config.database import Base  # 실제 모델 정의된 Base
 
@@ -12,12 +14,21 @@ engine = create_engine(TEST_DATABASE_URL)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _alembic_config() -> Config:
+    config = Config("alembic.ini")
+    config.set_main_option("sqlalchemy.url", TEST_DATABASE_URL)
+    return config
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_database():
+    # 이전 실행에서 남은 테이블을 정리하고, 운영과 같은 migration 으로 schema 를 생성한다
     Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    command.upgrade(_alembic_config(), "head")
     yield
-    Base.metadata.drop_all(bind=engine)
+    command.downgrade(_alembic_config(), "base")
 
 
 @pytest.fixture
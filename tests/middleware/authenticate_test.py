@@ -0,0 +1,191 @@
+import asyncio
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.src.common import metrics
+from app.src.middleware.authenticate import (
+    authenticate_admin,
+    authenticate_user,
+    token_cache,
+)
+from app.src.user import service as user_service, token_epoch
+from app.src.user.model import Role, User
+from app.src.user.token_epoch import token_epochs
+
+
+def _credentials(user: User) -> HTTPAuthorizationCredentials:
+    token = user_service._create_access_token(
+        data={
+            "sub": str(user.id),
+            "email": user.email,
+            "role": user.role.value,
+            "epoch": user.token_epoch,
+        }
+    )
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token.access_token)
+
+
+def _user(role: Role = Role.USER, token_epoch: int = 0) -> User:
+    return User(id=1, email="test@test.com", role=role, token_epoch=token_epoch)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    token_epochs.clear()
+    token_cache.clear()
+    metrics.counters.reset()
+    yield
+    token_epochs.clear()
+    token_cache.clear()
+
+
+@pytest.mark.unit
+class TestAuthenticateUser:
+    def test_build_principal_from_claims(self, mocker):
+        """토큰의 claim 으로 사용자 정보를 만들고, 캐시된 epoch 가 있으면 DB 를 조회하지 않음"""
+        # given
+        token_epochs.set(1, 0)
+        load = mocker.patch.object(token_epochs, "load")
+
+        # when
+        user = asyncio.run(authenticate_user(_credentials(_user())))
+
+        # then
+        assert (user.id, user.email, user.role) == (1, "test@test.com", Role.USER)
+        load.assert_not_called()
+
+    def test_load_epoch_when_not_cached(self, mocker):
+        """처음 인증하는 사용자는 epoch 를 조회해 캐시"""
+        # given
+        find_token_epochs = mocker.patch(
+            "app.src.user.repository.find_token_epochs", return_value={1: 0}
+        )
+        mocker.patch("app.src.user.token_epoch.SessionLocal")
+
+        # when
+        asyncio.run(authenticate_user(_credentials(_user())))
+        asyncio.run(authenticate_user(_credentials(_user())))
+
+        # then
+        find_token_epochs.assert_called_once()
+        assert token_epochs.get(1) == 0
+
+    def test_unauthorized_when_token_revoked(self):
+        """토큰의 epoch 가 현재 epoch 보다 작으면 폐기된 토큰으로 처리"""
+        # given
+        token_epochs.set(1, 1)
+
+        # when
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(authenticate_user(_credentials(_user(token_epoch=0))))
+
+        # then
+        assert e.value.status_code == 401
+
+    def test_unauthorized_when_user_not_exists(self, mocker):
+        """존재하지 않는 사용자의 토큰은 인증하지 않음"""
+        # given
+        mocker.patch("app.src.user.repository.find_token_epochs", return_value={})
+        mocker.patch("app.src.user.token_epoch.SessionLocal")
+
+        # when
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(authenticate_user(_credentials(_user())))
+
+        # then
+        assert e.value.status_code == 401
+
+    def test_unauthorized_when_claims_missing(self):
+        """사용자 정보 claim 이 없는 토큰은 인증하지 않음"""
+        # given
+        token = user_service._create_access_token(data={"sub": "test@test.com"})
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=token.access_token
+        )
+
+        # when
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(authenticate_user(credentials))
+
+        # then
+        assert e.value.status_code == 401
+
+    def test_forbidden_when_not_admin(self):
+        """관리자 인증은 토큰의 역할이 관리자가 아니면 403"""
+        # given
+        token_epochs.set(1, 0)
+
+        # when
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(authenticate_admin(_credentials(_user(Role.USER))))
+
+        # then
+        assert e.value.status_code == 403
+
+
+@pytest.mark.unit
+class TestTokenCache:
+    def test_reuse_verified_token(self, mocker):
+        """같은 토큰은 서명 검증 결과를 재사용하고, hit/miss 를 집계"""
+        # given
+        token_epochs.set(1, 0)
+        credentials = _credentials(_user())
+        decode = mocker.spy(jwt, "decode")
+
+        # when
+        asyncio.run(authenticate_user(credentials))
+        asyncio.run(authenticate_user(credentials))
+
+        # then
+        assert decode.call_count == 1
+        assert metrics.counters.get("auth.token_cache", "miss") == 1
+        assert metrics.counters.get("auth.token_cache", "hit") == 1
+
+    def test_revoked_token_rejected_even_if_cached(self):
+        """캐시된 토큰이라도 폐기되었다면 인증하지 않음"""
+        # given
+        token_epochs.set(1, 0)
+        credentials = _credentials(_user())
+        asyncio.run(authenticate_user(credentials))
+        token_epochs.set(1, 1)
+
+        # when
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(authenticate_user(credentials))
+
+        # then
+        assert e.value.status_code == 401
+
+
+@pytest.mark.unit
+class TestTokenEpochCache:
+    def test_refresh_cached_users(self, mocker):
+        """캐시된 사용자의 epoch 를 한 번에 갱신하고, 삭제된 사용자는 캐시에서 제거"""
+        # given
+        token_epochs.set(1, 0)
+        token_epochs.set(2, 0)
+        find_token_epochs = mocker.patch(
+            "app.src.user.repository.find_token_epochs", return_value={1: 3}
+        )
+        mocker.patch("app.src.user.token_epoch.SessionLocal")
+
+        # when
+        token_epochs.refresh()
+
+        # then
+        assert sorted(find_token_epochs.call_args.args[1]) == [1, 2]
+        assert token_epochs.get(1) == 3
+        assert token_epochs.get(2) is None
+
+    def test_apply_revocation_from_other_process(self):
+        """다른 프로세스에서 폐기한 토큰은 변경 알림을 받으면 바로 거부"""
+        # given
+        token_epochs.set(1, 0)
+
+        # when
+        token_epoch.apply({"origin": "other", "user_id": 1, "epoch": 2})
+
+        # then
+        assert token_epochs.get(1) == 2
@@ -0,0 +1,345 @@
+import asyncio
+import json
+import time
+import pytest
+from unittest.mock import MagicMock
+from fastapi import Depends, FastAPI, HTTPException, Request
+from sqlalchemy.exc import OperationalError
+
+from app.src.common import metrics
+from app.src.config.database import get_db_from_request
+from app.src.config.replica import READ_PRIMARY_COOKIE, read_from_replica
+from app.src.config.settings import LockMode
+from app.src.middleware.db_transaction import DBSessionMiddleware
+
+
+class _SerializationFailure(Exception):
+    pgcode = "40001"
+
+
+def _build_app(handler, method: str = "POST"):
+    app = FastAPI()
+    app.add_api_route("/items/{item_id}", handler, methods=[method])
+    app.add_middleware(DBSessionMiddleware)
+    return app
+
+
+def _post(app, path: str, body: dict, method: str = "POST"):
+    """ASGI 앱에 요청을 보내고 (status, body) 를 반환"""
+    start, content = _send(app, path, body, method)
+    return start["status"], json.loads(content)
+
+
+def _send(app, path: str, body: dict, method: str = "POST", headers=()):
+    """ASGI 앱에 요청을 보내고 (응답 시작 메시지, body) 를 반환"""
+    messages = []
+    payload = json.dumps(body).encode()
+    received = False
+
+    async def receive():
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json"), *headers],
+        "client": ("test", 0),
+        "server": ("test", 80),
+    }
+    asyncio.run(app(scope, receive, send))
+
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    content = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return start, content
+
+
+@pytest.fixture
+def sessions(mocker):
+    created = []
+
+    def session_factory(isolation_level=None, read_only=False, replica=False):
+        db = MagicMock()
+        db.isolation_level = isolation_level
+        db.read_only = read_only
+        db.replica = replica
+        created.append(db)
+        return db
+
+    mocker.patch(
+        "app.src.config.database.create_request_session",
+        side_effect=session_factory,
+    )
+    mocker.patch("app.src.config.settings.SERIALIZABLE_BACKOFF_BASE_MS", 0)
+    metrics.counters.reset()
+    return created
+
+
+@pytest.fixture
+def serializable(mocker):
+    mocker.patch(
+        "app.src.config.settings.RESERVATION_LOCK_MODE", LockMode.SERIALIZABLE
+    )
+
+
+@pytest.mark.unit
+class TestDBSession:
+    def test_commit_when_endpoint_succeeds(self, sessions):
+        """엔드포인트가 예외 없이 끝나면 commit 후 세션을 닫음"""
+        # given
+        async def handler(item_id: int, db=Depends(get_db_from_request)):
+            return {"id": item_id}
+
+        # when
+        status_code, _ = _post(_build_app(handler), "/items/1", {})
+
+        # then
+        assert status_code == 200
+        assert len(sessions) == 1
+        sessions[0].commit.assert_called_once()
+        sessions[0].rollback.assert_not_called()
+        sessions[0].close.assert_called_once()
+
+    def test_rollback_when_http_exception_raised(self, sessions):
+        """엔드포인트에서 HTTPException 이 발생하면 응답 코드와 상관없이 rollback"""
+        # given
+        async def handler(item_id: int, db=Depends(get_db_from_request)):
+            raise HTTPException(status_code=400, detail="잘못된 요청")
+
+        # when
+        status_code, content = _post(_build_app(handler), "/items/1", {})
+
+        # then
+        assert status_code == 400
+        assert content == {"detail": "잘못된 요청"}
+        sessions[0].rollback.assert_called_once()
+        sessions[0].commit.assert_not_called()
+        sessions[0].close.assert_called_once()
+
+    def test_not_commit_read_only_session_when_get_request(self, sessions):
+        """GET 요청은 읽기 전용 세션으로 처리하고 commit 하지 않음"""
+        # given
+        async def handler(item_id: int, db=Depends(get_db_from_request)):
+            return {"id": item_id}
+
+        # when
+        status_code, _ = _post(_build_app(handler, "GET"), "/items/1", {}, "GET")
+
+        # then
+        assert status_code == 200
+        assert sessions[0].read_only is True
+        sessions[0].commit.assert_not_called()
+        sessions[0].close.assert_called_once()
+
+    def test_not_create_session_when_endpoint_does_not_use_db(self, sessions):
+        """DB 를 사용하지 않는 엔드포인트는 세션을 생성하지 않음"""
+        # given
+        async def handler(item_id: int):
+            return {"id": item_id}
+
+        # when
+        status_code, _ = _post(_build_app(handler, "GET"), "/items/1", {}, "GET")
+
+        # then
+        assert status_code == 200
+        assert sessions == []
+
+
+@pytest.mark.unit
+class TestSerializableRetry:
+    def test_replay_request_when_serialization_failure(self, sessions, serializable):
+        """직렬화 실패가 발생하면, 새 세션과 같은 body 로 요청을 다시 실행하고 라우트 별 재시도 횟수를 집계"""
+        # given
+        bodies = []
+
+        async def handler(
+            item_id: int, request: Request, db=Depends(get_db_from_request)
+        ):
+            bodies.append(await request.json())
+            if len(bodies) == 1:
+                raise OperationalError("update", {}, _SerializationFailure())
+            return {"id": item_id}
+
+        app = _build_app(handler)
+
+        # when
+        status_code, content = _post(app, "/items/1", {"name": "test"})
+
+        # then
+        assert status_code == 200
+        assert content == {"id": 1}
+        assert bodies == [{"name": "test"}, {"name": "test"}]
+        assert [db.isolation_level for db in sessions] == ["SERIALIZABLE"] * 2
+        sessions[0].rollback.assert_called_once()
+        sessions[0].commit.assert_not_called()
+        sessions[1].commit.assert_called_once()
+        assert metrics.counters.get("serializable.retries", "/items/{item_id}") == 1
+
+    def test_replay_request_when_commit_fails(self, sessions, serializable):
+        """commit 중 직렬화 실패가 발생해도 요청을 다시 실행"""
+        # given
+        async def handler(item_id: int, db=Depends(get_db_from_request)):
+            if len(sessions) == 1:
+                db.commit.side_effect = OperationalError(
+                    "commit", {}, _SerializationFailure()
+                )
+            return {"id": item_id}
+
+        # when
+        status_code, _ = _post(_build_app(handler), "/items/1", {})
+
+        # then
+        assert status_code == 200
+        assert len(sessions) == 2
+        sessions[1].commit.assert_called_once()
+        assert metrics.counters.get("serializable.retries", "/items/{item_id}") == 1
+
+    def test_conflict_when_retry_exhausted(self, mocker, sessions, serializable):
+        """직렬화 실패가 계속되면, 최대 재시도 횟수만큼 재실행한 뒤 409 응답"""
+        # given
+        mocker.patch("app.src.config.settings.SERIALIZABLE_MAX_RETRIES", 2)
+
+        async def handler(item_id: int, db=Depends(get_db_from_request)):
+            raise OperationalError("update", {}, _SerializationFailure())
+
+        app = _build_app(handler)
+
+        # when
+        status_code, content = _post(app, "/items/1", {})
+
+        # then
+        assert status_code == 409
+        assert content["detail"] == "다른 요청과 충돌했습니다. 잠시 후 다시 시도해주세요."
+        assert len(sessions) == 3
+        assert all(db.commit.call_count == 0 for db in sessions)
+        assert metrics.counters.get("serializable.retries", "/items/{item_id}") == 3
+
+    def test_not_buffer_or_replay_bulk_import(self, sessions, serializable):
+        """batch 마다 commit 하는 일괄 등록 요청은 SERIALIZABLE 로 버퍼링/재실행하지 않음"""
+        # given
+        calls = []
+
+        async def handler():
+            calls.append(1)
+            raise OperationalError("insert", {}, _SerializationFailure())
+
+        app = FastAPI()
+        app.add_api_route("/reservations/import", handler, methods=["POST"])
+        app.add_middleware(DBSessionMiddleware)
+
+        # when
+        with pytest.raises(OperationalError):
+            _post(app, "/reservations/import", {})
+
+        # then
+        assert calls == [1]
+        assert metrics.counters.get("serializable.retries", "/reservations/import") == 0
+
+
+@pytest.fixture
+def replica(mocker):
+    monitor = MagicMock(expired=False)
+    monitor.available.return_value = True
+    mocker.patch("app.src.config.database.replica_monitor", monitor)
+    mocker.patch("app.src.config.settings.REPLICA_DATABASE_URL", "postgresql://replica")
+    return monitor
+
+
+@pytest.mark.unit
+class TestReplicaRouting:
+    def test_read_from_replica_when_replica_route(self, sessions, replica):
+        """replica 조회 대상 엔드포인트의 GET 요청은 replica 세션으로 조회"""
+        # given
+        @read_from_replica
+        async def handler(item_id: int, db=Depends(get_db_from_request)):
+            return {"id": item_id}
+
+        # when
+        status_code, _ = _post(_build_app(handler, "GET"), "/items/1", {}, "GET")
+
+        # then
+        assert status_code == 200
+        assert sessions[0].replica is True
+
+    def test_read_from_primary_when_not_replica_route(self, sessions, replica):
+        """replica 조회 대상이 아닌 엔드포인트는 primary 로 조회"""
+        # given
+        async def handler(item_id: int, db=Depends(get_db_from_request)):
+            return {"id": item_id}
+
+        # when
+        _post(_build_app(handler, "GET"), "/items/1", {}, "GET")
+
+        # then
+        assert sessions[0].replica is False
+
+    def test_read_from_primary_when_replica_lagging(self, sessions, replica):
+        """복제 지연이 허용 범위를 넘으면 primary 로 조회"""
+        # given
+        replica.available.return_value = False
+
+        @read_from_replica
+        async def handler(item_id: int, db=Depends(get_db_from_request)):
+            return {"id": item_id}
+
+        # when
+        _post(_build_app(handler, "GET"), "/items/1", {}, "GET")
+
+        # then
+        assert sessions[0].replica is False
+
+    def test_read_from_primary_after_own_write(self, sessions, replica):
+        """read-your-writes cookie 가 유효하면 primary 로 조회"""
+        # given
+        @read_from_replica
+        async def handler(item_id: int, db=Depends(get_db_from_request)):
+            return {"id": item_id}
+
+        cookie = f"{READ_PRIMARY_COOKIE}={int(time.time()) + 60}".encode()
+
+        # when
+        _send(
+            _build_app(handler, "GET"), "/items/1", {}, "GET", [(b"cookie", cookie)]
+        )
+
+        # then
+        assert sessions[0].replica is False
+
+    def test_set_read_your_writes_cookie_when_write_succeeds(self, sessions, replica):
+        """쓰기 요청이 성공하면 read-your-writes cookie 를 응답에 추가"""
+        # given
+        async def handler(item_id: int, db=Depends(get_db_from_request)):
+            return {"id": item_id}
+
+        # when
+        start, _ = _send(_build_app(handler), "/items/1", {})
+
+        # then
+        cookies = [value for name, value in start["headers"] if name == b"set-cookie"]
+        assert len(cookies) == 1
+        assert cookies[0].startswith(READ_PRIMARY_COOKIE.encode() + b"=")
+
+    def test_not_set_cookie_when_write_fails(self, sessions, replica):
+        """쓰기 요청이 실패하면 cookie 를 추가하지 않음"""
+        # given
+        async def handler(item_id: int, db=Depends(get_db_from_request)):
+            raise HTTPException(status_code=400, detail="잘못된 요청")
+
+        # when
+        start, _ = _send(_build_app(handler), "/items/1", {})
+
+        # then
+        assert all(name != b"set-cookie" for name, _ in start["headers"])
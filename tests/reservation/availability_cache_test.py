@@ -0,0 +1,194 @@
+import datetime
+import sys
+from array import array
+import pytest
+from unittest.mock import MagicMock
+
+from app.src.reservation import service as reservation_service
+from app.src.reservation.availability_cache import (
+    SLOTS_PER_DAY,
+    AvailabilityCache,
+    availability_cache,
+)
+from app.src.reservation.dto.request.get_available_schedule_request import (
+    GetAvailableScheduleRequest,
+)
+from app.src.reservation.utils.slot import count_slots
+
+
+def _slot_usages(db, start, end, status):
+    return [100] * count_slots(start, end)
+
+
+def _usages(used: int = 0) -> array:
+    return array("i", [used] * SLOTS_PER_DAY)
+
+
+def _request(days: int) -> GetAvailableScheduleRequest:
+    start = datetime.date.today() + datetime.timedelta(days=3)
+    end = start + datetime.timedelta(days=days - 1)
+    return GetAvailableScheduleRequest(start=start.isoformat(), end=end.isoformat())
+
+
+@pytest.fixture()
+def day():
+    return datetime.date(2025, 5, 1)
+
+
+@pytest.fixture(autouse=True)
+def clear_availability_cache():
+    availability_cache.clear()
+    yield
+    availability_cache.clear()
+
+
+@pytest.mark.unit
+class TestAvailabilityCache:
+    def test_not_store_when_invalidated_during_query(self, day):
+        """조회 중 해당 일자가 무효화되었다면, 조회 결과를 저장하지 않음"""
+        # given
+        cache = AvailabilityCache(max_bytes=1024 * 1024, ttl_seconds=60)
+        generation = cache.generation(day)
+        midnight = datetime.datetime.combine(day, datetime.time.min)
+        cache.invalidate(midnight, midnight + datetime.timedelta(hours=1))
+
+        # when
+        cache.put(day, _usages(), generation)
+
+        # then
+        assert cache.get(day) is None
+
+    def test_not_store_when_flushed_during_query(self, day):
+        """조회 중 캐시 전체가 비워졌다면(알림 수신 재연결), 조회 결과를 저장하지 않음"""
+        # given
+        cache = AvailabilityCache(max_bytes=1024 * 1024, ttl_seconds=60)
+        cache.put(day, _usages(), cache.generation(day))
+        generation = cache.generation(day)
+        cache.flush()
+
+        # when
+        cache.put(day, _usages(), generation)
+
+        # then
+        assert cache.get(day) is None
+        assert cache.stats()["bytes"] == 0
+
+    def test_invalidate_only_overlapping_days(self, day):
+        """예약 구간이 걸친 일자만 무효화"""
+        # given
+        cache = AvailabilityCache(max_bytes=1024 * 1024, ttl_seconds=60)
+        days = [day + datetime.timedelta(days=idx) for idx in range(3)]
+        for target in days:
+            cache.put(target, _usages(), cache.generation(target))
+        start = datetime.datetime.combine(days[0], datetime.time(23, 0))
+
+        # when
+        cache.invalidate(start, start + datetime.timedelta(hours=1))
+
+        # then
+        assert cache.get(days[0]) is None
+        assert cache.get(days[1]) is not None
+        assert cache.get(days[2]) is not None
+
+    def test_evict_least_recently_used_when_memory_exceeded(self, day):
+        """사용 메모리가 최대치를 넘으면 오래 사용하지 않은 일자부터 제거"""
+        # given
+        cache = AvailabilityCache(
+            max_bytes=sys.getsizeof(_usages()) * 2, ttl_seconds=60
+        )
+        days = [day + datetime.timedelta(days=idx) for idx in range(3)]
+        cache.put(days[0], _usages(), 0)
+        cache.put(days[1], _usages(), 0)
+        cache.get(days[0])
+
+        # when
+        cache.put(days[2], _usages(), 0)
+
+        # then
+        assert cache.get(days[1]) is None
+        assert cache.get(days[0]) is not None
+        assert cache.stats()["days"] == 2
+
+    def test_expire_after_ttl(self, day):
+        """ttl 이 지난 일자는 다시 조회"""
+        # given
+        cache = AvailabilityCache(max_bytes=1024 * 1024, ttl_seconds=0)
+
+        # when
+        cache.put(day, _usages(), 0)
+
+        # then
+        assert cache.get(day) is None
+
+
+@pytest.mark.unit
+class TestCachedAvailableSchedules:
+    def test_reuse_cached_days(self, mocker):
+        """조회한 일자는 캐시에서 반환하고, 캐시에 없는 일자만 집계"""
+        # given
+        db = MagicMock()
+        find_slot_usages = mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            side_effect=_slot_usages,
+        )
+        reservation_service.find_available_schedules(db, _request(days=1))
+
+        # when
+        result = reservation_service.find_available_schedules(db, _request(days=3))
+
+        # then
+        assert find_slot_usages.call_count == 2
+        _, start, end, _ = find_slot_usages.call_args.args
+        assert (end - start).days == 2
+        assert len(result) == 1
+        assert availability_cache.stats()["hits"] == 1
+
+    def test_query_again_after_write_commits(self, mocker):
+        """확정 인원이 변경된 일자는 commit 이후에 다시 집계"""
+        # given
+        db = MagicMock()
+        db.info = {}
+        request = _request(days=1)
+        mocker.patch("app.src.reservation.service._find_slot_capacities")
+        mocker.patch("app.src.reservation.repository.increase_slot_capacity")
+        find_slot_usages = mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            side_effect=_slot_usages,
+        )
+        reservation_service.find_available_schedules(db, request)
+
+        # when
+        start = request.start + datetime.timedelta(hours=10)
+        reservation_service._release_slot_capacity(
+            db, start, start + datetime.timedelta(hours=1), 10
+        )
+        reservation_service.find_available_schedules(db, request)
+        calls_before_commit = find_slot_usages.call_count
+
+        for callback in db.info.pop("after_commit"):
+            callback()
+        reservation_service.find_available_schedules(db, request)
+
+        # then
+        assert calls_before_commit == 1
+        assert find_slot_usages.call_count == 2
+
+    def test_not_cache_days_read_from_replica(self, mocker):
+        """replica 에서 집계한 일자는 캐시하지 않아, 이후 primary 조회가 DB 에서 다시 집계"""
+        # given
+        replica_db, primary_db = MagicMock(), MagicMock()
+        replica_db.info = {"replica": True}
+        primary_db.info = {}
+        find_slot_usages = mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            side_effect=_slot_usages,
+        )
+        request = _request(days=1)
+        reservation_service.find_available_schedules(replica_db, request)
+
+        # when
+        reservation_service.find_available_schedules(primary_db, request)
+
+        # then
+        assert find_slot_usages.call_count == 2
+        assert find_slot_usages.call_args.args[0] is primary_db
@@ -0,0 +1,224 @@
+import asyncio
+import datetime
+import json
+import pytest
+from unittest.mock import MagicMock
+from fastapi import FastAPI
+
+from app.src.common.token import Principal
+from app.src.middleware.authenticate import authenticate_user
+from app.src.reservation import bulk_import
+from app.src.reservation.router import router
+from app.src.reservation.utils.constants import MAX_CAPACITY
+from app.src.reservation.utils.slot import count_slots
+from app.src.user.model import Role
+
+
+def _start_time(days: int = 10) -> datetime.datetime:
+    base = datetime.datetime.now() + datetime.timedelta(days=days)
+    return base.replace(hour=12, minute=0, second=0, microsecond=0)
+
+
+def _format(value: datetime.datetime) -> str:
+    return value.strftime("%Y-%m-%d %H:%M")
+
+
+async def _chunks(body: bytes, size: int = 7):
+    # 행 경계와 상관없이 잘린 chunk 로 전달되는 상황을 흉내낸다
+    for idx in range(0, len(body), size):
+        yield body[idx : idx + size]
+
+
+def _import(content_type: str, body: bytes, batch_size: int = 500):
+    async def collect():
+        return [
+            json.loads(line)
+            async for line in bulk_import.import_reservations(
+                1, content_type, _chunks(body), batch_size
+            )
+        ]
+
+    return asyncio.run(collect())
+
+
+def _post_in_chunks(app, path: str, content_type: str, chunks):
+    """
+    본문을 여러 http.request 메시지로 나누어 보내고 (status, body) 를 반환
+    uvicorn 처럼 ASGI spec 2.3 을 사용해, 응답 중에도 receive 를 호출하는 StreamingResponse 동작을 재현한다.
+    """
+    messages = []
+
+    async def run():
+        queue = asyncio.Queue()
+        for idx, chunk in enumerate(chunks):
+            more_body = idx < len(chunks) - 1
+            queue.put_nowait(
+                {"type": "http.request", "body": chunk, "more_body": more_body}
+            )
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"content-type", content_type.encode())],
+            "client": ("test", 0),
+            "server": ("test", 80),
+        }
+        # 본문 메시지를 잃어버리면 요청 본문을 끝까지 기다리므로, 시간 제한을 둔다
+        await asyncio.wait_for(app(scope, queue.get, send), timeout=5)
+
+    asyncio.run(run())
+    start = messages[0]
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return start["status"], body
+
+
+@pytest.fixture
+def mock_session(mocker):
+    db = MagicMock()
+    mocker.patch("app.src.reservation.bulk_import.SessionLocal", return_value=db)
+    return db
+
+
+@pytest.mark.unit
+class TestImportReservations:
+    def test_stream_row_results_for_ndjson(self, mocker, mock_session):
+        """NDJSON 행을 검증해, 형식/검증 오류와 정원 초과 행은 사유와 함께, 등록된 행은 ID 와 함께 반환"""
+        # given
+        start = _start_time()
+        end = start + datetime.timedelta(hours=1)
+        rows = [
+            {"start": _format(start), "end": _format(end), "reservation_name": "a", "number_of_people": 100},
+            "not json",
+            {"start": _format(start), "end": _format(end), "reservation_name": "b", "number_of_people": 0},
+            {"start": _format(start), "end": _format(end), "reservation_name": "c", "number_of_people": 1000},
+        ]
+        body = "\n".join(
+            row if isinstance(row, str) else json.dumps(row) for row in rows
+        ).encode()
+
+        usage_function = mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            return_value=[MAX_CAPACITY - 500] * count_slots(start, end),
+        )
+        create_function = mocker.patch(
+            "app.src.reservation.repository.create_all", return_value=[10]
+        )
+
+        # when
+        result = _import("application/x-ndjson", body)
+
+        # then
+        assert [line.get("line") for line in result[:2]] == [2, 3]
+        assert result[0]["created"] is False
+        assert result[1]["detail"].startswith("number_of_people")
+        assert result[2] == {"line": 1, "created": True, "reservation_id": 10, "detail": None}
+        assert result[3]["line"] == 4
+        assert result[3]["detail"] == "예약 가능 인원을 초과했습니다."
+        assert result[4] == {"created_count": 1, "failed_count": 3}
+
+        assert usage_function.call_count == 1
+        assert create_function.call_count == 1
+        assert [r.reservation_name for r in create_function.call_args.args[1]] == ["a"]
+        mock_session.commit.assert_called_once()
+
+    def test_report_non_string_datetime_as_row_error(self, mocker, mock_session):
+        """시작/종료 시간이 문자열이 아닌 행은 행 별 오류로 반환하고, 이후 행은 계속 처리"""
+        # given
+        start = _start_time()
+        end = start + datetime.timedelta(hours=1)
+        rows = [
+            {"start": 202505011200, "end": None, "reservation_name": "a", "number_of_people": 1},
+            {"start": _format(start), "end": _format(end), "reservation_name": "b", "number_of_people": 1},
+        ]
+        body = "\n".join(json.dumps(row) for row in rows).encode()
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            return_value=[0] * count_slots(start, end),
+        )
+        mocker.patch("app.src.reservation.repository.create_all", return_value=[10])
+
+        # when
+        result = _import("application/x-ndjson", body)
+
+        # then
+        assert result[0]["line"] == 1
+        assert result[0]["created"] is False
+        assert result[0]["detail"].startswith("start")
+        assert result[1] == {"line": 2, "created": True, "reservation_id": 10, "detail": None}
+        assert result[2] == {"created_count": 1, "failed_count": 1}
+
+    def test_import_csv_in_batches(self, mocker, mock_session):
+        """CSV 의 첫 행을 header 로 사용하고, batch 크기마다 정원 검사/등록"""
+        # given
+        start = _start_time()
+        lines = ["start,end,reservation_name,number_of_people"]
+        for idx in range(3):
+            row_start = start + datetime.timedelta(hours=idx)
+            row_end = row_start + datetime.timedelta(minutes=30)
+            lines.append(f"{_format(row_start)},{_format(row_end)},exam {idx},10")
+        body = "\r\n".join(lines).encode()
+
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            side_effect=lambda db, start, end, status: [0] * count_slots(start, end),
+        )
+        create_function = mocker.patch(
+            "app.src.reservation.repository.create_all",
+            side_effect=lambda db, reservations: list(range(len(reservations))),
+        )
+
+        # when
+        result = _import("text/csv", body, batch_size=2)
+
+        # then
+        assert [line.get("created") for line in result[:3]] == [True, True, True]
+        assert result[-1] == {"created_count": 3, "failed_count": 0}
+        assert create_function.call_count == 2
+        assert mock_session.commit.call_count == 2
+
+
+@pytest.mark.unit
+class TestImportReservationsRouter:
+    def test_import_every_row_when_body_arrives_in_chunks(self, mocker, mock_session):
+        """본문이 여러 메시지로 나뉘어 도착해도, 응답 시작 전에 모두 읽어 모든 행을 등록"""
+        # given
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[authenticate_user] = lambda: Principal(
+            id=1, email="test@test.com", role=Role.USER
+        )
+        start = _start_time()
+        end = start + datetime.timedelta(minutes=30)
+        row = json.dumps(
+            {"start": _format(start), "end": _format(end), "reservation_name": "a", "number_of_people": 1}
+        )
+        chunks = [("\n".join([row] * 10) + "\n").encode() for _ in range(20)]
+
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            side_effect=lambda db, start, end, status: [0] * count_slots(start, end),
+        )
+        mocker.patch(
+            "app.src.reservation.repository.create_all",
+            side_effect=lambda db, reservations: list(range(len(reservations))),
+        )
+
+        # when
+        status_code, body = _post_in_chunks(
+            app, "/reservations/import", "application/x-ndjson", chunks
+        )
+
+        # then
+        result = [json.loads(line) for line in body.decode().splitlines()]
+        assert status_code == 200
+        assert result[-1] == {"created_count": 200, "failed_count": 0}
@@ -0,0 +1,171 @@
+import datetime
+import pytest
+
+from app.src.config.database import XactSnapshot
+from app.src.reservation import capacity_index as capacity_index_module
+from app.src.reservation.capacity_index import CapacityIndex
+from app.src.reservation.model import Reservation, ReservationStatus
+from app.src.reservation.utils.constants import MAX_CAPACITY
+
+
+@pytest.fixture()
+def origin():
+    return datetime.datetime(2025, 5, 1)
+
+
+@pytest.fixture()
+def capacity_index(origin):
+    index = CapacityIndex(horizon_days=2)
+    index.build(
+        origin,
+        [
+            Reservation(
+                id=1,
+                start_time=origin + datetime.timedelta(hours=10),
+                end_time=origin + datetime.timedelta(hours=11),
+                number_of_people=30000,
+                status=ReservationStatus.CONFIRMED,
+            ),
+            Reservation(
+                id=2,
+                start_time=origin + datetime.timedelta(hours=10),
+                end_time=origin + datetime.timedelta(hours=11),
+                number_of_people=30000,
+                status=ReservationStatus.PENDING,
+            ),
+        ],
+    )
+    return index
+
+
+@pytest.mark.unit
+class TestCapacityIndex:
+    """CapacityIndex 테스트"""
+
+    def test_return_none_when_index_is_not_built(self, origin):
+        """인덱스가 생성되지 않았다면 판단할 수 없으므로 None 반환"""
+        index = CapacityIndex(horizon_days=2)
+
+        assert index.fits(origin, origin + datetime.timedelta(hours=1), 1) is None
+
+    def test_return_none_when_range_is_out_of_horizon(self, origin, capacity_index):
+        """인덱스 범위를 벗어나는 구간은 판단할 수 없으므로 None 반환"""
+        start = origin + datetime.timedelta(days=2)
+
+        assert capacity_index.fits(start, start + datetime.timedelta(hours=1), 1) is None
+
+    def test_only_confirmed_reservations_are_counted(self, origin, capacity_index):
+        """확정된 예약만 예약 가능 인원에서 차감된다"""
+        start = origin + datetime.timedelta(hours=10)
+        end = origin + datetime.timedelta(hours=11)
+
+        assert capacity_index.fits(start, end, MAX_CAPACITY - 30000) is True
+        assert capacity_index.fits(start, end, MAX_CAPACITY - 30000 + 1) is False
+
+    def test_partially_overlapping_range_uses_minimum_slot(
+        self, origin, capacity_index
+    ):
+        """구간 일부만 예약과 겹쳐도, 가장 적게 남은 슬롯을 기준으로 판단한다"""
+        start = origin + datetime.timedelta(hours=10, minutes=50)
+        end = origin + datetime.timedelta(hours=12)
+
+        assert capacity_index.fits(start, end, MAX_CAPACITY - 30000 + 1) is False
+        assert capacity_index.fits(end, end + datetime.timedelta(hours=1), MAX_CAPACITY)
+
+    def test_reserve_and_release_update_capacity(self, origin, capacity_index):
+        """확정/취소가 반영되면 해당 구간의 예약 가능 인원이 갱신된다"""
+        start = origin + datetime.timedelta(hours=13)
+        end = origin + datetime.timedelta(hours=14)
+
+        capacity_index.reserve(start, end, MAX_CAPACITY)
+        assert capacity_index.fits(start, end, 1) is False
+        assert capacity_index.fits(end, end + datetime.timedelta(minutes=30), 1)
+
+        capacity_index.release(start, end, MAX_CAPACITY)
+        assert capacity_index.fits(start, end, MAX_CAPACITY) is True
+
+    def test_clip_reservation_when_reservation_starts_before_origin(self, origin):
+        """인덱스 범위 이전에 시작한 예약은 범위 안의 슬롯에만 반영되어야 한다"""
+        index = CapacityIndex(horizon_days=1)
+        index.build(
+            origin,
+            [
+                Reservation(
+                    id=1,
+                    start_time=origin - datetime.timedelta(hours=1),
+                    end_time=origin + datetime.timedelta(minutes=30),
+                    number_of_people=MAX_CAPACITY,
+                    status=ReservationStatus.CONFIRMED,
+                )
+            ],
+        )
+
+        half_hour = origin + datetime.timedelta(minutes=30)
+        assert index.fits(origin, half_hour, 1) is False
+        assert index.fits(half_hour, origin + datetime.timedelta(days=1), MAX_CAPACITY)
+
+    def test_replay_changes_applied_while_rebuilding(self, origin, capacity_index):
+        """재생성 중 기존 인덱스에 반영된 확정/취소는 새 인덱스로 교체한 뒤에도 유지된다"""
+        # given
+        start = origin + datetime.timedelta(hours=13)
+        half_hour = start + datetime.timedelta(minutes=30)
+        end = origin + datetime.timedelta(hours=14)
+        capacity_index.begin_build()
+        capacity_index.reserve(start, end, MAX_CAPACITY)
+        capacity_index.release(start, half_hour, 100)
+
+        # when
+        capacity_index.build(origin, [])
+
+        # then
+        assert capacity_index.fits(start, half_hour, 100) is True
+        assert capacity_index.fits(start, half_hour, 101) is False
+        assert capacity_index.fits(half_hour, end, 1) is False
+
+    def test_not_replay_changes_after_build_is_cancelled(self, origin, capacity_index):
+        """재생성이 취소되면 이후 변경을 모으지 않는다"""
+        # given
+        start = origin + datetime.timedelta(hours=13)
+        end = origin + datetime.timedelta(hours=14)
+        capacity_index.begin_build()
+        capacity_index.cancel_build()
+        capacity_index.reserve(start, end, MAX_CAPACITY)
+
+        # when
+        capacity_index.build(origin, [])
+
+        # then
+        assert capacity_index.fits(start, end, MAX_CAPACITY) is True
+
+    def test_rebuild_replays_only_changes_not_in_snapshot(self, mocker, origin):
+        """재생성 쿼리 중 도착한 변경은, 조회 snapshot 에 포함되지 않은 트랜잭션의 변경만 새 인덱스에 반영된다"""
+        # given
+        index = CapacityIndex(horizon_days=2)
+        mocker.patch.object(capacity_index_module, "capacity_index", index)
+        mocker.patch(
+            "app.src.reservation.capacity_index.current_snapshot",
+            return_value=XactSnapshot("100:105:103"),
+        )
+        today = datetime.datetime.combine(datetime.date.today(), datetime.time.min)
+        committed_start = today + datetime.timedelta(hours=10)
+        committed_end = today + datetime.timedelta(hours=11)
+        start = today + datetime.timedelta(hours=13)
+        end = today + datetime.timedelta(hours=14)
+
+        def find_all(*args):
+            # snapshot 이전에 commit 되어 조회 결과에 이미 반영된 취소(99)와, snapshot 시점에 진행 중이던 확정(103)
+            index.release(committed_start, committed_end, 100, 99)
+            index.reserve(start, end, MAX_CAPACITY, 103)
+            return []
+
+        mocker.patch(
+            "app.src.reservation.repository.find_all_by_range_and_status",
+            side_effect=find_all,
+        )
+
+        # when
+        capacity_index_module.rebuild(mocker.MagicMock())
+
+        # then
+        assert index.fits(start, end, 1) is False
+        assert index.fits(committed_start, committed_end, MAX_CAPACITY + 1) is False
@@ -0,0 +1,84 @@
+import datetime
+import pytest
+from array import array
+from unittest.mock import MagicMock
+
+from app.src.reservation import changes as reservation_changes
+from app.src.reservation.availability_cache import SLOTS_PER_DAY, availability_cache
+from app.src.reservation.capacity_index import CapacityIndex
+from app.src.reservation.utils.constants import MAX_CAPACITY
+
+
+@pytest.fixture()
+def origin():
+    return datetime.datetime(2025, 5, 1)
+
+
+@pytest.fixture()
+def capacity_index(mocker, origin):
+    index = CapacityIndex(horizon_days=2)
+    index.build(origin, [])
+    mocker.patch.object(reservation_changes, "capacity_index", index)
+    return index
+
+
+@pytest.fixture(autouse=True)
+def clear_availability_cache():
+    availability_cache.clear()
+    yield
+    availability_cache.clear()
+
+
+@pytest.mark.unit
+class TestReservationChanges:
+    def test_publish_changes_in_transaction(self, mocker, origin):
+        """확정 인원 변경을 현재 트랜잭션 ID 와 함께 NOTIFY 로 발행"""
+        # given
+        notify = mocker.patch("app.src.config.invalidation.notify")
+        db = MagicMock()
+        db.info = {"xact_id": 42}
+        end = origin + datetime.timedelta(hours=1)
+
+        # when
+        reservation_changes.publish(db, [(origin, end, -100)])
+
+        # then
+        notify.assert_called_once_with(
+            db,
+            reservation_changes.CHANNEL,
+            {"xact_id": 42, "changes": [[origin.isoformat(), end.isoformat(), -100]]},
+        )
+
+    def test_not_publish_when_disabled(self, mocker, origin):
+        """변경 알림을 사용하지 않으면 발행하지 않음"""
+        # given
+        mocker.patch("app.src.config.settings.INVALIDATION_BUS_ENABLED", False)
+        db = MagicMock()
+
+        # when
+        reservation_changes.publish(
+            db, [(origin, origin + datetime.timedelta(hours=1), -100)]
+        )
+
+        # then
+        db.execute.assert_not_called()
+
+    def test_apply_changes_from_other_process(self, capacity_index, origin):
+        """다른 프로세스의 변경은 조회 캐시를 무효화하고 슬롯 용량 인덱스에 반영"""
+        # given
+        day = origin.date()
+        availability_cache.put(day, array("i", [0] * SLOTS_PER_DAY), 0)
+        start = origin + datetime.timedelta(hours=10)
+        end = start + datetime.timedelta(hours=1)
+        payload = {
+            "origin": "other",
+            "changes": [[start.isoformat(), end.isoformat(), -MAX_CAPACITY]],
+        }
+
+        # when
+        reservation_changes.apply(payload)
+
+        # then
+        assert availability_cache.get(day) is None
+        assert capacity_index.fits(start, end, 1) is False
+        assert capacity_index.fits(end, end + datetime.timedelta(hours=1), 1) is True
@@ -0,0 +1,55 @@
+import datetime
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from app.src.reservation import repository as reservation_repository
+from app.src.reservation.dto.request.get_reservations_request import (
+    GetReservationsRequest,
+)
+from app.src.reservation.model import Reservation
+from app.src.reservation.utils.cursor import decode_cursor, encode_cursor, next_cursor
+
+
+@pytest.mark.unit
+class TestCursor:
+    def test_decode_encoded_cursor(self):
+        """cursor 로 변환한 (start_time, id)를 그대로 복원"""
+        # given
+        start_time = datetime.datetime(2025, 5, 1, 10, 30)
+
+        # when
+        cursor = encode_cursor(start_time, 42)
+
+        # then
+        assert decode_cursor(cursor) == (start_time, 42)
+
+    def test_raise_validation_error_when_cursor_invalid(self):
+        """올바르지 않은 cursor 는 요청 검증 오류"""
+        with pytest.raises(ValidationError):
+            GetReservationsRequest(start="2025-05-01", end="2025-05-01", cursor="invalid")
+
+    def test_next_cursor_only_when_page_full(self):
+        """조회 결과가 limit 만큼 채워졌을 때만 마지막 예약의 cursor 를 반환"""
+        # given
+        start_time = datetime.datetime(2025, 5, 1, 10, 30)
+        reservations = [Reservation(id=1, start_time=start_time)]
+
+        # then
+        assert next_cursor(reservations, 2) is None
+        assert decode_cursor(next_cursor(reservations, 1)) == (start_time, 1)
+
+    def test_keyset_query_without_offset(self):
+        """cursor 로 조회하면 offset 없이 (start_time, id) 비교 조건으로 조회"""
+        # given
+        after = (datetime.datetime(2025, 5, 1, 10, 30), 42)
+
+        # when
+        query = reservation_repository._paginate(Query(Reservation), 500, 10, after)
+        sql = str(query.statement.compile(dialect=postgresql.dialect()))
+
+        # then
+        assert "(reservations.start_time, reservations.id) >" in sql
+        assert "ORDER BY reservations.start_time ASC, reservations.id ASC" in sql
+        assert "OFFSET" not in sql
@@ -0,0 +1,155 @@
+import datetime
+import json
+from typing import List, Tuple
+import pytest
+from sqlalchemy import event, insert, text
+
+from app.src.common.token import Principal
+from app.src.reservation import repository as reservation_repository
+from app.src.reservation.model import Reservation, ReservationStatus, SlotCapacity
+from app.src.reservation.utils.constants import MAX_CAPACITY, SLOT_MINUTES
+from app.src.reservation.utils.slot import SLOT_DELTA
+from app.src.user import repository as user_repository
+from app.src.user.model import Role, User
+
+ORIGIN = datetime.datetime(2025, 5, 1)
+DAYS = 180
+USERS = 50
+RESERVATIONS_PER_DAY = 200
+
+# 인덱스 없이 전체를 읽으면 안 되는 테이블
+INDEXED_TABLES = {"reservations", "slot_capacity", "users"}
+
+
+@pytest.fixture()
+def seeded_db(db_session):
+    """예약 가능 기간 전체에 예약이 분포된 데이터를 생성하고 통계를 갱신"""
+    db_session.execute(
+        insert(User),
+        [
+            {"id": i, "email": f"user{i}@test.com", "user_name": f"user{i}", "role": Role.USER}
+            for i in range(1, USERS + 1)
+        ],
+    )
+
+    statuses = list(ReservationStatus)
+    rows = []
+    for day in range(DAYS):
+        for i in range(RESERVATIONS_PER_DAY):
+            start = ORIGIN + datetime.timedelta(days=day, minutes=10 * (i % 120))
+            rows.append(
+                {
+                    "user_id": i % USERS + 1,
+                    "reservation_name": f"seed-{day}-{i}",
+                    "start_time": start,
+                    "end_time": start + datetime.timedelta(hours=1),
+                    "number_of_people": 10,
+                    "status": statuses[i % len(statuses)],
+                }
+            )
+    db_session.execute(insert(Reservation), rows)
+
+    db_session.execute(
+        insert(SlotCapacity),
+        [
+            {"slot_start": ORIGIN + SLOT_DELTA * i, "remaining": MAX_CAPACITY}
+            for i in range(DAYS * 24 * 60 // SLOT_MINUTES)
+        ],
+    )
+
+    for table in INDEXED_TABLES:
+        db_session.execute(text(f"ANALYZE {table}"))
+    return db_session
+
+
+def _capture_selects(db, operation) -> List[Tuple[str, dict]]:
+    """operation 이 실행한 SELECT 문과 파라미터를 수집"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        operation(db)
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+    return statements
+
+
+def _seq_scanned_tables(db, statement: str, parameters) -> List[str]:
+    cursor = db.connection().connection.cursor()
+    cursor.execute("EXPLAIN (FORMAT JSON) " + statement, parameters)
+    plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    tables = []
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in INDEXED_TABLES:
+            tables.append(node["Relation Name"])
+        nodes.extend(node.get("Plans", []))
+    return tables
+
+
+DAY = ORIGIN + datetime.timedelta(days=90)
+NEXT_DAY = DAY + datetime.timedelta(days=1)
+USER = Principal(id=1, email="user1@test.com", role=Role.USER)
+CONFIRMED = [ReservationStatus.CONFIRMED]
+
+REPOSITORY_QUERIES = {
+    "find_by_id": lambda db: reservation_repository.find_by_id(db, 1),
+    "find_all_by_ids": lambda db: reservation_repository.find_all_by_ids(
+        db, [1, 2, 3], False
+    ),
+    "find_all_by_date_and_page": lambda db: reservation_repository.find_all_by_date_and_page(
+        db, DAY, NEXT_DAY, 1, 10
+    ),
+    "find_all_by_date_and_page(cursor)": lambda db: reservation_repository.find_all_by_date_and_page(
+        db, ORIGIN, ORIGIN + datetime.timedelta(days=DAYS), 500, 10, (DAY, 0)
+    ),
+    "find_all_by_user_and_date_and_page": lambda db: reservation_repository.find_all_by_user_and_date_and_page(
+        db, USER, DAY, NEXT_DAY, 1, 10
+    ),
+    "find_all_by_user_and_date_and_page(cursor)": lambda db: reservation_repository.find_all_by_user_and_date_and_page(
+        db, USER, ORIGIN, ORIGIN + datetime.timedelta(days=DAYS), 500, 10, (DAY, 0)
+    ),
+    "find_all_by_range_and_status": lambda db: reservation_repository.find_all_by_range_and_status(
+        db, DAY, NEXT_DAY, CONFIRMED, False
+    ),
+    "find_slot_usages": lambda db: reservation_repository.find_slot_usages(
+        db, DAY, NEXT_DAY, CONFIRMED
+    ),
+    "find_first_violated_slot": lambda db: reservation_repository.find_first_violated_slot(
+        db, DAY, NEXT_DAY, 10, CONFIRMED
+    ),
+    "find_slot_capacities": lambda db: reservation_repository.find_slot_capacities(
+        db, DAY, NEXT_DAY
+    ),
+    "find_by_email": lambda db: user_repository.find_by_email(db, "user1@test.com"),
+    "find_token_epochs": lambda db: user_repository.find_token_epochs(db, [1, 2]),
+}
+
+
+@pytest.mark.integration
+class TestRepositoryQueryPlan:
+    @pytest.mark.parametrize("name", REPOSITORY_QUERIES)
+    def test_not_seq_scan_when_querying_seeded_data(self, seeded_db, name):
+        """repository 조회 쿼리는 데이터가 쌓인 상태에서 인덱스 없이 테이블 전체를 읽지 않음"""
+        # given
+        statements = _capture_selects(seeded_db, REPOSITORY_QUERIES[name])
+
+        # when
+        seq_scans = [
+            (statement, table)
+            for statement, parameters in statements
+            for table in _seq_scanned_tables(seeded_db, statement, parameters)
+        ]
+
+        # then
+        assert statements
+        assert seq_scans == []
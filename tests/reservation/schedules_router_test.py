@@ -0,0 +1,153 @@
+import asyncio
+import datetime
+import pytest
+from unittest.mock import MagicMock
+from fastapi import FastAPI
+
+from app.src.common.token import Principal
+from app.src.config.database import get_db_from_request
+from app.src.middleware.authenticate import authenticate_user
+from app.src.reservation.availability_cache import availability_cache
+from app.src.reservation.router import router
+from app.src.reservation.utils.slot import count_slots
+from app.src.user.model import Role
+
+
+def _get(app, path: str, query: str, headers=()):
+    """ASGI 앱에 GET 요청을 보내고 (status, 응답 header, body) 를 반환"""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": list(headers),
+        "client": ("test", 0),
+        "server": ("test", 80),
+    }
+    asyncio.run(app(scope, receive, send))
+    start = messages[0]
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return start["status"], dict(start["headers"]), body
+
+
+@pytest.fixture()
+def db():
+    db = MagicMock()
+    db.info = {}
+    return db
+
+
+@pytest.fixture()
+def app(db):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[authenticate_user] = lambda: Principal(
+        id=1, email="test@test.com", role=Role.USER
+    )
+    app.dependency_overrides[get_db_from_request] = lambda: db
+    return app
+
+
+@pytest.fixture()
+def query():
+    day = (datetime.date.today() + datetime.timedelta(days=3)).isoformat()
+    return f"start={day}&end={day}"
+
+
+@pytest.fixture(autouse=True)
+def shared_db(mocker):
+    shared_db = MagicMock()
+    shared_db.info = {}
+    mocker.patch(
+        "app.src.config.database.create_request_session", return_value=shared_db
+    )
+    return shared_db
+
+
+@pytest.fixture(autouse=True)
+def clear_availability_cache():
+    availability_cache.clear()
+    yield
+    availability_cache.clear()
+
+
+def _slot_usages(db, start, end, status):
+    return [0] * count_slots(start, end)
+
+
+@pytest.mark.unit
+class TestSchedulesETag:
+    def test_not_modified_when_etag_matches(self, mocker, app, query):
+        """일자별 generation 이 그대로라면 If-None-Match 요청에 body 없이 304 응답"""
+        # given
+        find_slot_usages = mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            side_effect=_slot_usages,
+        )
+        _, headers, _ = _get(app, "/reservations/schedules", query)
+
+        # when
+        status, _, body = _get(
+            app,
+            "/reservations/schedules",
+            query,
+            [(b"if-none-match", headers[b"etag"])],
+        )
+
+        # then
+        assert status == 304
+        assert body == b""
+        assert find_slot_usages.call_count == 1
+
+    def test_no_etag_when_invalidated_during_query(self, mocker, app, query):
+        """조회 중 해당 일자가 무효화되었다면 ETag 를 응답하지 않음"""
+
+        # given
+        def invalidate_during_query(db, start, end, status):
+            availability_cache.invalidate(start, end)
+            return _slot_usages(db, start, end, status)
+
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            side_effect=invalidate_during_query,
+        )
+
+        # when
+        status, headers, _ = _get(app, "/reservations/schedules", query)
+
+        # then
+        assert status == 200
+        assert b"etag" not in headers
+
+
+@pytest.mark.unit
+class TestSchedulesSingleFlight:
+    def test_shared_query_uses_own_session(self, mocker, app, db, shared_db, query):
+        """공유되는 실행은 먼저 들어온 요청의 세션이 아닌 별도 세션으로 조회하고, 끝나면 닫음"""
+        # given
+        find_slot_usages = mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            side_effect=_slot_usages,
+        )
+
+        # when
+        status, _, _ = _get(app, "/reservations/schedules", query)
+
+        # then
+        assert status == 200
+        assert find_slot_usages.call_args.args[0] is shared_db
+        shared_db.close.assert_called_once()
+        db.execute.assert_not_called()
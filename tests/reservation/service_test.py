@@ -1,11 +1,20 @@
 import datetime
 from fastapi import HTTPException
 import pytest
+from pydantic import ValidationError
+from types import SimpleNamespace
 from unittest.mock import MagicMock
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.src.reservation.dto.request.confirm_reservations_request import (
+    ConfirmReservationsRequest,
+)
 from app.src.reservation.dto.request.create_reservation_request import (
     CreateReservationRequest,
 )
+from app.src.reservation.dto.request.find_available_windows_request import (
+    FindAvailableWindowsRequest,
+)
 from app.src.reservation.dto.request.get_available_schedule_request import (
     GetAvailableScheduleRequest,
 )
@@ -15,9 +24,17 @@ from app.src.reservation.dto.request.get_reservations_request import (
 from app.src.reservation.dto.request.update_reservation_request import (
     UpdateReservationRequest,
 )
-from app.src.reservation.model import Reservation, ReservationStatus
+from app.src.config.settings import LockMode
+from app.src.reservation.model import Reservation, ReservationStatus, SlotCapacity
 from app.src.reservation import service as reservation_service
+from app.src.reservation.availability_cache import availability_cache
 from app.src.reservation.utils.constants import MAX_CAPACITY
+from app.src.reservation.utils.cursor import encode_cursor
+from app.src.reservation.utils.slot import (
+    count_slots,
+    generate_slot_starts,
+    generate_stripe_keys,
+)
 from app.src.user.model import Role, User
 
 
@@ -25,6 +42,7 @@ from app.src.user.model import Role, User
 def mock_db():
     db = MagicMock()
     db.flush = MagicMock()
+    db.info = {}
     return db
 
 
@@ -171,6 +189,28 @@ class TestFindAllByDate:
         assert len(result) == len(reservations)
         assert {res.id for res in result} == {res.id for res in reservations}
 
+    def test_pass_cursor_position_when_cursor_given(self, mocker, dummy_user):
+        """cursor 로 조회하면, 마지막 조회 예약의 (start_time, id)를 repository 에 전달"""
+        # given
+        dummy_user.role = Role.ADMIN
+        now = datetime.datetime.now() + datetime.timedelta(days=3)
+        last_start = datetime.datetime(now.year, now.month, now.day, 10, 0)
+        request = GetReservationsRequest(
+            start=f"{now.year}-{now.month:02d}-{now.day:02d}",
+            end=f"{now.year}-{now.month:02d}-{now.day:02d}",
+            cursor=encode_cursor(last_start, 7),
+        )
+        mock_admin_function = mocker.patch(
+            "app.src.reservation.repository.find_all_by_date_and_page",
+            return_value=[],
+        )
+
+        # when
+        reservation_service.find_all_by_date(mock_db, dummy_user, request)
+
+        # then
+        assert mock_admin_function.call_args.args[-1] == (last_start, 7)
+
 
 @pytest.mark.unit
 class TestFindByID:
@@ -257,11 +297,44 @@ class TestFindByID:
         # then
         assert result.id == dummy_reservation.id
 
+    def test_etag_changes_with_version(self, mocker, dummy_user):
+        """ETag 는 예약 row 전체를 조회하지 않고 version 과 수정 시각으로 생성, 예약이 변경되면 달라져야 한다"""
+        # given
+        dummy_user.role = Role.USER
+        updated_at = datetime.datetime(2025, 5, 1, 10, 0)
+        find_version_by_id = mocker.patch(
+            "app.src.reservation.repository.find_version_by_id",
+            return_value=SimpleNamespace(
+                user_id=dummy_user.id, version=1, updated_at=updated_at
+            ),
+        )
+        find_by_id = mocker.patch("app.src.reservation.repository.find_by_id")
+
+        # when
+        etag = reservation_service.find_etag_by_id(mock_db, dummy_user, 1)
+
+        # then
+        find_by_id.assert_not_called()
+        assert etag == reservation_service.reservation_etag(1, 1, updated_at)
+        assert etag != reservation_service.reservation_etag(1, 2, updated_at)
+        find_version_by_id.return_value = None
+        with pytest.raises(HTTPException) as e:
+            reservation_service.find_etag_by_id(mock_db, dummy_user, 1)
+        assert e.value.status_code == 404
+
 
 @pytest.mark.unit
 class TestFindAvailableSchedules:
     """find_available_schedules 함수 테스트"""
 
+    SLOTS_PER_DAY = 24 * 6
+
+    @pytest.fixture(autouse=True)
+    def clear_availability_cache(self):
+        availability_cache.clear()
+        yield
+        availability_cache.clear()
+
     @pytest.fixture(scope="class")
     def dummy_request(self):
         now = datetime.datetime.now() + datetime.timedelta(days=3)
@@ -270,12 +343,12 @@ class TestFindAvailableSchedules:
             end=f"{now.year}-{now.month:02d}-{now.day:02d}",
         )
 
-    def test_full_capacity_when_no_reservations(self, mocker, dummy_request):
+    def test_full_capacity_when_no_reservations(self, mocker, mock_db, dummy_request):
         """조회 구간에 확정된 예약이 없으면, 조회 구간 전체가 50_000명 예약 가능 반환"""
         # given
         mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[],
+            "app.src.reservation.repository.find_slot_usages",
+            return_value=[0] * self.SLOTS_PER_DAY,
         )
 
         # when
@@ -287,21 +360,15 @@ class TestFindAvailableSchedules:
         assert result[0].end == dummy_request.end
         assert result[0].available_capacity == MAX_CAPACITY
 
-    def test_decrease_capacity_when_reservations_exist(self, mocker, dummy_request):
+    def test_decrease_capacity_when_reservations_exist(
+        self, mocker, mock_db, dummy_request
+    ):
         """CONFIRMED 예약 존재 -> 해당 구간 예약 가능 인원이 줄어야 한다"""
         # given
         number_of_people = 10000
         mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[
-                Reservation(
-                    id=1,
-                    start_time=dummy_request.start,
-                    end_time=dummy_request.end,
-                    number_of_people=number_of_people,
-                    status=ReservationStatus.CONFIRMED,
-                )
-            ],
+            "app.src.reservation.repository.find_slot_usages",
+            return_value=[number_of_people] * self.SLOTS_PER_DAY,
         )
 
         # when
@@ -313,70 +380,37 @@ class TestFindAvailableSchedules:
         assert result[0].start == dummy_request.start
         assert result[0].end == dummy_request.end
 
-    def test_ignore_not_confirmed_reservations(self, mocker, dummy_request):
-        """PENDING 예약 존재 -> 예약 가능 인원이 줄지 않아야 한다"""
+    def test_ignore_not_confirmed_reservations(self, mocker, mock_db, dummy_request):
+        """확정된 예약 인원만 집계해야 한다"""
         # given
-        number_of_people = 10000
-        mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[
-                Reservation(
-                    id=1,
-                    start_time=dummy_request.start,
-                    end_time=dummy_request.end,
-                    number_of_people=number_of_people,
-                    status=ReservationStatus.PENDING,
-                ),
-                Reservation(
-                    id=2,
-                    start_time=dummy_request.start,
-                    end_time=dummy_request.end,
-                    number_of_people=number_of_people,
-                    status=ReservationStatus.CANCELLED,
-                ),
-                Reservation(
-                    id=3,
-                    start_time=dummy_request.start,
-                    end_time=dummy_request.end,
-                    number_of_people=number_of_people,
-                    status=ReservationStatus.REJECTED,
-                ),
-            ],
+        usage_function = mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            return_value=[0] * self.SLOTS_PER_DAY,
         )
 
         # when
         result = reservation_service.find_available_schedules(mock_db, dummy_request)
 
         # then
+        usage_function.assert_called_once_with(
+            mock_db,
+            dummy_request.start,
+            dummy_request.end,
+            [ReservationStatus.CONFIRMED],
+        )
         assert len(result) == 1
         assert result[0].available_capacity == MAX_CAPACITY
-        assert result[0].start == dummy_request.start
-        assert result[0].end == dummy_request.end
 
     def test_return_multiple_schedules_when_multiple_reservations_exist_each_slot(
-        self, mocker, dummy_request
+        self, mocker, mock_db, dummy_request
     ):
         """서로 다른 예약이 서로 다른 구간에 존재하면, 각 구간별로 예약 가능 인원을 반환해야한다."""
         # given
         number_of_people = 10000
         mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[
-                Reservation(
-                    id=1,
-                    start_time=dummy_request.start,
-                    end_time=dummy_request.end,
-                    number_of_people=number_of_people,
-                    status=ReservationStatus.CONFIRMED,
-                ),
-                Reservation(
-                    id=2,
-                    start_time=dummy_request.start + datetime.timedelta(minutes=10),
-                    end_time=dummy_request.end,
-                    number_of_people=number_of_people,
-                    status=ReservationStatus.CONFIRMED,
-                ),
-            ],
+            "app.src.reservation.repository.find_slot_usages",
+            return_value=[number_of_people]
+            + [2 * number_of_people] * (self.SLOTS_PER_DAY - 1),
         )
 
         # when
@@ -391,40 +425,128 @@ class TestFindAvailableSchedules:
         assert result[0].end == result[1].start
         assert result[1].end == dummy_request.end
 
-    def test_return_multiple_schedules_when_multiple_reservations_exist_equal_slot(
-        self, mocker, dummy_request
+    def test_exclude_full_slots_and_split_schedules(
+        self, mocker, mock_db, dummy_request
     ):
-        """서로 다른 예약이 동일한 구간에 존재하면, 해당 인원수를 통합해 반환해야한다."""
+        """예약이 불가한 구간은 제외되고, 그 앞뒤 구간은 병합되지 않아야 한다."""
         # given
-        number_of_people = 10000
+        usages = [0] * self.SLOTS_PER_DAY
+        usages[6] = MAX_CAPACITY
         mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[
-                Reservation(
-                    id=1,
-                    start_time=dummy_request.start,
-                    end_time=dummy_request.end,
-                    number_of_people=number_of_people,
-                    status=ReservationStatus.CONFIRMED,
-                ),
-                Reservation(
-                    id=2,
-                    start_time=dummy_request.start,
-                    end_time=dummy_request.end,
-                    number_of_people=number_of_people,
-                    status=ReservationStatus.CONFIRMED,
-                ),
-            ],
+            "app.src.reservation.repository.find_slot_usages", return_value=usages
         )
 
         # when
         result = reservation_service.find_available_schedules(mock_db, dummy_request)
 
         # then
-        assert len(result) == 1
-        assert result[0].available_capacity == MAX_CAPACITY - 2 * number_of_people
+        full_start = dummy_request.start + datetime.timedelta(hours=1)
+        assert len(result) == 2
+        assert result[0].end == full_start
+        assert result[1].start == full_start + datetime.timedelta(minutes=10)
+        assert all(
+            schedule.available_capacity == MAX_CAPACITY for schedule in result
+        )
+
+    def test_new_key_after_write_commits(self, mock_db, dummy_request):
+        """조회 구간의 확정 인원이 변경된 이후 들어온 요청은 이전 실행의 결과를 공유하지 않아야 한다."""
+        # given
+        key = reservation_service.available_schedules_key(mock_db, dummy_request)
+
+        # when
+        availability_cache.invalidate(
+            dummy_request.start, dummy_request.start + datetime.timedelta(hours=1)
+        )
+
+        # then
+        assert reservation_service.available_schedules_key(mock_db, dummy_request) != key
+
+    def test_etag_only_when_changes_are_broadcast(self, mocker, mock_db, dummy_request):
+        """ETag 는 확정 인원 변경 시 달라지고, 다른 프로세스의 변경을 알 수 없거나 replica 조회라면 생성하지 않아야 한다."""
+        # given
+        key = reservation_service.available_schedules_key(mock_db, dummy_request)
+        etag = reservation_service.available_schedules_etag(key)
+
+        # when
+        availability_cache.invalidate(
+            dummy_request.start, dummy_request.start + datetime.timedelta(hours=1)
+        )
+        changed = reservation_service.available_schedules_etag(
+            reservation_service.available_schedules_key(mock_db, dummy_request)
+        )
+
+        # then
+        assert etag is not None and changed is not None and etag != changed
+        assert reservation_service.available_schedules_etag((*key[:2], True, key[3])) is None
+        mocker.patch("app.src.config.settings.INVALIDATION_BUS_ENABLED", False)
+        assert reservation_service.available_schedules_etag(key) is None
+
+
+@pytest.mark.unit
+class TestFindAvailableWindows:
+    """find_available_windows 함수 테스트"""
+
+    @pytest.fixture()
+    def dummy_request(self):
+        day = datetime.datetime.now() + datetime.timedelta(days=4)
+        return FindAvailableWindowsRequest(
+            start=f"{day.year}-{day.month:02d}-{day.day:02d}",
+            end=f"{day.year}-{day.month:02d}-{day.day:02d}",
+            duration=60,
+            number_of_people=10000,
+            limit=2,
+        )
+
+    def test_return_earliest_windows_when_no_reservations(self, mocker, dummy_request):
+        """확정된 예약이 없으면, 조회 시작 시간부터 한 슬롯씩 밀린 구간을 limit 개 반환"""
+        # given
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            return_value=[0] * TestFindAvailableSchedules.SLOTS_PER_DAY,
+        )
+
+        # when
+        result = reservation_service.find_available_windows(mock_db, dummy_request)
+
+        # then
+        assert len(result) == 2
         assert result[0].start == dummy_request.start
-        assert result[0].end == dummy_request.end
+        assert result[0].end == dummy_request.start + datetime.timedelta(minutes=60)
+        assert result[1].start == dummy_request.start + datetime.timedelta(minutes=10)
+        assert all(window.available_capacity == MAX_CAPACITY for window in result)
+
+    def test_skip_windows_containing_slot_under_number_of_people(
+        self, mocker, dummy_request
+    ):
+        """예약 인원을 수용할 수 없는 슬롯을 포함하는 구간은 반환하지 않는다"""
+        # given
+        usages = [0] * TestFindAvailableSchedules.SLOTS_PER_DAY
+        usages[3] = MAX_CAPACITY - dummy_request.number_of_people + 1
+        usages[9] = MAX_CAPACITY - dummy_request.number_of_people
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_usages", return_value=usages
+        )
+
+        # when
+        result = reservation_service.find_available_windows(mock_db, dummy_request)
+
+        # then
+        assert len(result) == 2
+        assert result[0].start == dummy_request.start + datetime.timedelta(minutes=40)
+        assert result[0].available_capacity == dummy_request.number_of_people
+        assert result[1].start == dummy_request.start + datetime.timedelta(minutes=50)
+
+    def test_raise_error_when_duration_is_not_slot_unit(self):
+        """예약 시간이 10분 단위가 아니면 예외 발생"""
+        day = datetime.datetime.now() + datetime.timedelta(days=4)
+
+        with pytest.raises(ValueError):
+            FindAvailableWindowsRequest(
+                start=f"{day.year}-{day.month:02d}-{day.day:02d}",
+                end=f"{day.year}-{day.month:02d}-{day.day:02d}",
+                duration=45,
+                number_of_people=1,
+            )
 
 
 @pytest.mark.unit
@@ -450,16 +572,8 @@ class TestCreateReservation:
         reservation_id = 1
 
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[
-                Reservation(
-                    id=1,
-                    start_time=dummy_request.start,
-                    end_time=dummy_request.end,
-                    number_of_people=MAX_CAPACITY,
-                    status=ReservationStatus.CONFIRMED,
-                )
-            ],
+            "app.src.reservation.repository.find_first_violated_slot",
+            return_value=dummy_request.start,
         )
         create_function = mocker.patch(
             "app.src.reservation.repository.create",
@@ -482,16 +596,8 @@ class TestCreateReservation:
         reservation_id = 1
 
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[
-                Reservation(
-                    id=1,
-                    start_time=dummy_request.start,
-                    end_time=dummy_request.end,
-                    number_of_people=MAX_CAPACITY - dummy_request.number_of_people,
-                    status=ReservationStatus.CONFIRMED,
-                )
-            ],
+            "app.src.reservation.repository.find_first_violated_slot",
+            return_value=None,
         )
         create_function = mocker.patch(
             "app.src.reservation.repository.create",
@@ -515,6 +621,60 @@ class TestCreateReservation:
         assert validation_function.call_count == 1
         assert create_function.call_count == 1
 
+    def test_skip_db_validation_when_capacity_index_fits(
+        self, mocker, dummy_user, dummy_request
+    ):
+        """슬롯 용량 인덱스가 예약 가능하다고 판단하면, DB 조회 없이 예약을 생성한다"""
+        # given
+        mocker.patch(
+            "app.src.reservation.capacity_index.capacity_index.fits", return_value=True
+        )
+        find_function = mocker.patch(
+            "app.src.reservation.repository.find_first_violated_slot"
+        )
+        mocker.patch(
+            "app.src.reservation.repository.create",
+            return_value=Reservation(id=1),
+        )
+
+        # when
+        result = reservation_service.create_reservation(
+            mock_db, dummy_user, dummy_request
+        )
+
+        # then
+        assert result.id == 1
+        assert find_function.call_count == 0
+
+    def test_trust_db_and_rebuild_index_when_capacity_index_mismatches(
+        self, mocker, dummy_user, dummy_request
+    ):
+        """인덱스가 예약 불가로 판단해도 DB 상 예약 가능하면 예약을 생성하고, 인덱스를 다시 생성한다"""
+        # given
+        mocker.patch(
+            "app.src.reservation.capacity_index.capacity_index.fits", return_value=False
+        )
+        rebuild_function = mocker.patch(
+            "app.src.reservation.capacity_index.rebuild_in_background"
+        )
+        mocker.patch(
+            "app.src.reservation.repository.find_first_violated_slot",
+            return_value=None,
+        )
+        mocker.patch(
+            "app.src.reservation.repository.create",
+            return_value=Reservation(id=1),
+        )
+
+        # when
+        result = reservation_service.create_reservation(
+            mock_db, dummy_user, dummy_request
+        )
+
+        # then
+        assert result.id == 1
+        assert rebuild_function.call_count == 1
+
 
 @pytest.mark.unit
 class TestConfirmReservation:
@@ -529,8 +689,7 @@ class TestConfirmReservation:
             "app.src.reservation.repository.find_by_id", return_value=None
         )
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[],
+            "app.src.reservation.repository.decrease_slot_capacity"
         )
 
         # when - then
@@ -554,8 +713,7 @@ class TestConfirmReservation:
             "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
         )
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[],
+            "app.src.reservation.repository.decrease_slot_capacity"
         )
 
         # when - then
@@ -579,8 +737,7 @@ class TestConfirmReservation:
             "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
         )
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[],
+            "app.src.reservation.repository.decrease_slot_capacity"
         )
 
         # when - then
@@ -603,17 +760,18 @@ class TestConfirmReservation:
         find_function = mocker.patch(
             "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
         )
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_capacities", return_value=[]
+        )
+        mocker.patch("app.src.reservation.repository.create_slot_capacities")
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[
-                Reservation(
-                    id=1,
-                    start_time=dummy_reservation.start_time,
-                    end_time=dummy_reservation.end_time,
-                    number_of_people=MAX_CAPACITY,
-                    status=ReservationStatus.CONFIRMED,
-                )
-            ],
+            "app.src.reservation.repository.find_slot_usages",
+            return_value=[MAX_CAPACITY]
+            * count_slots(dummy_reservation.start_time, dummy_reservation.end_time),
+        )
+        # 잔여 인원이 부족한 슬롯은 차감되지 않는다
+        decrease_function = mocker.patch(
+            "app.src.reservation.repository.decrease_slot_capacity", return_value=0
         )
         # when - then
         with pytest.raises(HTTPException) as e:
@@ -623,9 +781,11 @@ class TestConfirmReservation:
         assert e.value.status_code == 400
         assert find_function.call_count == 1
         assert validation_function.call_count == 1
+        assert decrease_function.call_count == 1
+        assert dummy_reservation.status == ReservationStatus.PENDING
 
     def test_raise_error_when_number_of_people_under_limit(
-        self, mocker, dummy_user, dummy_reservation
+        self, mocker, mock_db, dummy_user, dummy_reservation
     ):
         """예약 인원이 5만명 미만이면 예약 확정"""
         # given
@@ -635,26 +795,305 @@ class TestConfirmReservation:
             "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
         )
         mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
+            "app.src.reservation.repository.find_slot_capacities", return_value=[]
+        )
+        mocker.patch("app.src.reservation.repository.create_slot_capacities")
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            return_value=[MAX_CAPACITY - dummy_reservation.number_of_people]
+            * count_slots(dummy_reservation.start_time, dummy_reservation.end_time),
+        )
+        mocker.patch(
+            "app.src.reservation.repository.decrease_slot_capacity",
+            return_value=count_slots(
+                dummy_reservation.start_time, dummy_reservation.end_time
+            ),
+        )
+
+        # when
+        result = reservation_service.confirm_reservation(
+            mock_db, dummy_user, reservation_id
+        )
+
+        # then
+        assert result.id == reservation_id
+        assert result.status == ReservationStatus.CONFIRMED
+
+
+    def test_lock_stripes_instead_of_slot_rows_when_advisory_lock_mode(
+        self, mocker, mock_db, dummy_user, dummy_reservation
+    ):
+        """advisory lock 방식이면, ledger row lock 대신 구간이 걸치는 stripe 를 lock 한 뒤 확정"""
+        # given
+        mocker.patch(
+            "app.src.config.settings.RESERVATION_LOCK_MODE", LockMode.ADVISORY
+        )
+        mocker.patch(
+            "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
+        )
+        lock_function = mocker.patch(
+            "app.src.reservation.repository.lock_slot_stripes"
+        )
+        find_function = mocker.patch(
+            "app.src.reservation.repository.find_slot_capacities",
             return_value=[
-                Reservation(
-                    id=reservation_id + 1,
-                    start_time=dummy_reservation.start_time,
-                    end_time=dummy_reservation.end_time,
-                    number_of_people=MAX_CAPACITY - dummy_reservation.number_of_people,
-                    status=ReservationStatus.CONFIRMED,
+                SlotCapacity(slot_start=slot_start, remaining=MAX_CAPACITY)
+                for slot_start in generate_slot_starts(
+                    dummy_reservation.start_time, dummy_reservation.end_time
                 )
             ],
         )
+        mocker.patch(
+            "app.src.reservation.repository.decrease_slot_capacity",
+            return_value=count_slots(
+                dummy_reservation.start_time, dummy_reservation.end_time
+            ),
+        )
 
         # when
         result = reservation_service.confirm_reservation(
-            mock_db, dummy_user, reservation_id
+            mock_db, dummy_user, dummy_reservation.id
+        )
+
+        # then
+        assert result.status == ReservationStatus.CONFIRMED
+        assert lock_function.call_count == 1
+        assert lock_function.call_args.args[1] == generate_stripe_keys(
+            dummy_reservation.start_time, dummy_reservation.end_time, 24 * 60
+        )
+        assert find_function.call_args.args[3] is False
+
+
+    def test_confirm_without_lock_when_serializable_lock_mode(
+        self, mocker, mock_db, dummy_user, dummy_reservation
+    ):
+        """serializable 방식이면, 예약 row 와 ledger row 모두 lock 없이 조회한 뒤 확정"""
+        # given
+        mocker.patch(
+            "app.src.config.settings.RESERVATION_LOCK_MODE", LockMode.SERIALIZABLE
+        )
+        find_reservation_function = mocker.patch(
+            "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
+        )
+        find_function = mocker.patch(
+            "app.src.reservation.repository.find_slot_capacities",
+            return_value=[
+                SlotCapacity(slot_start=slot_start, remaining=MAX_CAPACITY)
+                for slot_start in generate_slot_starts(
+                    dummy_reservation.start_time, dummy_reservation.end_time
+                )
+            ],
+        )
+        mocker.patch(
+            "app.src.reservation.repository.decrease_slot_capacity",
+            return_value=count_slots(
+                dummy_reservation.start_time, dummy_reservation.end_time
+            ),
+        )
+
+        # when
+        result = reservation_service.confirm_reservation(
+            mock_db, dummy_user, dummy_reservation.id
         )
 
         # then
-        assert result.id == reservation_id
         assert result.status == ReservationStatus.CONFIRMED
+        assert find_reservation_function.call_args.args[2] is False
+        assert find_function.call_args.args[3] is False
+        mock_db.begin_nested.assert_not_called()
+
+
+    def test_retry_when_version_conflict_in_optimistic_lock_mode(
+        self, mocker, mock_db, dummy_user, dummy_reservation
+    ):
+        """optimistic 방식에서 예약 version 이 충돌하면, savepoint 를 rollback 하고 재시도"""
+        # given
+        mocker.patch(
+            "app.src.config.settings.RESERVATION_LOCK_MODE", LockMode.OPTIMISTIC
+        )
+        sleep_function = mocker.patch("app.src.reservation.service.time.sleep")
+        savepoint = mock_db.begin_nested.return_value
+        savepoint.commit.side_effect = [StaleDataError(), None]
+
+        def find_pending_reservation(*args):
+            # savepoint rollback 이후에는 DB 의 상태(PENDING)로 다시 조회된다
+            dummy_reservation.status = ReservationStatus.PENDING
+            return dummy_reservation
+
+        find_function = mocker.patch(
+            "app.src.reservation.repository.find_by_id",
+            side_effect=find_pending_reservation,
+        )
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_capacities",
+            return_value=[
+                SlotCapacity(slot_start=slot_start, remaining=MAX_CAPACITY)
+                for slot_start in generate_slot_starts(
+                    dummy_reservation.start_time, dummy_reservation.end_time
+                )
+            ],
+        )
+        mocker.patch(
+            "app.src.reservation.repository.decrease_slot_capacity",
+            return_value=count_slots(
+                dummy_reservation.start_time, dummy_reservation.end_time
+            ),
+        )
+
+        # when
+        result = reservation_service.confirm_reservation(
+            mock_db, dummy_user, dummy_reservation.id
+        )
+
+        # then
+        assert result.status == ReservationStatus.CONFIRMED
+        assert find_function.call_count == 2
+        assert all(call.args[2] is False for call in find_function.call_args_list)
+        assert savepoint.rollback.call_count == 1
+        assert sleep_function.call_count == 1
+
+    def test_raise_409_when_version_conflict_exceeds_max_retries(
+        self, mocker, mock_db, dummy_user, dummy_reservation
+    ):
+        """optimistic 방식에서 최대 재시도 횟수를 넘어 충돌하면 409 예외 발생"""
+        # given
+        mocker.patch(
+            "app.src.config.settings.RESERVATION_LOCK_MODE", LockMode.OPTIMISTIC
+        )
+        mocker.patch("app.src.config.settings.OPTIMISTIC_MAX_RETRIES", 2)
+        mocker.patch("app.src.reservation.service.time.sleep")
+        mock_db.begin_nested.return_value.commit.side_effect = StaleDataError()
+
+        find_function = mocker.patch(
+            "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
+        )
+        dummy_reservation.status = ReservationStatus.CONFIRMED
+        dummy_user.role = Role.ADMIN
+
+        # when - then
+        with pytest.raises(HTTPException) as e:
+            reservation_service.confirm_reservation(
+                mock_db, dummy_user, dummy_reservation.id
+            )
+
+        # then
+        assert e.value.status_code == 409
+        assert find_function.call_count == 3
+
+
+@pytest.mark.unit
+class TestConfirmReservations:
+    """confirm_reservations 함수 테스트"""
+
+    @pytest.fixture()
+    def admin_user(self):
+        return User(id=2, user_name="admin", email="admin@test.com", role=Role.ADMIN)
+
+    @staticmethod
+    def _reservation(reservation_id, start, minutes, number_of_people):
+        return Reservation(
+            id=reservation_id,
+            reservation_name="test",
+            start_time=start,
+            end_time=start + datetime.timedelta(minutes=minutes),
+            number_of_people=number_of_people,
+            status=ReservationStatus.PENDING,
+            created_at=datetime.datetime.now(),
+            user_id=1,
+        )
+
+    def test_confirm_reservations_that_fit_in_start_time_order(
+        self, mocker, mock_db, admin_user
+    ):
+        """시작 시간 순으로 정원 안에 들어오는 예약만 확정하고, 예약별 결과와 슬롯별 합산 차감을 반환"""
+        # given
+        start = datetime.datetime(2025, 5, 1, 12, 0)
+        first = self._reservation(1, start, 60, 30000)
+        exceeded = self._reservation(2, start + datetime.timedelta(minutes=30), 60, 30000)
+        second = self._reservation(3, start + datetime.timedelta(minutes=30), 60, 10000)
+        end = start + datetime.timedelta(minutes=90)
+
+        mocker.patch(
+            "app.src.reservation.repository.find_all_by_ids",
+            return_value=[first, exceeded, second],
+        )
+        find_function = mocker.patch(
+            "app.src.reservation.repository.find_slot_capacities",
+            return_value=[
+                SlotCapacity(slot_start=slot_start, remaining=MAX_CAPACITY)
+                for slot_start in generate_slot_starts(start, end)
+            ],
+        )
+        decrease_function = mocker.patch(
+            "app.src.reservation.repository.decrease_slot_capacities",
+            side_effect=lambda db, decreases: len(decreases),
+        )
+
+        # when
+        result = reservation_service.confirm_reservations(
+            mock_db,
+            admin_user,
+            ConfirmReservationsRequest(reservation_ids=[2, 1, 99, 3, 1]),
+        )
+
+        # then
+        assert result.confirmed_count == 2
+        assert [
+            (item.reservation_id, item.confirmed, item.detail) for item in result.results
+        ] == [
+            (2, False, "예약 가능 인원을 초과했습니다."),
+            (1, True, None),
+            (99, False, "존재하지 않는 예약입니다."),
+            (3, True, None),
+        ]
+        assert first.status == ReservationStatus.CONFIRMED
+        assert exceeded.status == ReservationStatus.PENDING
+        assert second.status == ReservationStatus.CONFIRMED
+
+        assert find_function.call_count == 1
+        assert find_function.call_args.args[1:] == (start, end, True)
+        decreases = decrease_function.call_args.args[1]
+        assert decrease_function.call_count == 1
+        assert decreases[start] == 30000
+        assert decreases[start + datetime.timedelta(minutes=30)] == 40000
+        assert decreases[start + datetime.timedelta(minutes=80)] == 10000
+
+    def test_raise_error_when_ledger_changed_concurrently(
+        self, mocker, mock_db, admin_user
+    ):
+        """lock 없이 조회한 뒤 다른 요청이 잔여 인원을 차감해, 일부 슬롯이 차감되지 않으면 예외 발생"""
+        # given
+        mocker.patch(
+            "app.src.config.settings.RESERVATION_LOCK_MODE", LockMode.SERIALIZABLE
+        )
+        start = datetime.datetime(2025, 5, 1, 12, 0)
+        reservation = self._reservation(1, start, 60, 10000)
+
+        mocker.patch(
+            "app.src.reservation.repository.find_all_by_ids",
+            return_value=[reservation],
+        )
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_capacities",
+            return_value=[
+                SlotCapacity(slot_start=slot_start, remaining=MAX_CAPACITY)
+                for slot_start in generate_slot_starts(
+                    reservation.start_time, reservation.end_time
+                )
+            ],
+        )
+        mocker.patch(
+            "app.src.reservation.repository.decrease_slot_capacities", return_value=5
+        )
+
+        # when - then
+        with pytest.raises(HTTPException) as e:
+            reservation_service.confirm_reservations(
+                mock_db, admin_user, ConfirmReservationsRequest(reservation_ids=[1])
+            )
+
+        # then
+        assert e.value.status_code == 409
 
 
 @pytest.mark.unit
@@ -671,7 +1110,7 @@ class TestUpdateReservation:
             "app.src.reservation.repository.find_by_id", return_value=[]
         )
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status"
+            "app.src.reservation.repository.find_first_violated_slot"
         )
 
         # when - then
@@ -699,7 +1138,7 @@ class TestUpdateReservation:
             "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
         )
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status"
+            "app.src.reservation.repository.find_first_violated_slot"
         )
 
         # when - then
@@ -726,7 +1165,7 @@ class TestUpdateReservation:
             "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
         )
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status"
+            "app.src.reservation.repository.find_first_violated_slot"
         )
 
         # when - then
@@ -753,7 +1192,7 @@ class TestUpdateReservation:
             "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
         )
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status"
+            "app.src.reservation.repository.find_first_violated_slot"
         )
 
         # when - then
@@ -784,16 +1223,8 @@ class TestUpdateReservation:
             "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
         )
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[
-                Reservation(
-                    id=reservation_id + 1,
-                    start_time=request.start,
-                    end_time=request.end,
-                    number_of_people=MAX_CAPACITY,
-                    status=ReservationStatus.CONFIRMED,
-                )
-            ],
+            "app.src.reservation.repository.find_first_violated_slot",
+            return_value=request.start,
         )
 
         # when - then
@@ -813,7 +1244,6 @@ class TestUpdateReservation:
         """요청자는 유효하지만, 예약인원 변경 시 5만명 제한을 초과하면 예외 발생"""
         # given
         reservation_id = dummy_reservation.id
-        before_number_of_people = 1
         after_number_of_people = 10000
 
         request = UpdateReservationRequest(number_of_people=after_number_of_people)
@@ -822,16 +1252,8 @@ class TestUpdateReservation:
             "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
         )
         validation_function = mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[
-                Reservation(
-                    id=reservation_id + 1,
-                    start_time=dummy_reservation.start_time,
-                    end_time=dummy_reservation.end_time,
-                    number_of_people=MAX_CAPACITY - before_number_of_people,
-                    status=ReservationStatus.CONFIRMED,
-                )
-            ],
+            "app.src.reservation.repository.find_first_violated_slot",
+            return_value=dummy_reservation.start_time,
         )
 
         # when - then
@@ -858,8 +1280,8 @@ class TestUpdateReservation:
             return_value=dummy_reservation,
         )
         mocker.patch(
-            "app.src.reservation.repository.find_all_by_range_and_status",
-            return_value=[],
+            "app.src.reservation.repository.find_first_violated_slot",
+            return_value=None,
         )
 
         # when
@@ -870,3 +1292,216 @@ class TestUpdateReservation:
         # then
         assert result.id == reservation_id
         assert result.number_of_people == MAX_CAPACITY
+
+    def test_move_confirmed_reservation_and_ledger_together(
+        self, mocker, mock_db, dummy_user, dummy_reservation
+    ):
+        """확정된 예약의 시간을 변경하면, 예약의 시작/종료 시간과 ledger 의 반납/차감 구간이 일치해야 한다"""
+        # given
+        dummy_user.role = Role.ADMIN
+        dummy_reservation.status = ReservationStatus.CONFIRMED
+        dummy_reservation.start_time = dummy_reservation.start_time.replace(
+            minute=0, second=0, microsecond=0
+        )
+        dummy_reservation.end_time = dummy_reservation.start_time + datetime.timedelta(
+            hours=1
+        )
+        old_start, old_end = dummy_reservation.start_time, dummy_reservation.end_time
+        new_start = old_start + datetime.timedelta(days=1)
+        new_end = old_end + datetime.timedelta(days=1)
+        request = UpdateReservationRequest(
+            start=new_start.strftime("%Y-%m-%d %H:%M"),
+            end=new_end.strftime("%Y-%m-%d %H:%M"),
+        )
+
+        mocker.patch(
+            "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
+        )
+        mocker.patch(
+            "app.src.reservation.service._find_slot_capacities",
+            side_effect=lambda db, start, end, lock=False: [MAX_CAPACITY]
+            * count_slots(start, end),
+        )
+        increase_function = mocker.patch(
+            "app.src.reservation.repository.increase_slot_capacity"
+        )
+        decrease_function = mocker.patch(
+            "app.src.reservation.repository.decrease_slot_capacity",
+            side_effect=lambda db, start, end, number_of_people: count_slots(start, end),
+        )
+
+        # when
+        result = reservation_service.update_reservation(
+            mock_db, dummy_user, dummy_reservation.id, request
+        )
+
+        # then
+        increase_function.assert_called_once_with(
+            mock_db, old_start, old_end, dummy_reservation.number_of_people
+        )
+        decrease_function.assert_called_once_with(
+            mock_db, new_start, new_end, dummy_reservation.number_of_people
+        )
+        assert result.start_time == new_start
+        assert result.end_time == new_end
+
+    def test_lock_old_and_new_ranges_in_slot_order(
+        self, mocker, mock_db, dummy_user, dummy_reservation
+    ):
+        """확정된 예약을 앞선 구간으로 옮기면, 반납/차감 전에 두 구간을 slot_start 순서로 lock 해야 한다"""
+        # given
+        dummy_user.role = Role.ADMIN
+        dummy_reservation.status = ReservationStatus.CONFIRMED
+        dummy_reservation.start_time = dummy_reservation.start_time.replace(
+            minute=0, second=0, microsecond=0
+        ) + datetime.timedelta(days=2)
+        dummy_reservation.end_time = dummy_reservation.start_time + datetime.timedelta(
+            hours=1
+        )
+        new_start = dummy_reservation.start_time - datetime.timedelta(days=1)
+        new_end = dummy_reservation.end_time - datetime.timedelta(days=1)
+        request = UpdateReservationRequest(
+            start=new_start.strftime("%Y-%m-%d %H:%M"),
+            end=new_end.strftime("%Y-%m-%d %H:%M"),
+        )
+
+        mocker.patch(
+            "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
+        )
+        lock_function = mocker.patch(
+            "app.src.reservation.service._lock_slot_capacity"
+        )
+        mocker.patch("app.src.reservation.repository.increase_slot_capacity")
+        mocker.patch(
+            "app.src.reservation.repository.decrease_slot_capacity",
+            side_effect=lambda db, start, end, number_of_people: count_slots(start, end),
+        )
+
+        # when
+        reservation_service.update_reservation(
+            mock_db, dummy_user, dummy_reservation.id, request
+        )
+
+        # then
+        assert [call.args[1:] for call in lock_function.call_args_list[:2]] == [
+            (new_start, new_end),
+            (new_start + datetime.timedelta(days=1), new_end + datetime.timedelta(days=1)),
+        ]
+
+
+    @pytest.mark.parametrize(
+        "start_format", ["%Y-%m-%d %H:%M:30", "%Y-%m-%dT%H:%M:%S.123"]
+    )
+    def test_reject_start_and_end_not_aligned_to_slot(self, start_format):
+        """수정할 시작/종료 시간이 'YYYY-MM-DD HH:MM' 형식이 아니라면(초 단위 포함) 요청 검증 오류"""
+        # given
+        start = (datetime.datetime.now() + datetime.timedelta(days=5)).replace(
+            hour=12, minute=0
+        )
+        end = start + datetime.timedelta(hours=1)
+
+        # when - then
+        with pytest.raises(ValidationError):
+            UpdateReservationRequest(
+                start=start.strftime(start_format), end=end.strftime("%Y-%m-%d %H:%M")
+            )
+
+
+@pytest.mark.unit
+class TestCancelReservation:
+    """cancel_reservation 함수 테스트"""
+
+    def test_release_slot_capacity_when_reservation_is_confirmed(
+        self, mocker, mock_db, dummy_user, dummy_reservation
+    ):
+        """확정된 예약을 취소하면, 차지하던 슬롯의 잔여 인원을 되돌린다"""
+        # given
+        dummy_user.role = Role.ADMIN
+        dummy_reservation.status = ReservationStatus.CONFIRMED
+
+        mocker.patch(
+            "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
+        )
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_capacities", return_value=[]
+        )
+        mocker.patch("app.src.reservation.repository.create_slot_capacities")
+        mocker.patch(
+            "app.src.reservation.repository.find_slot_usages",
+            return_value=[dummy_reservation.number_of_people]
+            * count_slots(dummy_reservation.start_time, dummy_reservation.end_time),
+        )
+        increase_function = mocker.patch(
+            "app.src.reservation.repository.increase_slot_capacity"
+        )
+
+        # when
+        result = reservation_service.cancel_reservation(
+            mock_db, dummy_user, dummy_reservation.id
+        )
+
+        # then
+        assert result.status == ReservationStatus.CANCELLED
+        increase_function.assert_called_once_with(
+            mock_db,
+            dummy_reservation.start_time,
+            dummy_reservation.end_time,
+            dummy_reservation.number_of_people,
+        )
+
+    def test_retry_without_row_lock_in_optimistic_lock_mode(
+        self, mocker, mock_db, dummy_user, dummy_reservation
+    ):
+        """optimistic 방식에서는 예약을 lock 없이 조회하고, version 이 충돌하면 savepoint 를 rollback 하고 재시도"""
+        # given
+        mocker.patch(
+            "app.src.config.settings.RESERVATION_LOCK_MODE", LockMode.OPTIMISTIC
+        )
+        sleep_function = mocker.patch("app.src.reservation.service.time.sleep")
+        savepoint = mock_db.begin_nested.return_value
+        savepoint.commit.side_effect = [StaleDataError(), None]
+
+        def find_pending_reservation(*args):
+            # savepoint rollback 이후에는 DB 의 상태(PENDING)로 다시 조회된다
+            dummy_reservation.status = ReservationStatus.PENDING
+            return dummy_reservation
+
+        find_function = mocker.patch(
+            "app.src.reservation.repository.find_by_id",
+            side_effect=find_pending_reservation,
+        )
+
+        # when
+        result = reservation_service.cancel_reservation(
+            mock_db, dummy_user, dummy_reservation.id
+        )
+
+        # then
+        assert result.status == ReservationStatus.CANCELLED
+        assert find_function.call_count == 2
+        assert all(call.args[2] is False for call in find_function.call_args_list)
+        assert savepoint.rollback.call_count == 1
+        assert sleep_function.call_count == 1
+
+    def test_not_release_slot_capacity_when_reservation_is_pending(
+        self, mocker, dummy_user, dummy_reservation
+    ):
+        """대기 상태의 예약은 잔여 인원을 차지하지 않으므로, 취소 시 ledger 를 갱신하지 않는다"""
+        # given
+        dummy_reservation.status = ReservationStatus.PENDING
+
+        mocker.patch(
+            "app.src.reservation.repository.find_by_id", return_value=dummy_reservation
+        )
+        increase_function = mocker.patch(
+            "app.src.reservation.repository.increase_slot_capacity"
+        )
+
+        # when
+        result = reservation_service.cancel_reservation(
+            mock_db, dummy_user, dummy_reservation.id
+        )
+
+        # then
+        assert result.status == ReservationStatus.CANCELLED
+        assert increase_function.call_count == 0
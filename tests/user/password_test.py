@@ -0,0 +1,75 @@
+import asyncio
+import os
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from app.src.user import password
+
+
+def _context(rounds: int) -> CryptContext:
+    return CryptContext(
+        schemes=["bcrypt"],
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+@pytest.fixture
+def thread_workers(mocker):
+    mocker.patch("app.src.config.settings.PASSWORD_HASH_WORKERS", 0)
+    mocker.patch.object(password, "pwd_context", _context(4))
+
+
+@pytest.mark.unit
+class TestPassword:
+    def test_rehash_when_cost_changed(self, thread_workers):
+        """해시의 cost 가 설정과 다르면, 검증 후 설정한 cost 로 다시 해싱한 값을 반환"""
+        # given
+        hashed = _context(5).hash("password")
+
+        # when
+        verified, new_hash = asyncio.run(password.verify_password("password", hashed))
+
+        # then
+        assert verified is True
+        assert new_hash.startswith("$2b$04$")
+
+    def test_not_rehash_when_cost_matches(self, thread_workers):
+        """해시의 cost 가 설정과 같으면 다시 해싱하지 않음"""
+        # given
+        hashed = asyncio.run(password.hash_password("password"))
+
+        # when
+        verified, new_hash = asyncio.run(password.verify_password("password", hashed))
+
+        # then
+        assert verified is True
+        assert new_hash is None
+
+    def test_reject_when_pending_exceeds_limit(self, mocker, thread_workers):
+        """대기 중인 작업이 최대치를 넘으면 503"""
+        # given
+        mocker.patch("app.src.config.settings.PASSWORD_HASH_MAX_PENDING", 0)
+
+        # when
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(password.hash_password("password"))
+
+        # then
+        assert e.value.status_code == 503
+
+    def test_run_in_process_pool(self, mocker):
+        """worker 수가 설정되면 별도 process 에서 실행"""
+        # given
+        mocker.patch("app.src.config.settings.PASSWORD_HASH_WORKERS", 1)
+
+        # when
+        try:
+            pid = asyncio.run(password._run(os.getpid))
+        finally:
+            password.shutdown()
+
+        # then
+        assert pid != os.getpid()
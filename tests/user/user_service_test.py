@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.src.common import metrics
+from app.src.user import service as user_service
+from app.src.user.dto.request.user_login_request import UserLoginRequest
+from app.src.user.model import Role, User
+
+
+@pytest.fixture
+def dummy_user():
+    return User(
+        id=1, email="test@test.com", password="hashed", role=Role.USER, token_epoch=0
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_timings():
+    metrics.timings.reset()
+
+
+def _login(email: str = "test@test.com"):
+    request = UserLoginRequest(email=email, password="password")
+    return asyncio.run(user_service.login(MagicMock(spec=Session), request))
+
+
+@pytest.mark.unit
+class TestLogin:
+    def test_rehash_password_when_cost_changed(self, mocker, dummy_user):
+        """비밀번호 해시의 cost 가 변경되었다면, 새 해시로 교체하고 토큰을 발급"""
+        # given
+        mocker.patch(
+            "app.src.user.repository.find_by_email", return_value=dummy_user
+        )
+        mocker.patch(
+            "app.src.user.password.verify_password", return_value=(True, "new-hash")
+        )
+        update_password = mocker.patch("app.src.user.repository.update_password")
+
+        # when
+        token = _login()
+
+        # then
+        assert token.token_type == "bearer"
+        assert update_password.call_args.args[1:] == (dummy_user, "new-hash")
+        assert metrics.timings.get("auth.login", "success")["count"] == 1
+
+    def test_record_failure_latency(self, mocker, dummy_user):
+        """비밀번호가 일치하지 않으면 401, 실패 소요 시간을 집계"""
+        # given
+        mocker.patch(
+            "app.src.user.repository.find_by_email", return_value=dummy_user
+        )
+        mocker.patch(
+            "app.src.user.password.verify_password", return_value=(False, None)
+        )
+
+        # when
+        with pytest.raises(HTTPException) as e:
+            _login()
+
+        # then
+        assert e.value.status_code == 401
+        assert metrics.timings.get("auth.login", "failure")["count"] == 1
+        assert metrics.timings.get("auth.login", "success")["count"] == 0